@@ -0,0 +1,53 @@
+"""add mission_headcount table
+
+Revision ID: 007231abb6d8
+Revises: 22de3f4c1eaa
+Create Date: 2026-10-17 11:20:41.902114+09:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007231abb6d8"
+down_revision: Union[str, Sequence[str], None] = "22de3f4c1eaa"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "mission_headcount",
+        sa.Column("mission_id", sa.Integer(), nullable=False),
+        sa.Column("headcount", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["mission_id"],
+            ["mission.id"],
+        ),
+        sa.PrimaryKeyConstraint("mission_id"),
+    )
+    op.create_index("ix_user_mission_mission_id_status", "user_mission", ["mission_id", "status"], unique=False)
+
+    # 기존 진행 중 미션 인원으로 카운터 초기화
+    op.execute("""
+        INSERT INTO mission_headcount (mission_id, headcount, created_at, updated_at, is_deleted)
+        SELECT mission_id, COUNT(id), UTC_TIMESTAMP(), UTC_TIMESTAMP(), FALSE
+        FROM user_mission
+        WHERE status = 'in_progress'
+        GROUP BY mission_id
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_user_mission_mission_id_status", table_name="user_mission")
+    op.drop_table("mission_headcount")
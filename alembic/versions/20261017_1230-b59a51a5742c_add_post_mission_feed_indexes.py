@@ -0,0 +1,27 @@
+"""add post mission feed indexes
+
+Revision ID: b59a51a5742c
+Revises: 007231abb6d8
+Create Date: 2026-10-17 12:30:12.481530+09:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b59a51a5742c"
+down_revision: Union[str, Sequence[str], None] = "007231abb6d8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_post_mission_id_created_at_id", "post", ["mission_id", "created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_post_mission_id_created_at_id", table_name="post")
@@ -0,0 +1,27 @@
+"""add index to post_image file_key
+
+Revision ID: debad1ef3bf6
+Revises: b59a51a5742c
+Create Date: 2026-10-17 14:10:37.204318+09:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "debad1ef3bf6"
+down_revision: Union[str, Sequence[str], None] = "b59a51a5742c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f("ix_post_image_file_key"), "post_image", ["file_key"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_post_image_file_key"), table_name="post_image")
@@ -0,0 +1,50 @@
+"""add post_like_stats table
+
+Revision ID: e1ccfb30fdf7
+Revises: 8f0fcda8bf50
+Create Date: 2026-10-17 16:50:18.307415+09:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1ccfb30fdf7"
+down_revision: Union[str, Sequence[str], None] = "8f0fcda8bf50"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "post_like_stats",
+        sa.Column("post_id", sa.Integer(), nullable=False),
+        sa.Column("like_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=True),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["post_id"],
+            ["post.id"],
+        ),
+        sa.PrimaryKeyConstraint("post_id"),
+    )
+
+    # 기존 좋아요 수로 카운터 초기화
+    op.execute("""
+        INSERT INTO post_like_stats (post_id, like_count, created_at, updated_at, is_deleted)
+        SELECT post_id, COUNT(id), UTC_TIMESTAMP(), UTC_TIMESTAMP(), FALSE
+        FROM post_like
+        GROUP BY post_id
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("post_like_stats")
@@ -0,0 +1,44 @@
+"""add mission counters to user_challenge
+
+Revision ID: 5c2e7a9d41b3
+Revises: e1ccfb30fdf7
+Create Date: 2026-10-17 18:20:42.518203+09:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e7a9d41b3"
+down_revision: Union[str, Sequence[str], None] = "e1ccfb30fdf7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("user_challenge", sa.Column("mission_count", sa.Integer(), server_default="0", nullable=False))
+    op.add_column(
+        "user_challenge", sa.Column("completed_mission_count", sa.Integer(), server_default="0", nullable=False)
+    )
+
+    # 기존 user_mission으로 카운터 초기화
+    op.execute("""
+        UPDATE user_challenge uc
+        SET uc.mission_count = (
+                SELECT COUNT(um.id) FROM user_mission um WHERE um.user_challenge_id = uc.id
+            ),
+            uc.completed_mission_count = (
+                SELECT COUNT(um.id) FROM user_mission um WHERE um.user_challenge_id = uc.id AND um.status = 'completed'
+            )
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user_challenge", "completed_mission_count")
+    op.drop_column("user_challenge", "mission_count")
@@ -0,0 +1,35 @@
+"""add earned_badge_bits to user_badge_stats
+
+Revision ID: 3b9e6d1f8a24
+Revises: a7d3f0b26c58
+Create Date: 2026-10-17 19:40:27.190358+09:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b9e6d1f8a24"
+down_revision: Union[str, Sequence[str], None] = "a7d3f0b26c58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "user_badge_stats", sa.Column("earned_badge_bits", sa.BigInteger(), server_default="0", nullable=False)
+    )
+
+    # user_badge_stats는 직전 리비전에서 빈 테이블로 만들어지므로 여기서 채울 행이 없다.
+    # stats와 earned_badge_bits는 outbox worker를 켜기 전에 app/data/badge/backfill_badge_stats.py로 채운다
+    # (worker는 없는 stats 행을 첫 완료부터 다시 세므로 backfill 전에 켜면 누적치가 어긋난다)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user_badge_stats", "earned_badge_bits")
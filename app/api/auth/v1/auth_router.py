@@ -1,7 +1,13 @@
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.auth.v1.schema import OAuthRequest, OAuthResponse
+from app.api.auth.v1.schema import (
+    OAuthRequest,
+    OAuthResponse,
+    RefreshTokenRequest,
+    RefreshTokenResponse,
+)
+from app.common.container import provide
 from app.database.dependency import get_db_session
 from app.module.auth.services.jwt_service import JWTService
 from app.module.auth.services.oauth_service import AuthService
@@ -19,17 +25,35 @@ auth_router = APIRouter(prefix="/v1")
 async def sign_up_login(
     request_data: OAuthRequest,
     session: AsyncSession = Depends(get_db_session),
-    auth_service: AuthService = Depends(),
-    jwt_service: JWTService = Depends(),
+    auth_service: AuthService = Depends(provide(AuthService)),
+    jwt_service: JWTService = Depends(provide(JWTService)),
 ) -> OAuthResponse:
-    social_id = await auth_service.verify_kakao_token(request_data.id_token)
+    social_id = await auth_service.verify_kakao_token(request_data.id_token, request_data.nonce)
     user = await auth_service.find_user_by_social_id(session, social_id)
 
     if not user:
         user = await auth_service.create_user_with_social_id(session, social_id)
 
-    access_token = jwt_service.generate_access_token(social_id, user.id)
+    tokens = await jwt_service.issue_tokens(session, social_id, user.id)
 
     return OAuthResponse(
-        access_token=access_token, is_new_user=not bool(user.nickname and user.birth_year and user.gender)
+        access_token=tokens.access_token,
+        refresh_token=tokens.refresh_token,
+        is_new_user=not bool(user.nickname and user.birth_year and user.gender),
     )
+
+
+@auth_router.post(
+    "/refresh",
+    summary="refresh token으로 access token을 재발급합니다.",
+    description="refresh token은 한 번만 사용할 수 있으며, 새 access token과 refresh token을 함께 반환합니다.",
+    response_model=RefreshTokenResponse,
+)
+async def refresh_tokens(
+    request_data: RefreshTokenRequest,
+    session: AsyncSession = Depends(get_db_session),
+    jwt_service: JWTService = Depends(provide(JWTService)),
+) -> RefreshTokenResponse:
+    tokens = await jwt_service.rotate_refresh_token(session, request_data.refresh_token)
+
+    return RefreshTokenResponse(access_token=tokens.access_token, refresh_token=tokens.refresh_token)
@@ -3,8 +3,19 @@ from app.common.schema import CamelBaseModel
 
 class OAuthRequest(CamelBaseModel):
     id_token: str
+    nonce: str | None = None
 
 
 class OAuthResponse(CamelBaseModel):
     access_token: str
+    refresh_token: str
     is_new_user: bool
+
+
+class RefreshTokenRequest(CamelBaseModel):
+    refresh_token: str
+
+
+class RefreshTokenResponse(CamelBaseModel):
+    access_token: str
+    refresh_token: str
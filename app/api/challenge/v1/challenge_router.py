@@ -9,11 +9,11 @@ from app.api.challenge.v1.schema import (
     NewChallengeRequest,
     NewChallengeResponse,
 )
+from app.common.container import provide
 from app.database.dependency import get_db_session
 from app.module.auth.dependency import verify_access_token
 from app.module.auth.schemas import JWTPayload
 from app.module.challenge.challenge_service import ChallengeService
-from app.module.challenge.schema import CurrentChallengeData
 from app.module.challenge.serializers import ChallengeSerializer
 from app.module.post.constants import PAGE_POST_LIMIT
 
@@ -30,34 +30,10 @@ challenge_router = APIRouter(prefix="/v1")
 async def get_user_challenge_summary(
     payload: JWTPayload = Depends(verify_access_token),
     session: AsyncSession = Depends(get_db_session),
-    challenge_service: ChallengeService = Depends(),
+    challenge_service: ChallengeService = Depends(provide(ChallengeService)),
 ) -> ChallengeInfoResponse:
-    current_challenge_data: CurrentChallengeData | None = await challenge_service.get_current_challenge_context(
-        session, payload.user_id
-    )
-
-    current_challenge = None
-    current_mission = None
-    if current_challenge_data:
-        current_challenge = ChallengeSerializer.to_challenge_summary(
-            current_challenge_data.challenge,
-            current_challenge_data.missions,
-            current_challenge_data.challenge_missions,
-            current_challenge_data.user_challenge,
-            current_challenge_data.user_missions,
-        )
-        current_mission = ChallengeSerializer.to_current_mission_summary(
-            current_challenge_data.missions,
-            current_challenge_data.challenge_missions,
-            current_challenge_data.user_missions,
-            current_challenge_data.headcount,
-        )
-
-    completed_challenges = await challenge_service.get_completed_challenges(session, payload.user_id)
-
-    return ChallengeInfoResponse(
-        current_mission=current_mission, current_challenge=current_challenge, completed_challenges=completed_challenges
-    )
+    home_summary = await challenge_service.get_home_summary(session, payload.user_id)
+    return ChallengeSerializer.to_challenge_info_response(home_summary)
 
 
 @challenge_router.get(
@@ -70,7 +46,7 @@ async def get_user_challenge_summary(
 async def get_challenges(
     payload: JWTPayload = Depends(verify_access_token),
     session: AsyncSession = Depends(get_db_session),
-    challenge_service: ChallengeService = Depends(),
+    challenge_service: ChallengeService = Depends(provide(ChallengeService)),
 ) -> ChallengeListResponse:
     challenges = await challenge_service.get_all_challenges(session, payload.user_id)
     return ChallengeListResponse(challenges=challenges)
@@ -87,7 +63,7 @@ async def create_enrollment(
     request_data: NewChallengeRequest,
     payload: JWTPayload = Depends(verify_access_token),
     session: AsyncSession = Depends(get_db_session),
-    challenge_service: ChallengeService = Depends(),
+    challenge_service: ChallengeService = Depends(provide(ChallengeService)),
 ) -> NewChallengeResponse:
     challenge_id = request_data.challenge_id
 
@@ -108,9 +84,9 @@ async def get_mission_info(
     limit: int = PAGE_POST_LIMIT,
     payload: JWTPayload = Depends(verify_access_token),
     session: AsyncSession = Depends(get_db_session),
-    challenge_service: ChallengeService = Depends(),
+    challenge_service: ChallengeService = Depends(provide(ChallengeService)),
 ) -> MissionInfoResponse:
-    return await challenge_service.get_mission_info(session, mission_id, limit)
+    return await challenge_service.get_mission_info(session, mission_id, limit, payload.user_id)
 
 
 @challenge_router.get(
@@ -123,9 +99,9 @@ async def get_mission_info(
 async def get_mission_posts(
     mission_id: int,
     limit: int = PAGE_POST_LIMIT,
-    cursor: int | None = None,
+    cursor: str | None = None,
     payload: JWTPayload = Depends(verify_access_token),
     session: AsyncSession = Depends(get_db_session),
-    challenge_service: ChallengeService = Depends(),
+    challenge_service: ChallengeService = Depends(provide(ChallengeService)),
 ) -> MissionPostsResponse:
-    return await challenge_service.get_mission_posts(session, mission_id, limit, cursor)
+    return await challenge_service.get_mission_posts(session, mission_id, limit, payload.user_id, cursor)
@@ -61,6 +61,8 @@ class MissionPost(CamelBaseModel):
     post_id: int = Field(description="게시물 ID")
     nickname: str = Field(description="닉네임")
     image_url: str | None = Field(description="이미지 URL (Presigned URL)")
+    like_count: int = Field(description="좋아요 수")
+    is_liked: bool = Field(description="조회한 유저의 좋아요 여부")
 
 
 class MissionInfoResponse(CamelBaseModel):
@@ -70,10 +72,10 @@ class MissionInfoResponse(CamelBaseModel):
     type: str = Field(description="미션 타입")
     point: int = Field(description="보상 포인트")
     headcount: int = Field(description="미션 참여 인원")
-    next_cursor: int | None = Field(description="다음 페이지를 위한 커서 (마지막 post_id)")
+    next_cursor: str | None = Field(description="다음 페이지를 위한 커서 (마지막 게시물의 created_at, post_id 토큰)")
     posts: list[MissionPost] = Field(description="미션 관련 게시물 목록 (최신 6개)")
 
 
 class MissionPostsResponse(CamelBaseModel):
     posts: list[MissionPost] = Field(description="미션 관련 게시물 목록")
-    next_cursor: int | None = Field(description="다음 페이지를 위한 커서 (마지막 post_id)")
+    next_cursor: str | None = Field(description="다음 페이지를 위한 커서 (마지막 게시물의 created_at, post_id 토큰)")
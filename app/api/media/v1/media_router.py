@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, status
 
 from app.api.media.v1.schema import S3UrlRequest, S3UrlResponse
+from app.common.container import provide
 from app.module.auth.dependency import verify_access_token
 from app.module.auth.schemas import JWTPayload
 from app.module.media.media_service import MediaService
@@ -18,7 +19,7 @@ media_router = APIRouter(prefix="/v1")
 async def create_presigned_url(
     request_data: S3UrlRequest,
     payload: JWTPayload = Depends(verify_access_token),
-    media_service: MediaService = Depends(),
+    media_service: MediaService = Depends(provide(MediaService)),
 ):
     url_info = media_service.create_presigned_upload_url(
         upload_type=request_data.upload_type,
@@ -2,10 +2,10 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.post.v1.schema import PostInfoResponse, PostLikeResponse, PostRequest, PostResponse
+from app.common.container import provide
 from app.database.dependency import get_db_session
 from app.module.auth.dependency import verify_access_token
 from app.module.auth.schemas import JWTPayload
-from app.module.badge.badge_service import BadgeService
 from app.module.post.post_service import PostService
 
 post_router = APIRouter(prefix="/v1")
@@ -22,8 +22,7 @@ async def add_post(
     request_data: PostRequest,
     payload: JWTPayload = Depends(verify_access_token),
     session: AsyncSession = Depends(get_db_session),
-    post_service: PostService = Depends(),
-    badge_service: BadgeService = Depends(),
+    post_service: PostService = Depends(provide(PostService)),
 ):
     await post_service.add_post(
         user_id=payload.user_id,
@@ -31,8 +30,6 @@ async def add_post(
         session=session,
     )
 
-    await badge_service.initial_badge(session, payload.user_id)
-
     return PostResponse(success=True, status_code=status.HTTP_201_CREATED)
 
 
@@ -47,7 +44,7 @@ async def get_post_info(
     post_id: int,
     payload: JWTPayload = Depends(verify_access_token),
     session: AsyncSession = Depends(get_db_session),
-    post_service: PostService = Depends(),
+    post_service: PostService = Depends(provide(PostService)),
 ) -> PostInfoResponse:
     return await post_service.get_post_info(session, post_id)
 
@@ -63,7 +60,7 @@ async def toggle_post_like(
     post_id: int,
     payload: JWTPayload = Depends(verify_access_token),
     session: AsyncSession = Depends(get_db_session),
-    post_service: PostService = Depends(),
+    post_service: PostService = Depends(provide(PostService)),
 ) -> PostLikeResponse:
     is_liked, like_count = await post_service.toggle_post_like(session, payload.user_id, post_id)
     return PostLikeResponse(is_liked=is_liked, like_count=like_count)
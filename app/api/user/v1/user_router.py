@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.user.v1.schema import ProfileRequest, ProfileResponse
+from app.common.container import provide
 from app.database.dependency import get_db_session
 from app.module.auth.dependency import verify_access_token
 from app.module.auth.schemas import JWTPayload
@@ -20,7 +21,7 @@ user_router = APIRouter(prefix="/v1")
 async def submit_user_profile(
     request_data: ProfileRequest,
     session: AsyncSession = Depends(get_db_session),
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(provide(UserService)),
     payload: JWTPayload = Depends(verify_access_token),
 ):
     await user_service.register_user_profile(
@@ -0,0 +1,61 @@
+import threading
+from contextlib import contextmanager
+from functools import cache
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class ServiceContainer:
+    """stateless 서비스/레포지토리를 프로세스당 한 번만 생성해 재사용하는 컨테이너
+
+    요청마다 Depends()로 서비스 그래프를 새로 만들지 않도록 라우터와 서비스가 여기서 인스턴스를 가져간다.
+    테스트에서는 override()로 원하는 인스턴스를 끼워 넣는다.
+    """
+
+    def __init__(self):
+        self._instances: dict[type, Any] = {}
+        self._overrides: dict[type, Any] = {}
+        # 서비스 생성자가 다시 container.get()을 호출하므로 재진입 가능한 lock 사용
+        self._lock = threading.RLock()
+
+    def get(self, cls: type[T]) -> T:
+        if cls in self._overrides:
+            return self._overrides[cls]
+
+        instance = self._instances.get(cls)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(cls)
+                if instance is None:
+                    instance = cls()
+                    self._instances[cls] = instance
+        return instance
+
+    @contextmanager
+    def override(self, cls: type[T], instance: T) -> Iterator[T]:
+        self._overrides[cls] = instance
+        try:
+            yield instance
+        finally:
+            self._overrides.pop(cls, None)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._instances.clear()
+            self._overrides.clear()
+
+
+container = ServiceContainer()
+
+
+@cache
+def provide(cls: type[T]) -> Callable[[], Awaitable[T]]:
+    """FastAPI Depends용 provider. 클래스마다 같은 함수를 돌려주므로 app.dependency_overrides 키로도 쓸 수 있다."""
+
+    # async 함수로 두어 threadpool을 거치지 않고 이벤트 루프에서 바로 반환
+    async def dependency() -> T:
+        return container.get(cls)
+
+    dependency.__name__ = f"provide_{cls.__name__}"
+    return dependency
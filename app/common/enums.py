@@ -38,3 +38,15 @@ class Timezone(StrEnum):
 
     def get_zone_info(self) -> ZoneInfo:
         return ZoneInfo(self.value)
+
+
+class StartupMode(StrEnum):
+    EAGER = "eager"  # import 시점에 모든 router 등록
+    LAZY = "lazy"  # prefix별로 첫 요청 때 router import (Lambda cold start 단축)
+
+    @classmethod
+    def from_env(cls) -> "StartupMode":
+        mode = getenv("STARTUP_MODE")
+        if mode:
+            return cls(mode)
+        return cls.LAZY if getenv("AWS_LAMBDA_FUNCTION_NAME") else cls.EAGER
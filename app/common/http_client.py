@@ -0,0 +1,137 @@
+import asyncio
+import importlib.util
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+
+HTTP_CONNECT_TIMEOUT_SEC = 3.0
+HTTP_READ_TIMEOUT_SEC = 5.0
+HTTP_POOL_TIMEOUT_SEC = 2.0
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_KEEPALIVE_EXPIRY_SEC = 60.0
+
+
+class HttpLatencyMetrics:
+    """host별 외부 HTTP 호출 횟수, 실패 수, 응답 시간 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts: dict[str, dict[str, Any]] = {}
+
+    def record(self, host: str, elapsed_sec: float, failed: bool = False) -> None:
+        with self._lock:
+            stats = self._hosts.setdefault(host, {"requests": 0, "errors": 0, "total_sec": 0.0, "max_sec": 0.0})
+            stats["requests"] += 1
+            stats["errors"] += int(failed)
+            stats["total_sec"] += elapsed_sec
+            stats["max_sec"] = max(stats["max_sec"], elapsed_sec)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                host: {
+                    "requests": stats["requests"],
+                    "errors": stats["errors"],
+                    "latency_ms_avg": round(stats["total_sec"] / stats["requests"] * 1000, 3),
+                    "latency_ms_max": round(stats["max_sec"] * 1000, 3),
+                }
+                for host, stats in self._hosts.items()
+            }
+
+
+class MeteredTransport:
+    """요청 전송부터 응답 헤더 수신까지의 시간(커넥션 생성 포함)을 HttpLatencyMetrics에 기록
+
+    httpx는 transport를 duck typing으로 다루므로 import 시점에 httpx를 불러오지 않도록 상속하지 않는다.
+    """
+
+    def __init__(self, transport: "httpx.AsyncBaseTransport", metrics: HttpLatencyMetrics):
+        self.transport = transport
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: "httpx.Request") -> "httpx.Response":
+        started = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            self.metrics.record(request.url.host, time.perf_counter() - started, failed=True)
+            raise
+
+        self.metrics.record(request.url.host, time.perf_counter() - started, failed=response.status_code >= 500)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class SharedHttpClient:
+    """프로세스 전체에서 재사용하는 httpx.AsyncClient
+
+    요청마다 AsyncClient를 만들면 매번 TCP/TLS handshake를 다시 하므로, keep-alive 커넥션 풀을 가진
+    클라이언트 하나를 첫 사용 시점에 만들어 둔다. h2 패키지가 설치되어 있으면 HTTP/2를 사용한다.
+    커넥션은 이벤트 루프에 묶이므로 루프가 바뀌면(테스트 등) 새 클라이언트를 만든다.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT_SEC,
+        read_timeout: float = HTTP_READ_TIMEOUT_SEC,
+        pool_timeout: float = HTTP_POOL_TIMEOUT_SEC,
+        max_connections: int = HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY_SEC,
+        http2: bool | None = None,
+        metrics: HttpLatencyMetrics | None = None,
+        transport: "httpx.AsyncBaseTransport | None" = None,
+    ):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool_timeout = pool_timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = importlib.util.find_spec("h2") is not None if http2 is None else http2
+        self.metrics = metrics or HttpLatencyMetrics()
+        self.transport = transport
+        self._client: "httpx.AsyncClient | None" = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> "httpx.AsyncClient":
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = self._create_client()
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client, self._loop = self._client, None, None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+    def _create_client(self) -> "httpx.AsyncClient":
+        import httpx
+
+        transport = self.transport or httpx.AsyncHTTPTransport(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+        timeout = httpx.Timeout(
+            connect=self.connect_timeout, read=self.read_timeout, write=self.read_timeout, pool=self.pool_timeout
+        )
+        metered_transport = MeteredTransport(transport, self.metrics)
+        return httpx.AsyncClient(transport=metered_transport, timeout=timeout)  # type: ignore[arg-type]
+
+
+shared_http_client = SharedHttpClient()
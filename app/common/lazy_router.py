@@ -0,0 +1,55 @@
+import importlib
+from dataclasses import dataclass
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+@dataclass(frozen=True)
+class LazyRouter:
+    prefix: str
+    module: str
+    attribute: str
+    tags: tuple[str, ...]
+
+
+class LazyRouterLoader:
+    """경로 prefix에 처음 요청이 올 때 해당 router 모듈을 import해서 app에 등록"""
+
+    def __init__(self, app: FastAPI, routers: list[LazyRouter]):
+        self.app = app
+        self.routers = routers
+        self._loaded: set[str] = set()
+
+    def load_for_path(self, path: str) -> None:
+        for router in self.routers:
+            if router.prefix not in self._loaded and (path == router.prefix or path.startswith(router.prefix + "/")):
+                self._include(router)
+
+    def load_all(self) -> None:
+        for router in self.routers:
+            if router.prefix not in self._loaded:
+                self._include(router)
+
+    def _include(self, router: LazyRouter) -> None:
+        api_router = getattr(importlib.import_module(router.module), router.attribute)
+        self.app.include_router(api_router, prefix=router.prefix, tags=list(router.tags))
+        self._loaded.add(router.prefix)
+        # 새 경로가 문서에 반영되도록 캐시된 OpenAPI 스키마를 버린다
+        self.app.openapi_schema = None
+
+
+class LazyRouterMiddleware:
+    def __init__(self, app: ASGIApp, loader: LazyRouterLoader, docs_paths: tuple[str, ...] = ()):
+        self.app = app
+        self.loader = loader
+        self.docs_paths = docs_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            if scope["path"] in self.docs_paths:
+                self.loader.load_all()
+            else:
+                self.loader.load_for_path(scope["path"])
+
+        await self.app(scope, receive, send)
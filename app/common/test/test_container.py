@@ -0,0 +1,95 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.common.container import ServiceContainer, container, provide
+
+
+class StatelessService:
+    created = 0
+
+    def __init__(self):
+        StatelessService.created += 1
+
+    def name(self) -> str:
+        return "real"
+
+
+class DependentService:
+    def __init__(self):
+        self.stateless_service = container.get(StatelessService)
+
+
+@pytest.fixture(autouse=True)
+def reset_container():
+    container.reset()
+    StatelessService.created = 0
+    yield
+    container.reset()
+
+
+class TestServiceContainer:
+    def test_builds_instance_once(self):
+        # given
+        service_container = ServiceContainer()
+
+        # when
+        first = service_container.get(StatelessService)
+        second = service_container.get(StatelessService)
+
+        # then
+        assert first is second
+        assert StatelessService.created == 1
+
+    def test_nested_services_share_instances(self):
+        # when
+        dependent = container.get(DependentService)
+
+        # then
+        assert dependent.stateless_service is container.get(StatelessService)
+        assert StatelessService.created == 1
+
+    def test_override_replaces_instance_temporarily(self):
+        # given
+        fake = Mock(spec=StatelessService)
+
+        # when
+        with container.override(StatelessService, fake):
+            overridden = container.get(StatelessService)
+
+        # then
+        assert overridden is fake
+        assert container.get(StatelessService) is not fake
+
+
+class TestProvide:
+    def test_provider_is_stable_per_class(self):
+        # when & then
+        assert provide(StatelessService) is provide(StatelessService)
+
+    def test_endpoint_reuses_instance_and_supports_dependency_overrides(self):
+        # given
+        app = FastAPI()
+        instances = []
+
+        @app.get("/name")
+        async def get_name(service: StatelessService = Depends(provide(StatelessService))):
+            instances.append(service)
+            return {"name": service.name()}
+
+        client = TestClient(app)
+
+        # when
+        client.get("/name")
+        client.get("/name")
+        fake = Mock(spec=StatelessService)
+        fake.name.return_value = "fake"
+        app.dependency_overrides[provide(StatelessService)] = lambda: fake
+        overridden = client.get("/name").json()
+
+        # then
+        assert instances[0] is instances[1]
+        assert StatelessService.created == 1
+        assert overridden == {"name": "fake"}
@@ -0,0 +1,73 @@
+import sys
+from types import ModuleType
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.common.lazy_router import LazyRouter, LazyRouterLoader, LazyRouterMiddleware
+
+FAKE_ROUTER_MODULE = "app.common.test.fake_router_module"
+
+
+@pytest.fixture
+def fake_router_module():
+    router = APIRouter()
+
+    @router.get("/ping")
+    def ping():
+        return {"pong": True}
+
+    module = ModuleType(FAKE_ROUTER_MODULE)
+    module.fake_router = router  # type: ignore[attr-defined]
+    sys.modules[FAKE_ROUTER_MODULE] = module
+    yield module
+    sys.modules.pop(FAKE_ROUTER_MODULE, None)
+
+
+@pytest.fixture
+def lazy_app(fake_router_module):
+    app = FastAPI()
+    loader = LazyRouterLoader(app, [LazyRouter("/api/fake", FAKE_ROUTER_MODULE, "fake_router", ("fake",))])
+    app.add_middleware(LazyRouterMiddleware, loader=loader, docs_paths=("/openapi.json",))
+    return app
+
+
+def route_paths(app: FastAPI) -> set[str]:
+    return set(app.openapi()["paths"])
+
+
+class TestLazyRouter:
+    def test_router_loaded_on_first_request_to_prefix(self, lazy_app):
+        # given
+        client = TestClient(lazy_app)
+        assert "/api/fake/ping" not in route_paths(lazy_app)
+
+        # when
+        response = client.get("/api/fake/ping")
+
+        # then
+        assert response.status_code == 200
+        assert response.json() == {"pong": True}
+        assert "/api/fake/ping" in route_paths(lazy_app)
+
+    def test_other_prefix_does_not_load_router(self, lazy_app):
+        # given
+        client = TestClient(lazy_app)
+
+        # when
+        response = client.get("/api/fakeother/ping")
+
+        # then
+        assert response.status_code == 404
+        assert "/api/fake/ping" not in route_paths(lazy_app)
+
+    def test_docs_path_loads_all_routers(self, lazy_app):
+        # given
+        client = TestClient(lazy_app)
+
+        # when
+        response = client.get("/openapi.json")
+
+        # then
+        assert "/api/fake/ping" in response.json()["paths"]
@@ -0,0 +1,11 @@
+import os
+
+
+def load_local_dotenv() -> None:
+    """로컬 실행에서만 .env를 읽는다. Lambda는 환경변수가 주입되어 있으므로 dotenv import도 하지 않는다."""
+    if os.getenv("AWS_LAMBDA_FUNCTION_NAME"):
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
@@ -0,0 +1,85 @@
+import asyncio
+import os
+import sys
+from dataclasses import replace
+from datetime import datetime
+
+from sqlalchemy import select
+
+from app.common.utils.time import to_kst
+from app.database.config import get_async_session_maker
+from app.model.user_challenge import UserChallenge, UserMission
+from app.module.badge.badge_repository import BadgeRepository, UserBadgeStatsRepository
+from app.module.badge.catalog import BadgeCatalogCache
+from app.module.badge.constants import BADGE_BACKFILL_BATCH_USERS
+from app.module.badge.rules import replay_completions
+from app.module.challenge.enums import MissionStatusType
+
+
+async def backfill_badge_stats():
+    """완료된 user_mission 이력을 유저별로 다시 재생해 user_badge_stats를 채우고 빠진 배지를 부여
+
+    stats는 이력으로부터 다시 계산해 덮어쓰고 배지는 INSERT IGNORE로 부여하므로 여러 번 실행해도 된다.
+    쓰기 전에 stats 행을 FOR UPDATE로 잠그고, 읽기 시점 이후 worker가 이미 더 진행시킨 행은 덮어쓰지 않는다.
+    """
+    badge_repository = BadgeRepository()
+    stats_repository = UserBadgeStatsRepository()
+    session_maker = get_async_session_maker()
+
+    stmt = (
+        select(UserChallenge.user_id, UserMission.completed_at)  # type: ignore
+        .join(UserChallenge, UserChallenge.id == UserMission.user_challenge_id)  # type: ignore
+        .where(
+            UserMission.status == MissionStatusType.COMPLETED,  # type: ignore
+            UserMission.completed_at.is_not(None),  # type: ignore
+        )
+        .order_by(UserChallenge.user_id, UserMission.completed_at)  # type: ignore
+    )
+
+    # 스트리밍 중인 커넥션에는 쓸 수 없으므로 읽기와 쓰기 세션을 나눈다
+    async with session_maker() as read_session, session_maker() as write_session:
+        catalog = await BadgeCatalogCache().get(read_session)
+
+        async def apply(user_id: int, completed_ats: list[datetime]) -> None:
+            progress, earned = replay_completions([to_kst(completed_at) for completed_at in completed_ats])
+            # seed 되지 않은 배지는 비트에서도 빼 두어야 이후 완료에서 다시 평가된다
+            seeded = catalog.seeded(sorted(earned))
+            progress = replace(progress, earned_badge_bits=0).with_badges(seeded)
+            # 스트리밍 스냅샷 이후의 완료를 worker가 이미 반영했다면 그 행을 유지하고 배지 비트만 합친다
+            current = await stats_repository.get_progress(write_session, user_id)
+            if current.total_completions > progress.total_completions:
+                progress = current.with_badges(seeded)
+            await stats_repository.save_progress(write_session, user_id, progress)
+            await badge_repository.grant_badges(write_session, user_id, catalog.get_ids(seeded))
+
+        current_user_id = None
+        completed_ats: list[datetime] = []
+        users = 0
+
+        result = await read_session.stream(stmt.execution_options(yield_per=1000))
+        async for user_id, completed_at in result:
+            if user_id != current_user_id and current_user_id is not None:
+                await apply(current_user_id, completed_ats)
+                completed_ats = []
+                users += 1
+                if users % BADGE_BACKFILL_BATCH_USERS == 0:
+                    await write_session.commit()
+                    print(f"{users}명 반영")
+
+            current_user_id = user_id
+            completed_ats.append(completed_at)
+
+        if current_user_id is not None:
+            await apply(current_user_id, completed_ats)
+            users += 1
+
+        await write_session.commit()
+        print(f"완료: {users}명")
+
+
+if __name__ == "__main__":
+    if not os.getenv("ENVIRONMENT"):
+        print("⚠️  ENVIRONMENT 환경변수를 설정해주세요 (dev/prod)")
+        sys.exit(1)
+
+    asyncio.run(backfill_badge_stats())
@@ -7,6 +7,8 @@ from sqlalchemy import select
 from app.data.badge.constants import BADGES_DATA
 from app.database.config import get_async_session_maker
 from app.model.badge import Badge
+from app.module.catalog.catalog_repository import CatalogVersionRepository
+from app.module.catalog.enums import CatalogType
 
 
 async def seed_badges():
@@ -26,6 +28,8 @@ async def seed_badges():
             )
             session.add(badge)
 
+        # 웜 컨테이너의 배지 카탈로그 캐시가 다시 로드되도록 버전 증가
+        await CatalogVersionRepository().bump_version(session, CatalogType.BADGE)
         await session.commit()
 
 
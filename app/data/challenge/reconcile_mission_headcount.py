@@ -0,0 +1,59 @@
+import asyncio
+import os
+import sys
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.challenge.challenge_repository import MissionRepository
+
+
+async def reconcile_mission_headcounts(session: AsyncSession, dry_run: bool = False) -> dict[int, tuple[int, int]]:
+    """user_mission 기준으로 mission_headcount를 다시 계산하고 어긋난 미션을 보정
+
+    반환값: {mission_id: (저장된 값, 실제 값)}
+    """
+    mission_repository = MissionRepository()
+
+    actual_counts = await mission_repository.count_participants_by_mission(session)
+    stored_counts = await mission_repository.get_all_headcounts(session)
+
+    drifted: dict[int, tuple[int, int]] = {}
+    for mission_id in actual_counts.keys() | stored_counts.keys():
+        stored = stored_counts.get(mission_id, 0)
+        actual = actual_counts.get(mission_id, 0)
+        if stored != actual:
+            drifted[mission_id] = (stored, actual)
+
+    if not dry_run:
+        for mission_id, (_, actual) in drifted.items():
+            await mission_repository.set_headcount(session, mission_id, actual)
+        await session.commit()
+
+    return drifted
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="미션 참여 인원 카운터 보정")
+    parser.add_argument("--dry-run", action="store_true", help="보정 없이 어긋난 미션만 출력")
+    args = parser.parse_args()
+
+    # ENVIRONMENT 확인 이후에 DB 설정을 로드
+    from app.database.config import get_async_session_maker
+
+    session_maker = get_async_session_maker()
+    async with session_maker() as session:
+        drifted = await reconcile_mission_headcounts(session, dry_run=args.dry_run)
+
+    for mission_id, (stored, actual) in sorted(drifted.items()):
+        print(f"미션 {mission_id}: {stored} -> {actual}")
+    print(f"\n✅ 보정 대상 미션: {len(drifted)}개")
+
+
+if __name__ == "__main__":
+    if not os.getenv("ENVIRONMENT"):
+        print("⚠️  ENVIRONMENT 환경변수를 설정해주세요 (dev/prod)")
+        sys.exit(1)
+
+    asyncio.run(main())
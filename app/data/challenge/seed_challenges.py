@@ -8,6 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
 from app.data.challenge.constants import CHALLENGES_DATA  # noqa: E402
 from app.database.config import get_async_session_maker  # noqa: E402
 from app.model.challenge import Challenge, ChallengeMission, Mission  # noqa: E402
+from app.module.catalog.catalog_repository import CatalogVersionRepository  # noqa: E402
+from app.module.catalog.enums import CatalogType  # noqa: E402
 
 
 class ChallengeSeedRunner:
@@ -42,6 +44,8 @@ class ChallengeSeedRunner:
             await self._create_challenge_with_missions(challenge_data)
 
         if not self.dry_run:
+            # 웜 컨테이너의 챌린지 카탈로그 캐시가 다시 로드되도록 버전 증가
+            await CatalogVersionRepository().bump_version(self.session, CatalogType.CHALLENGE)
             await self.session.commit()
             print("\n✅ 데이터베이스 커밋 완료")
 
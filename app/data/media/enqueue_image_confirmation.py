@@ -0,0 +1,49 @@
+import asyncio
+import os
+import sys
+
+from sqlalchemy import select
+
+from app.database.config import get_async_session_maker
+from app.model.post import PostImage
+from app.module.media.constants import IMAGE_CONFIRM_BACKFILL_BATCH_SIZE
+from app.module.outbox import events
+from app.module.outbox.outbox_repository import OutboxRepository
+
+
+async def enqueue_image_confirmation():
+    """confirmed 태그 없이 저장된 기존 post_image들을 outbox에 적재해 worker가 배치로 태그하게 한다
+
+    idempotency_key가 게시물 작성 시와 같으므로 이미 적재된 이미지는 건너뛰고, 여러 번 실행해도 된다.
+    """
+    outbox_repository = OutboxRepository()
+    session_maker = get_async_session_maker()
+
+    stmt = (
+        select(PostImage.post_id, PostImage.file_key)  # type: ignore
+        .where(PostImage.is_deleted.is_(False))  # type: ignore
+        .order_by(PostImage.id)
+    )
+
+    # 스트리밍 중인 커넥션에는 쓸 수 없으므로 읽기와 쓰기 세션을 나눈다
+    async with session_maker() as read_session, session_maker() as write_session:
+        scanned = 0
+        enqueued = 0
+
+        result = await read_session.stream(stmt.execution_options(yield_per=IMAGE_CONFIRM_BACKFILL_BATCH_SIZE))
+        async for partition in result.partitions():
+            messages = [events.image_confirmation(post_id, file_key) for post_id, file_key in partition]
+            enqueued += await outbox_repository.enqueue(write_session, messages)
+            await write_session.commit()
+            scanned += len(messages)
+            print(f"{scanned}개 확인, {enqueued}개 적재")
+
+        print(f"완료: {scanned}개 중 {enqueued}개 적재")
+
+
+if __name__ == "__main__":
+    if not os.getenv("ENVIRONMENT"):
+        print("⚠️  ENVIRONMENT 환경변수를 설정해주세요 (dev/prod)")
+        sys.exit(1)
+
+    asyncio.run(enqueue_image_confirmation())
@@ -1,18 +1,21 @@
 from os import getenv
 
-from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
 from app.common.enums import EnvironmentType
-from app.database.constant import MAX_OVERFLOW, POOL_RECYCLE, POOL_SIZE
+from app.common.utils.env import load_local_dotenv
+from app.database.engine_profile import create_engine_for_profile
+from app.database.enums import EngineProfile
+from app.database.pool_metrics import pool_metrics
 
-load_dotenv()
+load_local_dotenv()
 
 ENVIRONMENT = getenv("ENVIRONMENT", None)
 if not ENVIRONMENT:
     raise ValueError("ENVIRONMENT 환경변수가 설정되지 않았습니다.")
 
 env = EnvironmentType(ENVIRONMENT)
+engine_profile = EngineProfile(getenv("DB_ENGINE_PROFILE", EngineProfile.LAMBDA))
 
 engine: AsyncEngine | None = None
 async_session_maker: async_sessionmaker | None = None
@@ -21,16 +24,7 @@ async_session_maker: async_sessionmaker | None = None
 def get_database_engine() -> AsyncEngine:
     global engine
     if engine is None:
-        database_url = env.db_url
-
-        engine = create_async_engine(
-            database_url,
-            pool_size=POOL_SIZE,
-            max_overflow=MAX_OVERFLOW,
-            pool_pre_ping=True,
-            pool_recycle=POOL_RECYCLE,
-            echo=False,
-        )
+        engine = create_engine_for_profile(env.db_url, engine_profile, pool_metrics)
     return engine
 
 
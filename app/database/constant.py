@@ -1,3 +1,11 @@
+# lambda 프로필: invocation은 한 번에 하나뿐이므로 커넥션 1개를 warm 컨테이너 동안 재사용
 POOL_SIZE = 1
 MAX_OVERFLOW = 0
+# MySQL wait_timeout(기본 8시간)보다 짧게 재연결해 pre-ping 없이도 끊긴 커넥션을 피한다
 POOL_RECYCLE = 3600
+
+# container 프로필: 한 프로세스에서 동시 요청을 처리
+CONTAINER_POOL_SIZE = 10
+CONTAINER_MAX_OVERFLOW = 10
+CONTAINER_POOL_TIMEOUT = 10
+CONTAINER_POOL_RECYCLE = 1800
@@ -0,0 +1,56 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.database.constant import (
+    CONTAINER_MAX_OVERFLOW,
+    CONTAINER_POOL_RECYCLE,
+    CONTAINER_POOL_SIZE,
+    CONTAINER_POOL_TIMEOUT,
+    MAX_OVERFLOW,
+    POOL_RECYCLE,
+    POOL_SIZE,
+)
+from app.database.enums import EngineProfile
+from app.database.pool_metrics import (
+    MeteredAsyncAdaptedQueuePool,
+    MeteredNullPool,
+    PoolMetrics,
+    attach_pool_metrics,
+)
+
+
+def get_engine_options(profile: EngineProfile) -> dict[str, Any]:
+    if profile == EngineProfile.LAMBDA:
+        # pre-ping 왕복 대신 pool_recycle로 오래된 커넥션을 교체
+        return {
+            "poolclass": MeteredAsyncAdaptedQueuePool,
+            "pool_size": POOL_SIZE,
+            "max_overflow": MAX_OVERFLOW,
+            "pool_recycle": POOL_RECYCLE,
+            "pool_pre_ping": False,
+        }
+
+    if profile == EngineProfile.CONTAINER:
+        # LIFO로 최근 쓴 커넥션을 우선 재사용해 남는 커넥션이 recycle 되도록 둔다
+        return {
+            "poolclass": MeteredAsyncAdaptedQueuePool,
+            "pool_size": CONTAINER_POOL_SIZE,
+            "max_overflow": CONTAINER_MAX_OVERFLOW,
+            "pool_timeout": CONTAINER_POOL_TIMEOUT,
+            "pool_recycle": CONTAINER_POOL_RECYCLE,
+            "pool_use_lifo": True,
+            "pool_pre_ping": False,
+        }
+
+    # RDS Proxy가 커넥션을 멀티플렉싱하므로 앱은 요청마다 빌리고 바로 반납
+    return {"poolclass": MeteredNullPool, "pool_pre_ping": False}
+
+
+def create_engine_for_profile(
+    database_url: str, profile: EngineProfile, metrics: PoolMetrics | None = None
+) -> AsyncEngine:
+    engine = create_async_engine(database_url, echo=False, **get_engine_options(profile))
+    if metrics is not None:
+        attach_pool_metrics(engine.sync_engine.pool, metrics)
+    return engine
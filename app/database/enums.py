@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class EngineProfile(StrEnum):
+    LAMBDA = "lambda"  # 요청마다 컨테이너 하나가 요청 하나만 처리: 커넥션 1개 재사용, pre-ping 없음
+    CONTAINER = "container"  # uvicorn 프로세스에서 동시 요청 처리: QueuePool
+    RDS_PROXY = "rds_proxy"  # 풀링은 RDS Proxy가 담당: 앱에서는 커넥션을 보관하지 않음
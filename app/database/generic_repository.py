@@ -19,6 +19,20 @@ class GenericRepository:
         await session.flush()
         return instance
 
+    async def bulk_create(self, session: AsyncSession, rows: List[dict[str, Any]]) -> List[int]:
+        """여러 레코드를 multi-row INSERT 한 번으로 생성하고 생성된 id 목록 반환
+
+        MySQL은 RETURNING을 지원하지 않으므로 LAST_INSERT_ID()(첫 번째 행의 id)부터 연속된 id로 계산한다.
+        InnoDB는 단일 multi-row INSERT에 연속된 AUTO_INCREMENT 값을 할당한다 (auto_increment_increment=1 기준).
+        """
+        if not rows:
+            return []
+
+        stmt = insert(self.model).values(rows)
+        result = await session.execute(stmt)
+        first_id = result.lastrowid  # type: ignore
+        return list(range(first_id, first_id + len(rows)))
+
     async def get_by_id(self, session: AsyncSession, id: Any) -> T | None:
         return await session.get(self.model, id)  # type: ignore
 
@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, Pool
+
+
+class PoolMetrics:
+    """커넥션 checkout 횟수, 대기 시간, overflow 사용량 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_sec_total = 0.0
+            self.wait_sec_max = 0.0
+            self.overflow_max = 0
+
+    def record_checkout(self, wait_sec: float, overflow: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_sec_total += wait_sec
+            self.wait_sec_max = max(self.wait_sec_max, wait_sec)
+            self.overflow_max = max(self.overflow_max, overflow)
+
+    def record_timeout(self, wait_sec: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.wait_sec_total += wait_sec
+            self.wait_sec_max = max(self.wait_sec_max, wait_sec)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_avg": round(self.wait_sec_total / attempts * 1000, 3) if attempts else 0.0,
+                "wait_ms_max": round(self.wait_sec_max * 1000, 3),
+                "overflow_max": self.overflow_max,
+            }
+
+
+class MeteredPoolMixin:
+    """Pool.connect()를 감싸 checkout 대기 시간(새 커넥션 생성 포함)을 PoolMetrics에 기록"""
+
+    metrics: PoolMetrics | None = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            if self.metrics:
+                self.metrics.record_timeout(time.perf_counter() - started)
+            raise
+
+        if self.metrics:
+            overflow = self.overflow() if hasattr(self, "overflow") else 0
+            self.metrics.record_checkout(time.perf_counter() - started, max(overflow, 0))
+        return connection
+
+    def recreate(self):
+        # engine.dispose() 등으로 풀이 다시 만들어져도 같은 metrics를 유지
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics = self.metrics
+        return pool
+
+
+class MeteredAsyncAdaptedQueuePool(MeteredPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class MeteredNullPool(MeteredPoolMixin, NullPool):
+    pass
+
+
+def attach_pool_metrics(pool: Pool, metrics: PoolMetrics) -> None:
+    if isinstance(pool, MeteredPoolMixin):
+        pool.metrics = metrics
+
+
+pool_metrics = PoolMetrics()
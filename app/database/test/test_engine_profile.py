@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import QueuePool
+
+from app.database.engine_profile import get_engine_options
+from app.database.enums import EngineProfile
+from app.database.pool_metrics import (
+    MeteredAsyncAdaptedQueuePool,
+    MeteredNullPool,
+    MeteredPoolMixin,
+    PoolMetrics,
+    attach_pool_metrics,
+)
+
+
+class MeteredQueuePool(MeteredPoolMixin, QueuePool):
+    pass
+
+
+@pytest.fixture
+def metrics():
+    return PoolMetrics()
+
+
+class TestEngineProfile:
+    def test_lambda_profile_reuses_single_connection_without_pre_ping(self):
+        # when
+        options = get_engine_options(EngineProfile.LAMBDA)
+
+        # then
+        assert options["poolclass"] is MeteredAsyncAdaptedQueuePool
+        assert options["pool_size"] == 1
+        assert options["max_overflow"] == 0
+        assert options["pool_pre_ping"] is False
+
+    def test_container_profile_uses_queue_pool(self):
+        # when
+        options = get_engine_options(EngineProfile.CONTAINER)
+
+        # then
+        assert options["poolclass"] is MeteredAsyncAdaptedQueuePool
+        assert options["pool_size"] > 1
+        assert options["pool_pre_ping"] is False
+
+    def test_rds_proxy_profile_does_not_hold_connections(self):
+        # when
+        options = get_engine_options(EngineProfile.RDS_PROXY)
+
+        # then
+        assert options["poolclass"] is MeteredNullPool
+
+
+class TestPoolMetrics:
+    def test_records_checkouts_and_overflow(self, metrics):
+        # given
+        engine = create_engine("sqlite://", poolclass=MeteredQueuePool, pool_size=1, max_overflow=1)
+        attach_pool_metrics(engine.pool, metrics)
+
+        # when
+        first = engine.connect()
+        second = engine.connect()
+        first.close()
+        second.close()
+
+        # then
+        snapshot = metrics.snapshot()
+        assert snapshot["checkouts"] == 2
+        assert snapshot["overflow_max"] == 1
+        assert snapshot["timeouts"] == 0
+
+    def test_records_timeouts(self, metrics):
+        # given
+        engine = create_engine("sqlite://", poolclass=MeteredQueuePool, pool_size=1, max_overflow=0, pool_timeout=0.01)
+        attach_pool_metrics(engine.pool, metrics)
+        held = engine.connect()
+
+        # when
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+        held.close()
+
+        # then
+        assert metrics.snapshot()["timeouts"] == 1
+
+    def test_metrics_survive_dispose(self, metrics):
+        # given
+        engine = create_engine("sqlite://", poolclass=MeteredQueuePool)
+        attach_pool_metrics(engine.pool, metrics)
+
+        # when
+        engine.dispose()
+        engine.connect().close()
+
+        # then
+        assert metrics.snapshot()["checkouts"] == 1
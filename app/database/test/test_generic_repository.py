@@ -210,6 +210,39 @@ class TestGenericRepository:
         mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_bulk_create_single_statement(self, user_consent_repository, mock_session):
+        """bulk_create가 INSERT 한 번으로 여러 행을 만들고 연속된 id를 반환하는지 테스트"""
+        # Given
+        rows = [
+            {"user_id": 1, "event": "marketing", "agree": True},
+            {"user_id": 1, "event": "personal_info", "agree": True},
+            {"user_id": 1, "event": "term_of_use", "agree": True},
+        ]
+        mock_result = MagicMock()
+        mock_result.lastrowid = 10
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        # When
+        result = await user_consent_repository.bulk_create(mock_session, rows)
+
+        # Then
+        assert result == [10, 11, 12]
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_empty_rows(self, user_consent_repository, mock_session):
+        """bulk_create에 빈 목록을 넘기면 쿼리를 실행하지 않는지 테스트"""
+        # Given
+        mock_session.execute = AsyncMock()
+
+        # When
+        result = await user_consent_repository.bulk_create(mock_session, [])
+
+        # Then
+        assert result == []
+        mock_session.execute.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_find_one_success(self, user_consent_repository, mock_session, sample_consent_instance):
         """find_one 메서드 정상 동작 테스트"""
@@ -1,6 +1,9 @@
-from app.model.badge import Badge, UserBadge
-from app.model.challenge import Challenge, Mission
-from app.model.post import Post, PostImage
+from app.model.badge import Badge, UserBadge, UserBadgeStats
+from app.model.catalog import CatalogVersion
+from app.model.challenge import Challenge, Mission, MissionHeadcount
+from app.model.outbox import OutboxEvent
+from app.model.post import Post, PostImage, PostLike, PostLikeStats
+from app.model.refresh_token import RefreshToken
 from app.model.user import User, UserConsent
 from app.model.user_challenge import UserChallenge, UserMission
 
@@ -9,10 +12,17 @@ __all__ = [
     "UserConsent",
     "Post",
     "PostImage",
+    "PostLike",
+    "PostLikeStats",
     "Challenge",
     "Mission",
+    "MissionHeadcount",
     "UserChallenge",
     "UserMission",
     "Badge",
     "UserBadge",
+    "UserBadgeStats",
+    "CatalogVersion",
+    "OutboxEvent",
+    "RefreshToken",
 ]
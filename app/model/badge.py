@@ -1,5 +1,7 @@
+from datetime import date
 from typing import TYPE_CHECKING
 
+from sqlalchemy import BigInteger
 from sqlmodel import Field, Relationship, UniqueConstraint
 
 from app.common.mixin.timestamp import TimestampMixin
@@ -35,3 +37,15 @@ class UserBadge(TimestampMixin, table=True):  # type: ignore
 
     user: "User" = Relationship(back_populates="user_badges")
     badge: Badge = Relationship(back_populates="user_badges")
+
+
+class UserBadgeStats(TimestampMixin, table=True):  # type: ignore
+    __tablename__: str = "user_badge_stats"
+
+    user_id: int = Field(foreign_key="user.id", primary_key=True)
+    current_streak: int = Field(default=0, nullable=False, description="연속으로 미션을 완료한 일수")
+    last_completed_date: date | None = Field(default=None, nullable=True, description="마지막 미션 완료 날짜 (KST)")
+    total_completions: int = Field(default=0, nullable=False, description="누적 미션 완료 수")
+    earned_badge_bits: int = Field(
+        default=0, sa_type=BigInteger, nullable=False, description="보유 배지 비트셋 (BADGE_BIT_POSITIONS 기준)"
+    )
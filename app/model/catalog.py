@@ -0,0 +1,11 @@
+from sqlmodel import Field
+
+from app.common.mixin.timestamp import TimestampMixin
+
+
+class CatalogVersion(TimestampMixin, table=True):  # type: ignore
+    __tablename__: str = "catalog_version"
+
+    id: int = Field(default=None, primary_key=True)
+    name: str = Field(nullable=False, unique=True, max_length=50, description="카탈로그 이름")
+    version: int = Field(default=1, nullable=False, description="seed 실행 시 증가하는 카탈로그 버전")
@@ -45,3 +45,10 @@ class Mission(TimestampMixin, table=True):  # type: ignore
             "order_by": "ChallengeMission.step",
         },
     )
+
+
+class MissionHeadcount(TimestampMixin, table=True):  # type: ignore
+    __tablename__: str = "mission_headcount"
+
+    mission_id: int = Field(foreign_key="mission.id", primary_key=True)
+    headcount: int = Field(default=0, nullable=False, description="미션을 진행 중인 유저 수")
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON
+from sqlmodel import Field, Index
+
+from app.common.mixin.timestamp import TimestampMixin
+from app.common.utils.time import utc_now
+from app.module.outbox.enums import OutboxEventStatus
+
+
+class OutboxEvent(TimestampMixin, table=True):  # type: ignore
+    __tablename__: str = "outbox_event"
+    __table_args__ = (Index("ix_outbox_event_status_available_at_id", "status", "available_at", "id"),)
+
+    id: int = Field(default=None, primary_key=True)
+    event_type: str = Field(nullable=False, max_length=50, description="이벤트 종류 (OutboxEventType)")
+    idempotency_key: str = Field(
+        nullable=False, unique=True, max_length=191, description="같은 부수 효과를 한 번만 적재하기 위한 키"
+    )
+    payload: dict[str, Any] = Field(default_factory=dict, sa_type=JSON, nullable=False)
+    status: str = Field(default=OutboxEventStatus.PENDING, nullable=False, max_length=20, description="처리 상태")
+    attempts: int = Field(default=0, nullable=False, description="worker가 가져간 횟수")
+    available_at: datetime = Field(
+        default_factory=utc_now, nullable=False, description="이 시각 이후에 worker가 가져갈 수 있음 (UTC)"
+    )
+    processed_at: datetime | None = Field(default=None, nullable=True, description="처리 완료 시각 (UTC)")
+    last_error: str | None = Field(default=None, nullable=True, max_length=500, description="마지막 실패 사유")
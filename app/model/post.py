@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
-from sqlmodel import Field, Relationship, UniqueConstraint
+from sqlmodel import Field, Index, Relationship, UniqueConstraint
 
 from app.common.mixin.timestamp import TimestampMixin
 from app.module.media.enums import UploadType
@@ -11,7 +11,10 @@ if TYPE_CHECKING:
 
 class Post(TimestampMixin, table=True):  # type: ignore
     __tablename__: str = "post"
-    __table_args__ = (UniqueConstraint("user_id", "mission_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "mission_id"),
+        Index("ix_post_mission_id_created_at_id", "mission_id", "created_at", "id"),
+    )
 
     id: int = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id", nullable=False)
@@ -40,7 +43,7 @@ class PostImage(TimestampMixin, table=True):  # type: ignore
 
     id: int = Field(default=None, primary_key=True)
     post_id: int = Field(foreign_key="post.id", nullable=False)
-    file_key: str = Field(nullable=False)
+    file_key: str = Field(nullable=False, index=True)
     upload_type: UploadType = Field(nullable=False)
 
     post: Post = Relationship(back_populates="image")
@@ -56,3 +59,10 @@ class PostLike(TimestampMixin, table=True):  # type: ignore
 
     user: "User" = Relationship()
     post: "Post" = Relationship(back_populates="likes")
+
+
+class PostLikeStats(TimestampMixin, table=True):  # type: ignore
+    __tablename__: str = "post_like_stats"
+
+    post_id: int = Field(foreign_key="post.id", primary_key=True)
+    like_count: int = Field(default=0, nullable=False, description="게시물 좋아요 수")
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlmodel import Field
+
+from app.common.mixin.timestamp import TimestampMixin
+
+
+class RefreshToken(TimestampMixin, table=True):  # type: ignore
+    __tablename__: str = "refresh_token"
+
+    id: int = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="user.id", nullable=False, index=True)
+    family_id: str = Field(nullable=False, max_length=32, index=True, description="rotation으로 이어지는 토큰 묶음 ID")
+    token_hash: str = Field(nullable=False, unique=True, max_length=64, description="refresh token의 sha256 hex")
+    access_jti: str = Field(nullable=False, max_length=32, index=True, description="함께 발급한 access token의 jti")
+    access_expires_at: datetime = Field(nullable=False, index=True, description="함께 발급한 access token 만료 시각")
+    expires_at: datetime = Field(nullable=False)
+    used_at: datetime | None = Field(default=None, nullable=True, description="rotation으로 사용된 시각")
+    revoked_at: datetime | None = Field(default=None, nullable=True, description="재사용 감지 등으로 폐기된 시각")
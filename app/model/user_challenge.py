@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlmodel import Field, Relationship, UniqueConstraint
+from sqlmodel import Field, Index, Relationship, UniqueConstraint
 
 from app.common.mixin.timestamp import TimestampMixin
 from app.module.challenge.enums import ChallengeStatusType, MissionStatusType
@@ -15,6 +15,8 @@ class UserChallenge(TimestampMixin, table=True):  # type: ignore
     challenge_id: int = Field(foreign_key="challenge.id", nullable=False)
     status: str = Field(default=ChallengeStatusType.NOT_STARTED, nullable=False, description="챌린지 상태")
     mission_step: int = Field(default=1, nullable=False, description="현재 진행 중인 미션 순서")
+    mission_count: int = Field(default=0, nullable=False, description="챌린지의 전체 미션 수")
+    completed_mission_count: int = Field(default=0, nullable=False, description="완료한 미션 수")
 
     missions: list["UserMission"] = Relationship(
         back_populates="user_challenge",
@@ -27,7 +29,10 @@ class UserChallenge(TimestampMixin, table=True):  # type: ignore
 
 class UserMission(TimestampMixin, table=True):  # type: ignore
     __tablename__: str = "user_mission"
-    __table_args__ = (UniqueConstraint("user_challenge_id", "mission_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_challenge_id", "mission_id"),
+        Index("ix_user_mission_mission_id_status", "mission_id", "status"),
+    )
 
     id: int = Field(default=None, primary_key=True)
     user_challenge_id: int = Field(foreign_key="user_challenge.id", nullable=False)
@@ -1,2 +1,20 @@
-# TODO: access token 시간 변경!!!!!!!
-JWT_ACCESS_TIME_MINUTE = 60 * 3 * 200000
+# access token은 짧게 두고 refresh token rotation으로 재발급한다
+JWT_ACCESS_TIME_MINUTE = 30
+JWT_REFRESH_TIME_DAY = 30
+REFRESH_TOKEN_BYTES = 32
+
+# 폐기된 access token jti를 DB에서 다시 읽어 Bloom filter를 재구성하는 주기
+REVOCATION_SYNC_INTERVAL_SEC = 30
+REVOCATION_BLOOM_CAPACITY = 10_000
+REVOCATION_BLOOM_ERROR_RATE = 0.001
+
+KAKAO_ISSUER = "https://kauth.kakao.com"
+KAKAO_JWKS_URL = "https://kauth.kakao.com/.well-known/jwks.json"
+KAKAO_ID_TOKEN_ALGORITHMS = ["RS256"]
+# 카카오 공개키는 드물게 교체되므로 길게 캐시하고, 모르는 kid가 와도 1분에 한 번까지만 다시 받는다
+KAKAO_JWKS_REFRESH_INTERVAL_SEC = 60 * 60 * 6
+KAKAO_JWKS_MIN_REFRESH_INTERVAL_SEC = 60
+KAKAO_ID_TOKEN_LEEWAY_SEC = 10
+
+# 검증이 끝난 access token payload를 보관할 최대 개수 (token hash → JWTPayload)
+JWT_DECODE_CACHE_MAX_SIZE = 10_000
@@ -1,6 +1,7 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from app.common.container import provide
 from app.module.auth.schemas import JWTPayload
 from app.module.auth.services.jwt_service import JWTService
 
@@ -9,10 +10,10 @@ security = HTTPBearer()
 
 async def verify_access_token(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    jwt_service: JWTService = Depends(),
+    jwt_service: JWTService = Depends(provide(JWTService)),
 ) -> JWTPayload:
     if not credentials:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Authorization 헤더가 필요합니다.")
 
     token = credentials.credentials
-    return jwt_service.decode_token(token)
+    return await jwt_service.verify_access_token(token)
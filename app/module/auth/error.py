@@ -24,6 +24,11 @@ class MissingSocialIDException(AuthException):
     detail = "ID Token에 유저 ID가 없습니다."
 
 
+class InvalidRefreshTokenException(AuthException):
+    status_code = status.HTTP_401_UNAUTHORIZED
+    detail = "유효하지 않은 refresh token입니다."
+
+
 class NoJWTSecretException(AuthException):
     status_code = status.HTTP_401_UNAUTHORIZED
     detail = "ID Token에 유저 ID가 없습니다."
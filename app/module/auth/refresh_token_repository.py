@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.generic_repository import GenericRepository
+from app.model.refresh_token import RefreshToken
+from app.model.user import User
+
+
+class RefreshTokenRepository(GenericRepository):
+    def __init__(self):
+        super().__init__(RefreshToken)
+
+    async def find_with_social_id(
+        self, session: AsyncSession, token_hash: str, now: datetime
+    ) -> tuple[RefreshToken, str] | None:
+        """만료되지 않은 토큰만 조회. DB가 돌려주는 naive datetime과 비교하지 않도록 만료 판단은 쿼리에서 한다"""
+        stmt = (
+            select(RefreshToken, User.social_id)  # type: ignore
+            .join(User, User.id == RefreshToken.user_id)  # type: ignore
+            .where(RefreshToken.token_hash == token_hash, RefreshToken.expires_at > now)  # type: ignore
+        )
+        result = await session.execute(stmt)
+        row = result.one_or_none()
+        return (row[0], row[1]) if row else None
+
+    async def mark_used(self, session: AsyncSession, refresh_token_id: int, now: datetime) -> bool:
+        """아직 사용되지 않은 토큰만 사용 처리. 동시에 같은 토큰으로 재발급하면 한 요청만 성공한다"""
+        stmt = (
+            update(RefreshToken)
+            .where(RefreshToken.id == refresh_token_id, RefreshToken.used_at.is_(None))  # type: ignore
+            .values(used_at=now)
+        )
+        result = await session.execute(stmt)
+        return result.rowcount == 1  # type: ignore
+
+    async def revoke_family(self, session: AsyncSession, family_id: str, now: datetime) -> list[str]:
+        """같은 family의 토큰을 모두 폐기하고, 아직 살아 있을 수 있는 access token jti 목록을 반환"""
+        stmt = select(RefreshToken.access_jti).where(  # type: ignore
+            RefreshToken.family_id == family_id,  # type: ignore
+            RefreshToken.revoked_at.is_(None),  # type: ignore
+            RefreshToken.access_expires_at > now,  # type: ignore
+        )
+        access_jtis = list((await session.execute(stmt)).scalars().all())
+
+        await session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))  # type: ignore
+            .values(revoked_at=now)
+        )
+        return access_jtis
+
+    async def get_revoked_access_jtis(self, session: AsyncSession, now: datetime) -> list[str]:
+        # access token 수명이 짧으므로 access_expires_at 인덱스 범위가 작다
+        stmt = select(RefreshToken.access_jti).where(  # type: ignore
+            RefreshToken.access_expires_at > now,  # type: ignore
+            RefreshToken.revoked_at.is_not(None),  # type: ignore
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def is_access_jti_revoked(self, session: AsyncSession, access_jti: str) -> bool:
+        stmt = (
+            select(RefreshToken.id)  # type: ignore
+            .where(RefreshToken.access_jti == access_jti, RefreshToken.revoked_at.is_not(None))  # type: ignore
+            .limit(1)
+        )
+        result = await session.execute(stmt)
+        return result.scalar() is not None
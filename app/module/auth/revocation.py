@@ -0,0 +1,99 @@
+import hashlib
+import math
+import time
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from app.common.utils.time import utc_now
+from app.module.auth.constant import (
+    REVOCATION_BLOOM_CAPACITY,
+    REVOCATION_BLOOM_ERROR_RATE,
+    REVOCATION_SYNC_INTERVAL_SEC,
+)
+from app.module.auth.refresh_token_repository import RefreshTokenRepository
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class BloomFilter:
+    """문자열 집합의 포함 여부를 비트 배열로 근사하는 Bloom filter (오탐은 있고 미탐은 없다)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray(math.ceil(self.size / 8))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # 128비트 digest 하나를 둘로 나눠 double hashing으로 k개의 위치를 만든다
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+
+def _default_session_maker() -> "async_sessionmaker":
+    from app.database.config import get_async_session_maker
+
+    return get_async_session_maker()
+
+
+class AccessTokenRevocationList:
+    """폐기된 access token jti를 Bloom filter로 들고 요청마다 확인하는 폐기 목록
+
+    REVOCATION_SYNC_INTERVAL_SEC마다 아직 만료되지 않은 폐기 jti를 DB에서 읽어 필터를 다시 만든다.
+    대부분의 요청은 필터 조회만으로 끝나고, 필터가 양성일 때만 오탐 여부를 DB로 확인한다.
+    """
+
+    def __init__(
+        self,
+        sync_interval_sec: float = REVOCATION_SYNC_INTERVAL_SEC,
+        capacity: int = REVOCATION_BLOOM_CAPACITY,
+        error_rate: float = REVOCATION_BLOOM_ERROR_RATE,
+        session_maker_provider: Callable[[], "async_sessionmaker"] = _default_session_maker,
+    ):
+        self.refresh_token_repository = RefreshTokenRepository()
+        self.sync_interval_sec = sync_interval_sec
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.session_maker_provider = session_maker_provider
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._synced_at: float | None = None
+
+    async def is_revoked(self, jti: str) -> bool:
+        if self._synced_at is None or time.monotonic() - self._synced_at >= self.sync_interval_sec:
+            async with self.session_maker_provider()() as session:
+                await self.sync(session)
+
+        if jti not in self._bloom:
+            return False
+
+        async with self.session_maker_provider()() as session:
+            return await self.refresh_token_repository.is_access_jti_revoked(session, jti)
+
+    async def sync(self, session: "AsyncSession") -> None:
+        jtis = await self.refresh_token_repository.get_revoked_access_jtis(session, utc_now())
+        self.replace(jtis)
+
+    def replace(self, jtis: list[str]) -> None:
+        # 폐기 건수가 capacity를 넘으면 오탐률이 유지되도록 필터를 키운다
+        bloom = BloomFilter(max(self.capacity, len(jtis) * 2), self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        self._bloom = bloom
+        self._synced_at = time.monotonic()
+
+    def add(self, jti: str) -> None:
+        """이 프로세스에서 폐기한 jti는 다음 sync를 기다리지 않고 바로 반영"""
+        self._bloom.add(jti)
+
+
+access_token_revocation_list = AccessTokenRevocationList()
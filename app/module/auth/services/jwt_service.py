@@ -1,16 +1,24 @@
+import hashlib
+import secrets
+import uuid
 from datetime import datetime, timedelta, timezone
 from os import getenv
 
-from dotenv import load_dotenv
 from fastapi import HTTPException, status
 from jwt import ExpiredSignatureError, InvalidTokenError, decode, encode
 from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.module.auth.constant import JWT_ACCESS_TIME_MINUTE
-from app.module.auth.error import NoJWTSecretException
-from app.module.auth.schemas import JWTPayload
+from app.common.utils.env import load_local_dotenv
+from app.common.utils.time import utc_now
+from app.module.auth.constant import JWT_ACCESS_TIME_MINUTE, JWT_REFRESH_TIME_DAY, REFRESH_TOKEN_BYTES
+from app.module.auth.error import InvalidRefreshTokenException, NoJWTSecretException
+from app.module.auth.refresh_token_repository import RefreshTokenRepository
+from app.module.auth.revocation import AccessTokenRevocationList, access_token_revocation_list
+from app.module.auth.schemas import JWTPayload, TokenPair
+from app.module.auth.token_cache import DecodedTokenCache, decoded_token_cache
 
-load_dotenv()
+load_local_dotenv()
 
 _jwt_secret_key = getenv("JWT_SECRET")
 _jwt_algorithm = getenv("JWT_ALGORITHM")
@@ -22,13 +30,94 @@ JWT_SECRET_KEY: str = _jwt_secret_key
 JWT_ALGORITHM: str = _jwt_algorithm
 
 
+def hash_refresh_token(refresh_token: str) -> str:
+    return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+
 class JWTService:
-    def generate_access_token(self, social_id: str, user_id: int) -> str:
+    def __init__(
+        self,
+        token_cache: DecodedTokenCache = decoded_token_cache,
+        revocation_list: AccessTokenRevocationList = access_token_revocation_list,
+    ):
+        self.token_cache = token_cache
+        self.revocation_list = revocation_list
+        self.refresh_token_repository = RefreshTokenRepository()
+
+    def generate_access_token(self, social_id: str, user_id: int, jti: str | None = None) -> str:
         expire = datetime.now(timezone.utc) + timedelta(minutes=JWT_ACCESS_TIME_MINUTE)
-        payload = {"exp": int(expire.timestamp()), "social_id": social_id, "user_id": str(user_id)}
+        payload = {
+            "exp": int(expire.timestamp()),
+            "social_id": social_id,
+            "user_id": str(user_id),
+            "jti": jti or uuid.uuid4().hex,
+        }
         return encode(payload, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
 
+    async def issue_tokens(
+        self, session: AsyncSession, social_id: str, user_id: int, family_id: str | None = None
+    ) -> TokenPair:
+        """access token과 refresh token을 함께 발급. refresh token은 sha256 hash만 저장한다"""
+        now = utc_now()
+        access_jti = uuid.uuid4().hex
+        refresh_token = secrets.token_urlsafe(REFRESH_TOKEN_BYTES)
+
+        await self.refresh_token_repository.create(
+            session,
+            user_id=user_id,
+            family_id=family_id or uuid.uuid4().hex,
+            token_hash=hash_refresh_token(refresh_token),
+            access_jti=access_jti,
+            access_expires_at=now + timedelta(minutes=JWT_ACCESS_TIME_MINUTE),
+            expires_at=now + timedelta(days=JWT_REFRESH_TIME_DAY),
+        )
+
+        return TokenPair(
+            access_token=self.generate_access_token(social_id, user_id, access_jti),
+            refresh_token=refresh_token,
+        )
+
+    async def rotate_refresh_token(self, session: AsyncSession, refresh_token: str) -> TokenPair:
+        """refresh token을 한 번만 쓰고 새 토큰 쌍으로 교체
+
+        이미 사용된 토큰이 다시 들어오면 탈취로 보고 같은 family 전체와 함께 발급된 access token을 폐기한다.
+        """
+        now = utc_now()
+        found = await self.refresh_token_repository.find_with_social_id(session, hash_refresh_token(refresh_token), now)
+        if found is None:
+            raise InvalidRefreshTokenException()
+
+        stored_token, social_id = found
+        if stored_token.revoked_at is not None:
+            raise InvalidRefreshTokenException()
+
+        if not await self.refresh_token_repository.mark_used(session, stored_token.id, now):
+            revoked_jtis = await self.refresh_token_repository.revoke_family(session, stored_token.family_id, now)
+            # 예외로 요청 트랜잭션이 롤백되지 않도록 폐기를 먼저 커밋한다
+            await session.commit()
+            for jti in revoked_jtis:
+                self.revocation_list.add(jti)
+            raise InvalidRefreshTokenException("이미 사용된 refresh token입니다.")
+
+        return await self.issue_tokens(session, social_id, stored_token.user_id, stored_token.family_id)
+
+    async def verify_access_token(self, token: str) -> JWTPayload:
+        payload = self.decode_token(token)
+        if await self.revocation_list.is_revoked(payload.jti):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="폐기된 token입니다.")
+        return payload
+
     def decode_token(self, token: str) -> JWTPayload:
+        token_hash = self.token_cache.hash_token(token)
+        cached_payload = self.token_cache.get(token_hash)
+        if cached_payload is not None:
+            return cached_payload
+
+        payload = self._decode_token(token)
+        self.token_cache.set(token_hash, payload)
+        return payload
+
+    def _decode_token(self, token: str) -> JWTPayload:
         try:
             raw_payload = decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
             return JWTPayload(**raw_payload)
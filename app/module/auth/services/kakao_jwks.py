@@ -0,0 +1,76 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+import jwt
+
+from app.common.http_client import SharedHttpClient, shared_http_client
+from app.module.auth.constant import (
+    KAKAO_JWKS_MIN_REFRESH_INTERVAL_SEC,
+    KAKAO_JWKS_REFRESH_INTERVAL_SEC,
+    KAKAO_JWKS_URL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class KakaoJWKSCache:
+    """카카오 OIDC 공개키(JWKS)를 kid별로 보관하는 캐시
+
+    최초 한 번만 로그인 경로에서 JWKS를 받아 오고, 이후에는 refresh_interval_sec이 지나면
+    현재 키로 검증을 계속하면서 백그라운드에서 다시 받아 온다.
+    모르는 kid는 키 교체로 보고 min_refresh_interval_sec 간격 안에서 백그라운드 갱신을 건다.
+    """
+
+    def __init__(
+        self,
+        http_client: SharedHttpClient = shared_http_client,
+        jwks_url: str = KAKAO_JWKS_URL,
+        refresh_interval_sec: float = KAKAO_JWKS_REFRESH_INTERVAL_SEC,
+        min_refresh_interval_sec: float = KAKAO_JWKS_MIN_REFRESH_INTERVAL_SEC,
+    ):
+        self.http_client = http_client
+        self.jwks_url = jwks_url
+        self.refresh_interval_sec = refresh_interval_sec
+        self.min_refresh_interval_sec = min_refresh_interval_sec
+        self._keys: dict[str, Any] = {}
+        self._fetched_at: float | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_key(self, kid: str) -> Any | None:
+        """kid에 해당하는 공개키. 모르는 kid면 None (호출 측에서 원격 검증으로 넘어간다)"""
+        if self._fetched_at is None:
+            async with self._lock:
+                if self._fetched_at is None:
+                    await self.refresh()
+
+        key = self._keys.get(kid)
+        elapsed = time.monotonic() - (self._fetched_at or 0.0)
+        if key is None and elapsed >= self.min_refresh_interval_sec:
+            self._schedule_refresh()
+        elif elapsed >= self.refresh_interval_sec:
+            self._schedule_refresh()
+        return key
+
+    async def refresh(self) -> None:
+        # 실패해도 재시도가 몰리지 않도록 시도 시각을 먼저 기록한다
+        self._fetched_at = time.monotonic()
+        try:
+            response = await self.http_client.get().get(self.jwks_url)
+            response.raise_for_status()
+            jwk_set = jwt.PyJWKSet.from_dict(response.json())
+        except Exception:
+            logger.exception("카카오 JWKS 조회 실패: %s", self.jwks_url)
+            return
+
+        self._keys = {jwk.key_id: jwk.key for jwk in jwk_set.keys if jwk.key_id}
+
+    def _schedule_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(self.refresh())
+
+
+kakao_jwks_cache = KakaoJWKSCache()
@@ -1,21 +1,39 @@
-import httpx
-from dotenv import load_dotenv
+from os import getenv
+
+import jwt
 from fastapi import status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.http_client import SharedHttpClient, shared_http_client
+from app.common.utils.env import load_local_dotenv
 from app.database.generic_repository import GenericRepository
 from app.model.user import User
+from app.module.auth.constant import KAKAO_ID_TOKEN_ALGORITHMS, KAKAO_ID_TOKEN_LEEWAY_SEC, KAKAO_ISSUER
 from app.module.auth.enums import OAuthProvider
 from app.module.auth.error import InvalidKakaoTokenException, MissingSocialIDException
+from app.module.auth.services.kakao_jwks import KakaoJWKSCache, kakao_jwks_cache
 
-load_dotenv()
+load_local_dotenv()
 
 KAKAO_TOKEN_INFO_URL = "https://kauth.kakao.com/oauth/tokeninfo"
+# id_token의 aud로 허용할 카카오 앱 키 (콤마 구분). 비어 있으면 로컬 검증 없이 tokeninfo만 사용한다
+KAKAO_APP_KEYS = [key.strip() for key in getenv("KAKAO_APP_KEYS", "").split(",") if key.strip()]
 
 
 class AuthService:
-    def __init__(self):
+    def __init__(
+        self,
+        http_client: SharedHttpClient = shared_http_client,
+        token_info_url: str = KAKAO_TOKEN_INFO_URL,
+        jwks_cache: KakaoJWKSCache = kakao_jwks_cache,
+        app_keys: list[str] | None = None,
+    ):
         self.user_repository = GenericRepository(User)
+        # 로그인마다 TCP/TLS handshake를 하지 않도록 keep-alive 커넥션을 가진 공유 클라이언트 사용
+        self.http_client = http_client
+        self.token_info_url = token_info_url
+        self.jwks_cache = jwks_cache
+        self.app_keys = KAKAO_APP_KEYS if app_keys is None else app_keys
 
     async def create_user_with_social_id(self, session: AsyncSession, social_id: str) -> User:
         return await self.user_repository.create(  # type: ignore
@@ -33,21 +51,64 @@ class AuthService:
             session, provider=OAuthProvider.KAKAO, social_id=social_id
         )  # type: ignore
 
-    async def verify_kakao_token(self, id_token: str) -> str:
-        data = {"id_token": id_token}
-        headers = {"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"}
+    async def verify_kakao_token(self, id_token: str, nonce: str | None = None) -> str:
+        """id_token을 검증하고 카카오 회원번호(sub)를 반환
+
+        캐시된 JWKS로 서명과 iss/aud/exp/nonce를 로컬에서 검증하고,
+        kid를 모르거나 앱 키가 설정되지 않은 경우에만 카카오 tokeninfo API로 검증한다.
+        """
+        key = await self._get_signing_key(id_token)
+        if key is None:
+            token_info = await self._verify_remote(id_token)
+        else:
+            token_info = self._verify_local(id_token, key)
+
+        if nonce is not None and token_info.get("nonce") != nonce:
+            raise InvalidKakaoTokenException("카카오 토큰 검증 실패: nonce 불일치")
+
+        social_id = token_info.get("sub")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(KAKAO_TOKEN_INFO_URL, data=data, headers=headers)
+        if not social_id:
+            raise MissingSocialIDException()
 
-            if response.status_code is not status.HTTP_200_OK:
-                raise InvalidKakaoTokenException(f"카카오 토큰 검증 실패: {response.status_code}")
+        return social_id
 
-            token_info = response.json()
+    async def _get_signing_key(self, id_token: str):
+        if not self.app_keys:
+            return None
+
+        try:
+            kid = jwt.get_unverified_header(id_token).get("kid")
+        except jwt.InvalidTokenError:
+            raise InvalidKakaoTokenException("카카오 토큰 검증 실패: 잘못된 형식")
+
+        if not kid:
+            return None
+        return await self.jwks_cache.get_key(kid)
+
+    def _verify_local(self, id_token: str, key) -> dict:
+        try:
+            return jwt.decode(
+                id_token,
+                key,
+                algorithms=KAKAO_ID_TOKEN_ALGORITHMS,
+                audience=self.app_keys,
+                issuer=KAKAO_ISSUER,
+                leeway=KAKAO_ID_TOKEN_LEEWAY_SEC,
+                options={"require": ["exp", "iss", "aud"]},
+            )
+        except jwt.ExpiredSignatureError:
+            raise InvalidKakaoTokenException("카카오 토큰 검증 실패: 만료된 토큰")
+        except jwt.InvalidTokenError as e:
+            raise InvalidKakaoTokenException(f"카카오 토큰 검증 실패: {e}")
+
+    async def _verify_remote(self, id_token: str) -> dict:
+        data = {"id_token": id_token}
+        headers = {"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"}
 
-            social_id = token_info.get("sub")
+        response = await self.http_client.get().post(self.token_info_url, data=data, headers=headers)
 
-            if not social_id:
-                raise MissingSocialIDException()
+        if response.status_code != status.HTTP_200_OK:
+            raise InvalidKakaoTokenException(f"카카오 토큰 검증 실패: {response.status_code}")
 
-            return social_id
+        return response.json()
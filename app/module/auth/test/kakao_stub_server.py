@@ -0,0 +1,86 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+STUB_TOKEN_INFO_PATH = "/oauth/tokeninfo"
+VALID_TOKEN_PREFIX = "valid:"
+
+
+class KakaoStubServer:
+    """kauth.kakao.com/oauth/tokeninfo를 흉내 내는 로컬 HTTP/1.1 keep-alive 서버
+
+    id_token이 "valid:<social_id>"면 200과 sub를, 그 외에는 401을 돌려준다.
+    connect_delay_sec로 새 커넥션마다 드는 handshake 비용을, response_delay_sec로 응답 지연을 흉내 낸다.
+    """
+
+    def __init__(self, connect_delay_sec: float = 0.0, response_delay_sec: float = 0.0):
+        self.connect_delay_sec = connect_delay_sec
+        self.response_delay_sec = response_delay_sec
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._create_handler())
+        self._server.daemon_threads = True
+        # 클라이언트 timeout으로 끊긴 커넥션의 BrokenPipe는 테스트 출력에 남기지 않는다
+        self._server.handle_error = lambda request, client_address: None  # type: ignore[method-assign]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def token_info_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}{STUB_TOKEN_INFO_PATH}"
+
+    def start(self) -> "KakaoStubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "KakaoStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _create_handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class TokenInfoHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 헤더와 본문을 따로 쓰므로 Nagle을 끄지 않으면 keep-alive 커넥션에서 delayed ACK만큼 지연된다
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+                time.sleep(stub.connect_delay_sec)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode("utf-8"))
+                with stub._lock:
+                    stub.requests += 1
+                time.sleep(stub.response_delay_sec)
+
+                id_token = form.get("id_token", [""])[0]
+                if self.path == STUB_TOKEN_INFO_PATH and id_token.startswith(VALID_TOKEN_PREFIX):
+                    self._send_json(200, {"sub": id_token.removeprefix(VALID_TOKEN_PREFIX), "exp": 1234567890})
+                else:
+                    self._send_json(401, {"error": "invalid_token"})
+
+            def _send_json(self, status_code: int, body: dict):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status_code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return TokenInfoHandler
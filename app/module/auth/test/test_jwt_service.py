@@ -8,6 +8,7 @@ from fastapi import HTTPException, status
 import app.module.auth.services.jwt_service as jwt_module
 from app.module.auth.constant import JWT_ACCESS_TIME_MINUTE
 from app.module.auth.services.jwt_service import JWTService
+from app.module.auth.token_cache import DecodedTokenCache
 
 
 class TestJWTService:
@@ -67,6 +68,7 @@ class TestJWTService:
             "exp": int((datetime.now(timezone.utc) + timedelta(hours=1)).timestamp()),
             "social_id": "test_social_id",
             "user_id": "123",
+            "jti": "test_jti",
         }
         token = jwt.encode(payload, "test_secret_key", algorithm="HS256")
 
@@ -76,6 +78,7 @@ class TestJWTService:
         # Then
         assert decoded.social_id == "test_social_id"
         assert decoded.user_id == 123
+        assert decoded.jti == "test_jti"
 
     def test_decode_expired_token(self, jwt_service: JWTService):
         # Given
@@ -141,3 +144,46 @@ class TestJWTService:
         assert decoded2["social_id"] == "user_002"
         assert decoded1["user_id"] == "1"
         assert decoded2["user_id"] == "2"
+
+    def test_decode_token_uses_cache_for_same_token(self, jwt_service: JWTService):
+        # Given
+        jwt_service.token_cache = DecodedTokenCache()
+        token = jwt_service.generate_access_token("cached_user", 7)
+
+        # When
+        with patch("app.module.auth.services.jwt_service.decode", wraps=jwt.decode) as mock_decode:
+            first = jwt_service.decode_token(token)
+            second = jwt_service.decode_token(token)
+
+        # Then
+        assert first is second
+        assert second.user_id == 7
+        mock_decode.assert_called_once()
+        assert jwt_service.token_cache.stats() == {"size": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_decode_token_does_not_cache_invalid_token(self, jwt_service: JWTService):
+        # Given
+        jwt_service.token_cache = DecodedTokenCache()
+
+        # When
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                jwt_service.decode_token("invalid_token_blabla")
+
+        # Then
+        assert jwt_service.token_cache.stats()["size"] == 0
+
+    def test_decode_token_without_jti(self, jwt_service: JWTService):
+        # Given
+        payload = {
+            "exp": int((datetime.now(timezone.utc) + timedelta(hours=1)).timestamp()),
+            "social_id": "legacy_user",
+            "user_id": "1",
+        }
+        token = jwt.encode(payload, "test_secret_key", algorithm="HS256")
+
+        # When & Then
+        with pytest.raises(HTTPException) as exc_info:
+            jwt_service.decode_token(token)
+
+        assert exc_info.value.detail == "token 형식이 올바르지 않습니다."
@@ -0,0 +1,168 @@
+import time
+
+import httpx
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from app.common.http_client import SharedHttpClient
+from app.module.auth.constant import KAKAO_ISSUER
+from app.module.auth.error import InvalidKakaoTokenException, MissingSocialIDException
+from app.module.auth.services.kakao_jwks import KakaoJWKSCache
+from app.module.auth.services.oauth_service import AuthService
+
+APP_KEY = "test-app-key"
+KAKAO_JWKS_TEST_URL = "https://kauth.kakao.com/.well-known/jwks.json"
+
+
+def generate_rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def make_jwks(*keys: tuple[str, rsa.RSAPrivateKey]) -> dict:
+    jwks = []
+    for kid, private_key in keys:
+        jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        jwks.append({**jwk, "kid": kid, "alg": "RS256", "use": "sig"})
+    return {"keys": jwks}
+
+
+def make_id_token(private_key, kid: str, **claims) -> str:
+    now = int(time.time())
+    payload = {"iss": KAKAO_ISSUER, "aud": APP_KEY, "sub": "kakao_user_1", "iat": now, "exp": now + 3600}
+    payload.update(claims)
+    return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+class FakeKakao:
+    """JWKS와 tokeninfo를 흉내 내는 MockTransport 핸들러"""
+
+    def __init__(self, jwks: dict):
+        self.jwks = jwks
+        self.jwks_requests = 0
+        self.token_info_requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/.well-known/jwks.json":
+            self.jwks_requests += 1
+            return httpx.Response(200, json=self.jwks)
+
+        self.token_info_requests += 1
+        return httpx.Response(200, json={"sub": "remote_user", "nonce": "remote_nonce"})
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    return generate_rsa_key()
+
+
+class TestLocalIdTokenVerification:
+    @pytest.fixture
+    def fake_kakao(self, private_key):
+        return FakeKakao(make_jwks(("kid-1", private_key)))
+
+    @pytest.fixture
+    def auth_service(self, fake_kakao):
+        http_client = SharedHttpClient(transport=httpx.MockTransport(fake_kakao))
+        jwks_cache = KakaoJWKSCache(http_client=http_client, jwks_url=KAKAO_JWKS_TEST_URL)
+        return AuthService(http_client=http_client, jwks_cache=jwks_cache, app_keys=[APP_KEY])
+
+    @pytest.mark.asyncio
+    async def test_verifies_locally_with_cached_jwks(self, auth_service, fake_kakao, private_key):
+        # given
+        tokens = [make_id_token(private_key, "kid-1", sub=f"user_{i}", nonce="n") for i in range(3)]
+
+        # when
+        results = [await auth_service.verify_kakao_token(token, nonce="n") for token in tokens]
+
+        # then
+        assert results == ["user_0", "user_1", "user_2"]
+        assert fake_kakao.jwks_requests == 1
+        assert fake_kakao.token_info_requests == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "claims",
+        [
+            {"iss": "https://evil.example.com"},
+            {"aud": "other-app-key"},
+            {"exp": int(time.time()) - 60},
+            {"nonce": "other_nonce"},
+        ],
+    )
+    async def test_rejects_invalid_claims(self, auth_service, fake_kakao, private_key, claims):
+        # given
+        token = make_id_token(private_key, "kid-1", **{"nonce": "n", **claims})
+
+        # when & then
+        with pytest.raises(InvalidKakaoTokenException):
+            await auth_service.verify_kakao_token(token, nonce="n")
+        assert fake_kakao.token_info_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_token_signed_by_other_key(self, auth_service, fake_kakao):
+        # given
+        token = make_id_token(generate_rsa_key(), "kid-1")
+
+        # when & then
+        with pytest.raises(InvalidKakaoTokenException):
+            await auth_service.verify_kakao_token(token)
+
+    @pytest.mark.asyncio
+    async def test_missing_sub(self, auth_service, private_key):
+        # given
+        token = make_id_token(private_key, "kid-1", sub="")
+
+        # when & then
+        with pytest.raises(MissingSocialIDException):
+            await auth_service.verify_kakao_token(token)
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_falls_back_to_remote_and_refreshes(self, auth_service, fake_kakao, private_key):
+        # given
+        await auth_service.verify_kakao_token(make_id_token(private_key, "kid-1"))
+        rotated_key = generate_rsa_key()
+        fake_kakao.jwks = make_jwks(("kid-1", private_key), ("kid-2", rotated_key))
+        auth_service.jwks_cache.min_refresh_interval_sec = 0
+        rotated_token = make_id_token(rotated_key, "kid-2", sub="rotated_user")
+
+        # when
+        remote_result = await auth_service.verify_kakao_token(rotated_token)
+        await auth_service.jwks_cache._refresh_task
+        local_result = await auth_service.verify_kakao_token(rotated_token)
+
+        # then
+        assert remote_result == "remote_user"
+        assert local_result == "rotated_user"
+        assert fake_kakao.token_info_requests == 1
+        assert fake_kakao.jwks_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_jwks_refreshes_in_background(self, auth_service, fake_kakao, private_key):
+        # given
+        token = make_id_token(private_key, "kid-1")
+        await auth_service.verify_kakao_token(token)
+        auth_service.jwks_cache.refresh_interval_sec = 0
+
+        # when
+        result = await auth_service.verify_kakao_token(token)
+        await auth_service.jwks_cache._refresh_task
+
+        # then
+        assert result == "kakao_user_1"
+        assert fake_kakao.jwks_requests == 2
+        assert fake_kakao.token_info_requests == 0
+
+    @pytest.mark.asyncio
+    async def test_without_app_keys_uses_remote(self, fake_kakao, private_key):
+        # given
+        http_client = SharedHttpClient(transport=httpx.MockTransport(fake_kakao))
+        auth_service = AuthService(http_client=http_client, app_keys=[])
+
+        # when
+        result = await auth_service.verify_kakao_token(make_id_token(private_key, "kid-1"))
+
+        # then
+        assert result == "remote_user"
+        assert fake_kakao.jwks_requests == 0
@@ -1,17 +1,21 @@
-from unittest.mock import AsyncMock, MagicMock, patch
-
+import httpx
 import pytest
-from fastapi import status
 
+from app.common.http_client import SharedHttpClient
 from app.module.auth.error import InvalidKakaoTokenException, MissingSocialIDException
-from app.module.auth.services.oauth_service import AuthService
+from app.module.auth.services.oauth_service import KAKAO_TOKEN_INFO_URL, AuthService
+from app.module.auth.test.kakao_stub_server import KakaoStubServer
 
 
-class TestAuthService:
-    @pytest.fixture
-    def auth_service(self):
-        return AuthService()
+def make_mock_client(status_code: int, body: dict, requests: list[httpx.Request]) -> SharedHttpClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code, json=body)
 
+    return SharedHttpClient(transport=httpx.MockTransport(handler))
+
+
+class TestAuthService:
     @pytest.fixture
     def mock_kakao_response_success(self):
         return {
@@ -28,113 +32,114 @@ class TestAuthService:
         }
 
     @pytest.mark.asyncio
-    async def test_verify_kakao_token_success(self, auth_service: AuthService, mock_kakao_response_success):
+    async def test_verify_kakao_token_success(self, mock_kakao_response_success):
         # Given
         test_token = "test_id_token_12345"
-        mock_response = MagicMock()
-        mock_response.status_code = status.HTTP_200_OK
-        mock_response.json.return_value = mock_kakao_response_success
+        requests: list[httpx.Request] = []
+        auth_service = AuthService(
+            http_client=make_mock_client(200, mock_kakao_response_success, requests), app_keys=[]
+        )
 
         # When
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-
-            result = await auth_service.verify_kakao_token(test_token)
+        result = await auth_service.verify_kakao_token(test_token)
 
         # Then
         assert result == "test_social_id_123456"
-        mock_client_instance.post.assert_called_once_with(
-            "https://kauth.kakao.com/oauth/tokeninfo",
-            data={"id_token": test_token},
-            headers={"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"},
-        )
+        assert len(requests) == 1
+        assert str(requests[0].url) == KAKAO_TOKEN_INFO_URL
+        assert requests[0].method == "POST"
+        assert requests[0].content == f"id_token={test_token}".encode()
+        assert requests[0].headers["Content-Type"] == "application/x-www-form-urlencoded;charset=utf-8"
 
     @pytest.mark.asyncio
-    async def test_verify_kakao_token_invalid_token(self, auth_service: AuthService):
+    @pytest.mark.parametrize("status_code", [401, 500])
+    async def test_verify_kakao_token_failed_status(self, status_code):
         # Given
-        test_token = "invalid_token"
-        mock_response = MagicMock()
-        mock_response.status_code = status.HTTP_401_UNAUTHORIZED
+        auth_service = AuthService(http_client=make_mock_client(status_code, {}, []), app_keys=[])
 
         # When & Then
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+        with pytest.raises(InvalidKakaoTokenException) as exc_info:
+            await auth_service.verify_kakao_token("invalid_token")
 
-            with pytest.raises(InvalidKakaoTokenException) as exc_info:
-                await auth_service.verify_kakao_token(test_token)
-
-            assert "카카오 토큰 검증 실패: 401" in str(exc_info.value)
+        assert f"카카오 토큰 검증 실패: {status_code}" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_verify_kakao_token_no_social_id(self, auth_service: AuthService, mock_kakao_response_no_sub):
+    async def test_verify_kakao_token_no_social_id(self, mock_kakao_response_no_sub):
         # Given
-        test_token = "test_token_no_sub"
-        mock_response = MagicMock()
-        mock_response.status_code = status.HTTP_200_OK
-        mock_response.json.return_value = mock_kakao_response_no_sub
+        auth_service = AuthService(http_client=make_mock_client(200, mock_kakao_response_no_sub, []), app_keys=[])
 
         # When & Then
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+        with pytest.raises(MissingSocialIDException):
+            await auth_service.verify_kakao_token("test_token_no_sub")
 
-            with pytest.raises(MissingSocialIDException):
-                await auth_service.verify_kakao_token(test_token)
+
+class TestAuthServiceWithStubServer:
+    @pytest.fixture
+    def stub_server(self):
+        with KakaoStubServer() as server:
+            yield server
 
     @pytest.mark.asyncio
-    async def test_verify_kakao_token_server_error(self, auth_service: AuthService):
-        # Given
-        test_token = "test_token"
-        mock_response = MagicMock()
-        mock_response.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    async def test_reuses_keepalive_connection(self, stub_server):
+        # given
+        http_client = SharedHttpClient()
+        auth_service = AuthService(http_client=http_client, token_info_url=stub_server.token_info_url, app_keys=[])
 
-        # When & Then
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.post.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+        # when
+        results = [await auth_service.verify_kakao_token(f"valid:user_{i}") for i in range(5)]
+        await http_client.aclose()
 
-            with pytest.raises(InvalidKakaoTokenException) as exc_info:
-                await auth_service.verify_kakao_token(test_token)
+        # then
+        assert results == [f"user_{i}" for i in range(5)]
+        assert stub_server.requests == 5
+        assert stub_server.connections == 1
 
-            assert "카카오 토큰 검증 실패: 500" in str(exc_info.value)
+        snapshot = http_client.metrics.snapshot()["127.0.0.1"]
+        assert snapshot["requests"] == 5
+        assert snapshot["errors"] == 0
+        assert snapshot["latency_ms_max"] >= snapshot["latency_ms_avg"] > 0
 
     @pytest.mark.asyncio
-    async def test_verify_kakao_token_different_tokens(self, auth_service: AuthService, mock_kakao_response_success):
-        # Given
-        token1 = "token_1"
-        token2 = "token_2"
-
-        response1 = {**mock_kakao_response_success, "sub": "user_1"}
-        response2 = {**mock_kakao_response_success, "sub": "user_2"}
+    async def test_invalid_token_from_stub(self, stub_server):
+        # given
+        auth_service = AuthService(
+            http_client=SharedHttpClient(), token_info_url=stub_server.token_info_url, app_keys=[]
+        )
 
-        mock_response1 = MagicMock()
-        mock_response1.status_code = status.HTTP_200_OK
-        mock_response1.json.return_value = response1
+        # when & then
+        with pytest.raises(InvalidKakaoTokenException):
+            await auth_service.verify_kakao_token("expired")
 
-        mock_response2 = MagicMock()
-        mock_response2.status_code = status.HTTP_200_OK
-        mock_response2.json.return_value = response2
+    @pytest.mark.asyncio
+    async def test_read_timeout_is_bounded_and_recorded(self, stub_server):
+        # given
+        stub_server.response_delay_sec = 0.5
+        http_client = SharedHttpClient(read_timeout=0.05)
+        auth_service = AuthService(http_client=http_client, token_info_url=stub_server.token_info_url, app_keys=[])
 
-        # When & Then
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
+        # when
+        with pytest.raises(httpx.ReadTimeout):
+            await auth_service.verify_kakao_token("valid:slow_user")
+        await http_client.aclose()
 
-            # 첫 번째 토큰 검증
-            mock_client_instance.post.return_value = mock_response1
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
-            result1 = await auth_service.verify_kakao_token(token1)
+        # then
+        assert http_client.metrics.snapshot()["127.0.0.1"]["errors"] == 1
 
-            # 두 번째 토큰 검증
-            mock_client_instance.post.return_value = mock_response2
-            result2 = await auth_service.verify_kakao_token(token2)
 
-        # Then
-        assert result1 == "user_1"
-        assert result2 == "user_2"
-        assert result1 != result2
+class TestSharedHttpClient:
+    @pytest.mark.asyncio
+    async def test_returns_same_client_until_closed(self):
+        # given
+        http_client = SharedHttpClient(http2=False)
+
+        # when
+        first = http_client.get()
+        second = http_client.get()
+        await http_client.aclose()
+        after_close = http_client.get()
+
+        # then
+        assert first is second
+        assert first.is_closed
+        assert after_close is not first
+        await http_client.aclose()
@@ -0,0 +1,203 @@
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+
+import app.model  # noqa: F401
+import app.module.auth.services.jwt_service as jwt_module
+from app.common.utils.time import utc_now
+from app.model.refresh_token import RefreshToken
+from app.model.user import User
+from app.module.auth.error import InvalidRefreshTokenException
+from app.module.auth.revocation import AccessTokenRevocationList, BloomFilter
+from app.module.auth.services.jwt_service import JWTService, hash_refresh_token
+from app.module.auth.token_cache import DecodedTokenCache
+
+
+@pytest_asyncio.fixture
+async def session_maker():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def user_id(session_maker) -> int:
+    async with session_maker() as session:
+        user = User(provider="kakao", social_id="social_1")
+        session.add(user)
+        await session.commit()
+        return user.id
+
+
+@pytest.fixture
+def jwt_service(session_maker) -> JWTService:
+    jwt_module.JWT_SECRET_KEY = "test_secret_key"
+    jwt_module.JWT_ALGORITHM = "HS256"
+    revocation_list = AccessTokenRevocationList(session_maker_provider=lambda: session_maker)
+    return JWTService(DecodedTokenCache(), revocation_list)
+
+
+class TestBloomFilter:
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        # given
+        bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+        members = [f"member_{i}" for i in range(1_000)]
+
+        # when
+        for member in members:
+            bloom.add(member)
+        false_positives = sum(f"other_{i}" in bloom for i in range(10_000))
+
+        # then
+        assert all(member in bloom for member in members)
+        assert false_positives < 10_000 * 0.03
+        assert len(bloom._bits) * 8 >= bloom.size
+
+
+class TestRefreshTokenRotation:
+    @pytest.mark.asyncio
+    async def test_issue_stores_only_hash(self, jwt_service, session_maker, user_id):
+        # given
+        async with session_maker() as session:
+            # when
+            tokens = await jwt_service.issue_tokens(session, "social_1", user_id)
+            await session.commit()
+
+            # then
+            stored = (await session.execute(select(RefreshToken))).scalar_one()
+        assert stored.token_hash == hash_refresh_token(tokens.refresh_token)
+        assert tokens.refresh_token not in stored.token_hash
+        assert jwt_service.decode_token(tokens.access_token).jti == stored.access_jti
+
+    @pytest.mark.asyncio
+    async def test_rotate_issues_new_pair_in_same_family(self, jwt_service, session_maker, user_id):
+        # given
+        async with session_maker() as session:
+            first = await jwt_service.issue_tokens(session, "social_1", user_id)
+            await session.commit()
+
+            # when
+            second = await jwt_service.rotate_refresh_token(session, first.refresh_token)
+            await session.commit()
+
+            # then
+            rows = (await session.execute(select(RefreshToken).order_by(RefreshToken.id))).scalars().all()
+        assert second.refresh_token != first.refresh_token
+        assert [row.used_at is not None for row in rows] == [True, False]
+        assert rows[0].family_id == rows[1].family_id
+        assert (await jwt_service.verify_access_token(second.access_token)).user_id == user_id
+
+    @pytest.mark.asyncio
+    async def test_reuse_revokes_family_and_access_tokens(self, jwt_service, session_maker, user_id):
+        # given
+        async with session_maker() as session:
+            first = await jwt_service.issue_tokens(session, "social_1", user_id)
+            await session.commit()
+            second = await jwt_service.rotate_refresh_token(session, first.refresh_token)
+            await session.commit()
+
+            # when
+            with pytest.raises(InvalidRefreshTokenException):
+                await jwt_service.rotate_refresh_token(session, first.refresh_token)
+
+            # then
+            with pytest.raises(InvalidRefreshTokenException):
+                await jwt_service.rotate_refresh_token(session, second.refresh_token)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await jwt_service.verify_access_token(second.access_token)
+        assert exc_info.value.detail == "폐기된 token입니다."
+
+    @pytest.mark.asyncio
+    async def test_revocation_synced_from_db_in_other_process(self, jwt_service, session_maker, user_id):
+        # given
+        async with session_maker() as session:
+            tokens = await jwt_service.issue_tokens(session, "social_1", user_id)
+            await session.commit()
+        other_process = AccessTokenRevocationList(session_maker_provider=lambda: session_maker)
+        jti = jwt_service.decode_token(tokens.access_token).jti
+        assert await other_process.is_revoked(jti) is False
+
+        # when
+        async with session_maker() as session:
+            stored = (await session.execute(select(RefreshToken))).scalar_one()
+            await jwt_service.refresh_token_repository.revoke_family(session, stored.family_id, utc_now())
+            await session.commit()
+        other_process.sync_interval_sec = 0
+
+        # then
+        assert await other_process.is_revoked(jti) is True
+
+    @pytest.mark.asyncio
+    async def test_unknown_or_expired_refresh_token(self, jwt_service, session_maker, user_id):
+        # given
+        async with session_maker() as session:
+            tokens = await jwt_service.issue_tokens(session, "social_1", user_id)
+            stored = (await session.execute(select(RefreshToken))).scalar_one()
+            stored.expires_at = utc_now() - timedelta(seconds=1)
+            await session.commit()
+
+            # when & then
+            with pytest.raises(InvalidRefreshTokenException):
+                await jwt_service.rotate_refresh_token(session, "unknown")
+            with pytest.raises(InvalidRefreshTokenException):
+                await jwt_service.rotate_refresh_token(session, tokens.refresh_token)
+
+    @pytest.mark.asyncio
+    async def test_rotate_with_naive_expires_at_from_db(self, jwt_service, session_maker, user_id):
+        # given: MySQL DATETIME처럼 tzinfo 없는 값으로 저장된 토큰을 새 세션에서 읽는다
+        async with session_maker() as session:
+            valid = await jwt_service.issue_tokens(session, "social_1", user_id)
+            expired = await jwt_service.issue_tokens(session, "social_1", user_id)
+            naive_now = utc_now().replace(tzinfo=None)
+            update_expires_at = text("UPDATE refresh_token SET expires_at = :expires_at WHERE token_hash = :token_hash")
+            for token, expires_at in (
+                (valid, naive_now + timedelta(days=1)),
+                (expired, naive_now - timedelta(seconds=1)),
+            ):
+                await session.execute(
+                    update_expires_at,
+                    {"expires_at": expires_at, "token_hash": hash_refresh_token(token.refresh_token)},
+                )
+            await session.commit()
+
+        # when & then
+        async with session_maker() as session:
+            rotated = await jwt_service.rotate_refresh_token(session, valid.refresh_token)
+            with pytest.raises(InvalidRefreshTokenException):
+                await jwt_service.rotate_refresh_token(session, expired.refresh_token)
+        assert rotated.refresh_token != valid.refresh_token
+
+
+class TestRevocationList:
+    @pytest.mark.asyncio
+    async def test_bloom_negative_skips_db(self):
+        # given
+        def fail_session_maker():
+            raise AssertionError("DB를 조회하면 안 된다")
+
+        revocation_list = AccessTokenRevocationList(session_maker_provider=fail_session_maker)
+        revocation_list.replace(["revoked_jti"])
+
+        # when & then
+        assert await revocation_list.is_revoked("other_jti") is False
+
+    @pytest.mark.asyncio
+    async def test_filter_grows_with_revocations(self):
+        # given
+        revocation_list = AccessTokenRevocationList(capacity=10)
+
+        # when
+        revocation_list.replace([f"jti_{i}" for i in range(100)])
+
+        # then
+        assert revocation_list._bloom.size >= BloomFilter(200, revocation_list.error_rate).size
+        assert all(f"jti_{i}" in revocation_list._bloom for i in range(100))
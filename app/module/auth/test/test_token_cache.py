@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+from app.module.auth.schemas import JWTPayload
+from app.module.auth.token_cache import DecodedTokenCache
+
+
+def make_payload(user_id: int, exp: int = 2_000_000_000) -> JWTPayload:
+    return JWTPayload(exp=exp, social_id=f"social_{user_id}", user_id=user_id, jti=f"jti_{user_id}")
+
+
+class TestDecodedTokenCache:
+    def test_keys_by_token_hash(self):
+        # given
+        cache = DecodedTokenCache()
+        token_hash = cache.hash_token("header.payload.signature")
+
+        # when
+        cache.set(token_hash, make_payload(1))
+
+        # then
+        assert len(token_hash) == 32
+        assert cache.get(cache.hash_token("header.payload.signature")).user_id == 1
+        assert cache.get(cache.hash_token("other.token")) is None
+
+    def test_expired_payload_is_evicted(self):
+        # given
+        cache = DecodedTokenCache()
+        token_hash = cache.hash_token("token")
+        cache.set(token_hash, make_payload(1, exp=1_000))
+
+        # when
+        with patch("app.module.auth.token_cache.time.time", return_value=1_000):
+            payload = cache.get(token_hash)
+
+        # then
+        assert payload is None
+        assert cache.stats() == {"size": 0, "hits": 0, "misses": 1, "hit_rate": 0.0}
+
+    def test_evicts_least_recently_used(self):
+        # given
+        cache = DecodedTokenCache(max_size=2)
+        first, second, third = (cache.hash_token(f"token_{i}") for i in range(3))
+        cache.set(first, make_payload(1))
+        cache.set(second, make_payload(2))
+
+        # when
+        cache.get(first)
+        cache.set(third, make_payload(3))
+
+        # then
+        assert cache.get(first) is not None
+        assert cache.get(second) is None
+        assert cache.get(third) is not None
@@ -0,0 +1,68 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from app.module.auth.constant import JWT_DECODE_CACHE_MAX_SIZE
+from app.module.auth.schemas import JWTPayload
+
+
+class DecodedTokenCache:
+    """서명 검증과 JWTPayload 변환을 마친 access token을 exp까지 보관하는 LRU 캐시
+
+    같은 토큰이 반복해서 들어오므로 HMAC 검증과 pydantic 변환을 한 번만 한다.
+    원본 토큰 대신 sha256 digest를 키로 쓴다.
+    """
+
+    def __init__(self, max_size: int = JWT_DECODE_CACHE_MAX_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, JWTPayload] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def hash_token(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token_hash: bytes) -> JWTPayload | None:
+        with self._lock:
+            payload = self._entries.get(token_hash)
+            if payload is None:
+                self.misses += 1
+                return None
+
+            if payload.exp <= time.time():
+                del self._entries[token_hash]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(token_hash)
+            self.hits += 1
+            return payload
+
+    def set(self, token_hash: bytes, payload: JWTPayload) -> None:
+        with self._lock:
+            self._entries[token_hash] = payload
+            self._entries.move_to_end(token_hash)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / requests, 4) if requests else 0.0,
+            }
+
+
+decoded_token_cache = DecodedTokenCache()
@@ -1,25 +1,64 @@
 from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.utils.time import utc_now
 from app.database.generic_repository import GenericRepository
-from app.model.badge import Badge, UserBadge
+from app.model.badge import Badge, UserBadge, UserBadgeStats
+from app.module.badge.rules import BadgeProgress
 
 
 class BadgeRepository(GenericRepository):
     def __init__(self):
         super().__init__(Badge)
 
-    async def get_badge_by_name(self, session: AsyncSession, name: str) -> Badge | None:
-        stmt = select(Badge).where(Badge.name == name)  # type: ignore
-        result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+    async def grant_badges(self, session: AsyncSession, user_id: int, badge_ids: list[int]) -> int:
+        """배지들을 multi-row INSERT IGNORE 한 번으로 부여하고 새로 부여한 수를 반환 (이미 가진 배지는 0 row)"""
+        if not badge_ids:
+            return 0
+
+        stmt = insert(UserBadge).values([{"user_id": user_id, "badge_id": badge_id} for badge_id in badge_ids])
+        result = await session.execute(stmt.prefix_with("IGNORE"))
+        return result.rowcount  # type: ignore
+
+
+class UserBadgeStatsRepository(GenericRepository):
+    def __init__(self):
+        super().__init__(UserBadgeStats)
 
-    async def get_user_badge(self, session: AsyncSession, user_id: int, badge_id: int) -> UserBadge | None:
-        stmt = select(UserBadge).where(UserBadge.user_id == user_id, UserBadge.badge_id == badge_id)  # type: ignore
+    async def get_progress(self, session: AsyncSession, user_id: int) -> BadgeProgress:
+        """save_progress까지 같은 유저의 다른 완료 처리가 끼어들지 않도록 stats 행을 잠그고 읽는다"""
+        stmt = (
+            select(  # type: ignore
+                UserBadgeStats.current_streak,
+                UserBadgeStats.last_completed_date,
+                UserBadgeStats.total_completions,
+                UserBadgeStats.earned_badge_bits,
+            )
+            .where(UserBadgeStats.user_id == user_id)  # type: ignore
+            .with_for_update()
+        )
         result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        row = result.first()
+        if row is None:
+            return BadgeProgress()
+        return BadgeProgress(
+            current_streak=row[0], last_completed_date=row[1], total_completions=row[2], earned_badge_bits=row[3]
+        )
 
-    async def create_user_badge(self, session: AsyncSession, user_id: int, badge_id: int) -> None:
-        user_badge = UserBadge(user_id=user_id, badge_id=badge_id)
-        session.add(user_badge)
-        await session.flush()
+    async def save_progress(self, session: AsyncSession, user_id: int, progress: BadgeProgress) -> None:
+        stmt = insert(UserBadgeStats).values(
+            user_id=user_id,
+            current_streak=progress.current_streak,
+            last_completed_date=progress.last_completed_date,
+            total_completions=progress.total_completions,
+            earned_badge_bits=progress.earned_badge_bits,
+        )
+        stmt = stmt.on_duplicate_key_update(
+            current_streak=stmt.inserted.current_streak,
+            last_completed_date=stmt.inserted.last_completed_date,
+            total_completions=stmt.inserted.total_completions,
+            earned_badge_bits=stmt.inserted.earned_badge_bits,
+            updated_at=utc_now(),
+        )
+        await session.execute(stmt)
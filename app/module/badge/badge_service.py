@@ -1,20 +1,37 @@
+from datetime import datetime
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.module.badge.badge_repository import BadgeRepository
+from app.common.utils.time import to_kst, utc_now
+from app.module.badge.badge_repository import BadgeRepository, UserBadgeStatsRepository
+from app.module.badge.catalog import badge_catalog_cache
 from app.module.badge.enums import BadgeNames
+from app.module.badge.rules import evaluate_completion
 
 
 class BadgeService:
     def __init__(self):
         self.badge_repository = BadgeRepository()
+        self.user_badge_stats_repository = UserBadgeStatsRepository()
+        self.badge_catalog_cache = badge_catalog_cache
+
+    async def record_mission_completion(
+        self, session: AsyncSession, user_id: int, completed_at: datetime | None = None
+    ) -> list[BadgeNames]:
+        """미션 완료 한 건을 user_badge_stats에 반영하고 새로 조건을 만족한 배지를 한 번에 부여
 
-    async def initial_badge(self, session: AsyncSession, user_id: int):
-        badge = await self.badge_repository.get_badge_by_name(session, BadgeNames.FIRST_STEP)
-        if not badge:
-            return
+        보유 여부는 stats 행의 earned_badge_bits로, badge id는 프로세스 캐시(BadgeCatalog)로 확인하므로
+        부여할 배지가 없는 대부분의 완료는 stats 조회와 upsert 두 문장으로 끝난다.
+        """
+        progress = await self.user_badge_stats_repository.get_progress(session, user_id)
+        progress, earned = evaluate_completion(progress, to_kst(completed_at or utc_now()))
 
-        existing_user_badge = await self.badge_repository.get_user_badge(session, user_id, badge.id)
-        if existing_user_badge:
-            return
+        if earned:
+            catalog = await self.badge_catalog_cache.get(session)
+            # seed 전인 배지는 비트를 남기지 않아야 seed 이후 다음 완료에서 부여된다
+            earned = catalog.seeded(earned)
+            await self.badge_repository.grant_badges(session, user_id, catalog.get_ids(earned))
+            progress = progress.with_badges(earned)
 
-        await self.badge_repository.create_user_badge(session, user_id, badge.id)
+        await self.user_badge_stats_repository.save_progress(session, user_id, progress)
+        return earned
@@ -0,0 +1,63 @@
+import time
+from types import MappingProxyType
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.badge import Badge
+from app.module.badge.badge_repository import BadgeRepository
+from app.module.badge.constants import BADGE_CATALOG_VERSION_CHECK_INTERVAL_SEC
+from app.module.badge.enums import BadgeNames
+from app.module.catalog.catalog_repository import CatalogVersionRepository
+from app.module.catalog.enums import CatalogType
+
+
+class BadgeCatalog:
+    """seed_badge 실행 시에만 바뀌는 배지 목록의 BadgeNames -> badge id 스냅샷"""
+
+    def __init__(self, version: int, badges: list[Badge]):
+        self.version = version
+        known_names = set(BadgeNames)
+        self._ids_by_name = MappingProxyType(
+            {BadgeNames(badge.name): badge.id for badge in badges if badge.name in known_names}
+        )
+
+    def get_id(self, name: BadgeNames) -> int | None:
+        return self._ids_by_name.get(name)
+
+    def get_ids(self, names: list[BadgeNames]) -> list[int]:
+        """seed 된 배지의 id 목록. 아직 seed 되지 않은 배지는 건너뛴다"""
+        return [self._ids_by_name[name] for name in names if name in self._ids_by_name]
+
+    def seeded(self, names: list[BadgeNames]) -> list[BadgeNames]:
+        """아직 seed 되지 않은 배지를 뺀 이름 목록"""
+        return [name for name in names if name in self._ids_by_name]
+
+
+class BadgeCatalogCache:
+    """warm 컨테이너 동안 BadgeCatalog를 재사용하고, catalog_version이 바뀌면 다시 로드"""
+
+    def __init__(self):
+        self.badge_repository = BadgeRepository()
+        self.catalog_version_repository = CatalogVersionRepository()
+        self._catalog: BadgeCatalog | None = None
+        self._checked_at = 0.0
+
+    async def get(self, session: AsyncSession) -> BadgeCatalog:
+        now = time.monotonic()
+        if self._catalog is not None and now - self._checked_at < BADGE_CATALOG_VERSION_CHECK_INTERVAL_SEC:
+            return self._catalog
+
+        version = await self.catalog_version_repository.get_version(session, CatalogType.BADGE)
+        if self._catalog is None or self._catalog.version != version:
+            badges: list[Badge] = await self.badge_repository.find_all(session)
+            self._catalog = BadgeCatalog(version, badges)
+
+        self._checked_at = now
+        return self._catalog
+
+    def invalidate(self) -> None:
+        self._catalog = None
+        self._checked_at = 0.0
+
+
+badge_catalog_cache = BadgeCatalogCache()
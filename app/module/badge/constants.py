@@ -0,0 +1,20 @@
+# 연속 완료 일수 배지 기준
+THREE_DAY_STREAK = 3
+SEVEN_DAY_STREAK = 7
+FIFTEEN_DAY_STREAK = 15
+THIRTY_DAY_STREAK = 30
+
+# 누적 완료 수 배지 기준
+TEN_MISSIONS = 10
+THIRTY_MISSIONS = 30
+
+# 시간 배지 기준 (KST)
+FRIDAY_WEEKDAY = 4
+EARLY_MORNING_START_HOUR = 4
+EARLY_MORNING_END_HOUR = 7
+
+# backfill 시 한 번에 반영할 유저 수
+BADGE_BACKFILL_BATCH_USERS = 500
+
+# 배지 카탈로그 캐시가 catalog_version을 다시 확인하는 주기
+BADGE_CATALOG_VERSION_CHECK_INTERVAL_SEC = 30
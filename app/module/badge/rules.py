@@ -0,0 +1,129 @@
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta
+from typing import Callable
+
+from app.module.badge.constants import (
+    EARLY_MORNING_END_HOUR,
+    EARLY_MORNING_START_HOUR,
+    FIFTEEN_DAY_STREAK,
+    FRIDAY_WEEKDAY,
+    SEVEN_DAY_STREAK,
+    TEN_MISSIONS,
+    THIRTY_DAY_STREAK,
+    THIRTY_MISSIONS,
+    THREE_DAY_STREAK,
+)
+from app.module.badge.enums import BadgeNames
+
+# user_badge_stats.earned_badge_bits의 비트 위치. 저장된 값의 의미가 바뀌므로 기존 번호는 바꾸지 않고 뒤에만 추가한다
+BADGE_BIT_POSITIONS: dict[BadgeNames, int] = {
+    BadgeNames.FIRST_STEP: 0,
+    BadgeNames.THREE_DAY_STREAK: 1,
+    BadgeNames.SEVEN_DAY_STREAK: 2,
+    BadgeNames.FIFTEEN_DAY_STREAK: 3,
+    BadgeNames.THIRTY_DAY_STREAK: 4,
+    BadgeNames.TEN_MISSIONS: 5,
+    BadgeNames.THIRTY_MISSIONS: 6,
+    BadgeNames.FRIDAY: 7,
+    BadgeNames.EARLY_MORNING: 8,
+}
+
+
+def badge_bit(name: BadgeNames) -> int:
+    return 1 << BADGE_BIT_POSITIONS[name]
+
+
+@dataclass(frozen=True)
+class BadgeProgress:
+    """배지 규칙 평가에 필요한 유저별 누적 상태 (user_badge_stats 한 행)"""
+
+    current_streak: int = 0
+    last_completed_date: date | None = None
+    total_completions: int = 0
+    earned_badge_bits: int = 0
+
+    def has_badge(self, name: BadgeNames) -> bool:
+        return bool(self.earned_badge_bits & badge_bit(name))
+
+    def with_badges(self, names: list[BadgeNames]) -> "BadgeProgress":
+        bits = self.earned_badge_bits
+        for name in names:
+            bits |= badge_bit(name)
+        return replace(self, earned_badge_bits=bits)
+
+    def advance(self, completed_on: date) -> "BadgeProgress":
+        """미션 완료 한 건을 반영한 다음 상태. 같은 날 추가 완료는 연속 일수를 늘리지 않는다"""
+        last = self.last_completed_date
+        if last is None or completed_on - last > timedelta(days=1):
+            streak = 1
+        elif completed_on - last == timedelta(days=1):
+            streak = self.current_streak + 1
+        else:
+            # 같은 날이거나 순서가 뒤바뀐 과거 이벤트
+            streak = self.current_streak
+
+        return replace(
+            self,
+            current_streak=streak,
+            last_completed_date=max(last, completed_on) if last else completed_on,
+            total_completions=self.total_completions + 1,
+        )
+
+
+BadgeRule = Callable[[BadgeProgress, BadgeProgress, datetime], bool]
+
+
+def _streak_reached(days: int) -> BadgeRule:
+    return lambda before, after, _: after.current_streak >= days
+
+
+def _completions_reached(count: int) -> BadgeRule:
+    return lambda before, after, _: after.total_completions >= count
+
+
+def _completed_on_friday(before: BadgeProgress, after: BadgeProgress, completed_at: datetime) -> bool:
+    return completed_at.weekday() == FRIDAY_WEEKDAY
+
+
+def _completed_early_morning(before: BadgeProgress, after: BadgeProgress, completed_at: datetime) -> bool:
+    return EARLY_MORNING_START_HOUR <= completed_at.hour < EARLY_MORNING_END_HOUR
+
+
+BADGE_RULES: dict[BadgeNames, BadgeRule] = {
+    BadgeNames.FIRST_STEP: _completions_reached(1),
+    BadgeNames.THREE_DAY_STREAK: _streak_reached(THREE_DAY_STREAK),
+    BadgeNames.SEVEN_DAY_STREAK: _streak_reached(SEVEN_DAY_STREAK),
+    BadgeNames.FIFTEEN_DAY_STREAK: _streak_reached(FIFTEEN_DAY_STREAK),
+    BadgeNames.THIRTY_DAY_STREAK: _streak_reached(THIRTY_DAY_STREAK),
+    BadgeNames.TEN_MISSIONS: _completions_reached(TEN_MISSIONS),
+    BadgeNames.THIRTY_MISSIONS: _completions_reached(THIRTY_MISSIONS),
+    BadgeNames.FRIDAY: _completed_on_friday,
+    BadgeNames.EARLY_MORNING: _completed_early_morning,
+}
+
+
+def evaluate_completion(progress: BadgeProgress, completed_at_kst: datetime) -> tuple[BadgeProgress, list[BadgeNames]]:
+    """미션 완료 한 건으로 상태를 갱신하고 아직 없는 배지 중 조건을 만족한 배지 이름을 반환
+
+    규칙마다 이전/이후 상태만 비교하고 보유 여부는 earned_badge_bits로 확인하므로, 완료 이력 길이와 무관하게
+    O(배지 수)로 끝나며 대부분의 완료 이벤트에서는 부여할 배지가 없다.
+    반환한 배지의 비트는 실제로 부여한 뒤 호출 측에서 with_badges로 기록한다.
+    """
+    advanced = progress.advance(completed_at_kst.date())
+    earned = [
+        name
+        for name, rule in BADGE_RULES.items()
+        if not progress.has_badge(name) and rule(progress, advanced, completed_at_kst)
+    ]
+    return advanced, earned
+
+
+def replay_completions(completed_ats_kst: list[datetime]) -> tuple[BadgeProgress, set[BadgeNames]]:
+    """완료 이력을 시간순으로 다시 평가해 최종 상태와 지금까지 얻었어야 할 배지를 반환 (backfill용)"""
+    progress = BadgeProgress()
+    earned: set[BadgeNames] = set()
+    for completed_at in sorted(completed_ats_kst):
+        progress, names = evaluate_completion(progress, completed_at)
+        progress = progress.with_badges(names)
+        earned.update(names)
+    return progress, earned
@@ -0,0 +1,214 @@
+import time
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from app.common.enums import Timezone
+from app.model.badge import Badge
+from app.module.badge.badge_repository import UserBadgeStatsRepository
+from app.module.badge.badge_service import BadgeService
+from app.module.badge.catalog import BadgeCatalog, BadgeCatalogCache
+from app.module.badge.enums import BadgeNames
+from app.module.badge.rules import BadgeProgress, evaluate_completion, replay_completions
+from app.module.catalog.enums import CatalogType
+
+KST = Timezone.KST.get_zone_info()
+
+
+def make_badges(skip: Sequence[BadgeNames] = ()) -> list[Badge]:
+    return [
+        Badge(id=badge_id, category="", name=name, description="")
+        for badge_id, name in enumerate(BadgeNames, start=1)
+        if name not in skip
+    ]
+
+
+def make_catalog(skip: Sequence[BadgeNames] = ()) -> BadgeCatalog:
+    return BadgeCatalog(1, make_badges(skip))
+
+
+def kst(year: int, month: int, day: int, hour: int = 12) -> datetime:
+    return datetime(year, month, day, hour, tzinfo=KST)
+
+
+class TestBadgeProgress:
+    @pytest.mark.parametrize(
+        "last_completed_date, expected_streak",
+        [(None, 1), (date(2026, 10, 15), 4), (date(2026, 10, 16), 3), (date(2026, 10, 12), 1)],
+        ids=["first", "next_day", "same_day", "gap"],
+    )
+    def test_advance_streak(self, last_completed_date, expected_streak):
+        # given
+        progress = BadgeProgress(current_streak=3, last_completed_date=last_completed_date, total_completions=5)
+
+        # when
+        advanced = progress.advance(date(2026, 10, 16))
+
+        # then
+        assert advanced.current_streak == expected_streak
+        assert advanced.last_completed_date == date(2026, 10, 16)
+        assert advanced.total_completions == 6
+
+
+class TestEvaluateCompletion:
+    def test_first_completion_earns_first_step(self):
+        # when
+        progress, earned = evaluate_completion(BadgeProgress(), kst(2026, 10, 14))
+
+        # then
+        assert earned == [BadgeNames.FIRST_STEP]
+        assert progress == BadgeProgress(1, date(2026, 10, 14), 1)
+
+    def test_threshold_badges_are_skipped_once_earned(self):
+        # given
+        progress = BadgeProgress(2, date(2026, 10, 13), 9).with_badges([BadgeNames.FIRST_STEP])
+
+        # when
+        progress, crossed = evaluate_completion(progress, kst(2026, 10, 14))
+        _, after_earned = evaluate_completion(progress.with_badges(crossed), kst(2026, 10, 15))
+        _, not_recorded = evaluate_completion(progress, kst(2026, 10, 15))
+
+        # then
+        assert crossed == [BadgeNames.THREE_DAY_STREAK, BadgeNames.TEN_MISSIONS]
+        assert after_earned == []
+        assert not_recorded == [BadgeNames.THREE_DAY_STREAK, BadgeNames.TEN_MISSIONS]
+
+    @pytest.mark.parametrize(
+        "completed_at, expected",
+        [
+            (kst(2026, 10, 16, 12), [BadgeNames.FRIDAY]),
+            (kst(2026, 10, 14, 5), [BadgeNames.EARLY_MORNING]),
+            (kst(2026, 10, 14, 7), []),
+        ],
+        ids=["friday", "early_morning", "after_morning"],
+    )
+    def test_time_badges_use_kst_completion_time(self, completed_at, expected):
+        # given
+        progress = BadgeProgress(1, completed_at.date(), 1).with_badges([BadgeNames.FIRST_STEP])
+
+        # when
+        _, earned = evaluate_completion(progress, completed_at)
+
+        # then
+        assert earned == expected
+
+
+class TestReplayCompletions:
+    def test_replay_matches_incremental_evaluation(self):
+        # given
+        completed_ats = [kst(2026, 9, 1) + timedelta(days=i) for i in range(30)]
+
+        # when
+        progress, earned = replay_completions(list(reversed(completed_ats)))
+
+        # then
+        assert earned == set(BadgeNames) - {BadgeNames.EARLY_MORNING}
+        assert progress == BadgeProgress(30, date(2026, 9, 30), 30).with_badges(list(earned))
+
+
+class TestBadgeService:
+    @pytest.fixture
+    def service(self):
+        service = BadgeService()
+        service.user_badge_stats_repository = Mock()
+        service.user_badge_stats_repository.save_progress = AsyncMock()
+        service.badge_repository = Mock()
+        service.badge_repository.grant_badges = AsyncMock(return_value=1)
+        service.badge_catalog_cache = Mock()
+        service.badge_catalog_cache.get = AsyncMock(return_value=make_catalog(skip=[BadgeNames.THIRTY_MISSIONS]))
+        return service
+
+    @pytest.mark.asyncio
+    async def test_awards_seeded_badges_in_one_insert(self, service):
+        # given
+        session = Mock()
+        held = [BadgeNames.FIRST_STEP, BadgeNames.THREE_DAY_STREAK, BadgeNames.TEN_MISSIONS]
+        progress = BadgeProgress(6, date(2026, 10, 15), 29).with_badges(held)
+        service.user_badge_stats_repository.get_progress = AsyncMock(return_value=progress)
+
+        # when
+        earned = await service.record_mission_completion(
+            session, 1, datetime.fromisoformat("2026-10-16T03:00:00+00:00")
+        )
+
+        # then
+        assert earned == [BadgeNames.SEVEN_DAY_STREAK, BadgeNames.FRIDAY]
+        service.badge_repository.grant_badges.assert_awaited_once_with(session, 1, [3, 8])
+        service.user_badge_stats_repository.save_progress.assert_awaited_once_with(
+            session, 1, BadgeProgress(7, date(2026, 10, 16), 30).with_badges([*held, *earned])
+        )
+
+    @pytest.mark.asyncio
+    async def test_common_case_reads_nothing_but_stats(self, service):
+        # given
+        session = Mock()
+        progress = BadgeProgress(1, date(2026, 10, 13), 3).with_badges([BadgeNames.FIRST_STEP])
+        service.user_badge_stats_repository.get_progress = AsyncMock(return_value=progress)
+
+        # when
+        earned = await service.record_mission_completion(
+            session, 1, datetime.fromisoformat("2026-10-14T03:00:00+00:00")
+        )
+
+        # then
+        assert earned == []
+        service.badge_catalog_cache.get.assert_not_called()
+        service.badge_repository.grant_badges.assert_not_called()
+        service.user_badge_stats_repository.save_progress.assert_awaited_once()
+
+
+class TestUserBadgeStatsRepository:
+    @pytest.mark.asyncio
+    async def test_get_progress_locks_stats_row(self):
+        # given
+        session = Mock()
+        session.execute = AsyncMock(return_value=Mock(first=Mock(return_value=None)))
+
+        # when
+        progress = await UserBadgeStatsRepository().get_progress(session, 1)
+
+        # then
+        assert progress == BadgeProgress()
+        statement = str(session.execute.await_args.args[0].compile(dialect=mysql.dialect()))
+        assert statement.endswith("FOR UPDATE")
+
+
+class TestBadgeCatalog:
+    def test_get_ids_skips_unseeded_badges(self):
+        # given
+        catalog = make_catalog(skip=[BadgeNames.FRIDAY])
+
+        # when
+        badge_ids = catalog.get_ids([BadgeNames.FIRST_STEP, BadgeNames.FRIDAY])
+
+        # then
+        assert badge_ids == [1]
+
+
+class TestBadgeCatalogCache:
+    @pytest.mark.asyncio
+    async def test_reloads_only_when_version_changes(self):
+        # given
+        cache = BadgeCatalogCache()
+        cache.badge_repository = Mock()
+        cache.badge_repository.find_all = AsyncMock(return_value=make_badges())
+        cache.catalog_version_repository = Mock()
+        cache.catalog_version_repository.get_version = AsyncMock(return_value=1)
+        session = Mock()
+
+        # when
+        first = await cache.get(session)
+        cached = await cache.get(session)
+        with patch("app.module.badge.catalog.time.monotonic", return_value=time.monotonic() + 3600):
+            cache.catalog_version_repository.get_version.return_value = 2
+            reloaded = await cache.get(session)
+
+        # then
+        assert first is cached
+        assert reloaded is not first
+        assert reloaded.get_id(BadgeNames.FRIDAY) == 8
+        assert cache.badge_repository.find_all.await_count == 2
+        cache.catalog_version_repository.get_version.assert_awaited_with(session, CatalogType.BADGE)
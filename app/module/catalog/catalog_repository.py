@@ -0,0 +1,23 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.common.utils.time import utc_now
+from app.database.generic_repository import GenericRepository
+from app.model.catalog import CatalogVersion
+
+
+class CatalogVersionRepository(GenericRepository):
+    def __init__(self):
+        super().__init__(CatalogVersion)
+
+    async def get_version(self, session: AsyncSession, name: str) -> int:
+        stmt = select(CatalogVersion.version).where(CatalogVersion.name == name)  # type: ignore
+        result = await session.execute(stmt)
+        return result.scalar() or 0
+
+    async def bump_version(self, session: AsyncSession, name: str) -> None:
+        stmt = insert(CatalogVersion).values(name=name, version=1)
+        stmt = stmt.on_duplicate_key_update(version=CatalogVersion.version + 1, updated_at=utc_now())
+        await session.execute(stmt)
+        await session.flush()
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class CatalogType(StrEnum):
+    CHALLENGE = "challenge"
+    BADGE = "badge"
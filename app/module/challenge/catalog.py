@@ -0,0 +1,109 @@
+import time
+from types import MappingProxyType
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.challenge import Challenge, ChallengeMission, Mission
+from app.module.catalog.catalog_repository import CatalogVersionRepository
+from app.module.catalog.enums import CatalogType
+from app.module.challenge.challenge_repository import ChallengeRepository
+from app.module.challenge.constants import CATALOG_VERSION_CHECK_INTERVAL_SEC
+from app.module.challenge.errors import ChallengeNotFoundError, MissionDataIncompleteError
+
+
+class ChallengeCatalog:
+    """seed 실행 시에만 바뀌는 챌린지/미션 데이터의 불변 스냅샷"""
+
+    def __init__(
+        self,
+        version: int,
+        challenges: list[Challenge],
+        mission_pairs: dict[int, list[tuple[Mission, ChallengeMission]]],
+    ):
+        self.version = version
+        self.challenges: tuple[Challenge, ...] = tuple(challenges)
+        self._challenges_by_id = MappingProxyType({c.id: c for c in challenges})
+        self._missions_by_id = MappingProxyType(
+            {mission.id: mission for pairs in mission_pairs.values() for mission, _ in pairs}
+        )
+        self._missions_by_challenge = MappingProxyType(
+            {challenge_id: tuple(mission for mission, _ in pairs) for challenge_id, pairs in mission_pairs.items()}
+        )
+        self._challenge_missions_by_challenge = MappingProxyType(
+            {challenge_id: tuple(cm for _, cm in pairs) for challenge_id, pairs in mission_pairs.items()}
+        )
+
+    def get_challenge(self, challenge_id: int) -> Challenge:
+        challenge = self._challenges_by_id.get(challenge_id)
+        if not challenge:
+            raise ChallengeNotFoundError(challenge_id)
+        return challenge
+
+    def get_mission(self, mission_id: int) -> Mission | None:
+        return self._missions_by_id.get(mission_id)
+
+    def get_missions(self, challenge_id: int) -> list[Mission]:
+        missions = self._missions_by_challenge.get(challenge_id)
+        if not missions:
+            raise MissionDataIncompleteError(challenge_id)
+        return list(missions)
+
+    def get_challenge_missions(self, challenge_id: int) -> list[ChallengeMission]:
+        challenge_missions = self._challenge_missions_by_challenge.get(challenge_id)
+        if not challenge_missions:
+            raise MissionDataIncompleteError(challenge_id)
+        return list(challenge_missions)
+
+    def get_total_points(self, challenge_id: int) -> int:
+        return sum(mission.point for mission in self._missions_by_challenge.get(challenge_id, ()))
+
+
+class ChallengeCatalogCache:
+    """warm 컨테이너 동안 ChallengeCatalog를 재사용하고, catalog_version이 바뀌면 다시 로드"""
+
+    def __init__(self):
+        self.challenge_repository = ChallengeRepository()
+        self.catalog_version_repository = CatalogVersionRepository()
+        self._catalog: ChallengeCatalog | None = None
+        self._checked_at = 0.0
+
+    async def get(self, session: AsyncSession) -> ChallengeCatalog:
+        now = time.monotonic()
+        if self._catalog is not None and now - self._checked_at < CATALOG_VERSION_CHECK_INTERVAL_SEC:
+            return self._catalog
+
+        version = await self.catalog_version_repository.get_version(session, CatalogType.CHALLENGE)
+        if self._catalog is None or self._catalog.version != version:
+            self._catalog = await self._load(session, version)
+
+        self._checked_at = now
+        return self._catalog
+
+    def invalidate(self) -> None:
+        self._catalog = None
+        self._checked_at = 0.0
+
+    async def _load(self, session: AsyncSession, version: int) -> ChallengeCatalog:
+        challenges: list[Challenge] = await self.challenge_repository.find_all(session)
+        challenge_ids = [c.id for c in challenges]
+        challenges_with_missions = await self.challenge_repository.get_multiple_with_missions(session, challenge_ids)
+
+        mission_pairs: dict[int, list[tuple[Mission, ChallengeMission]]] = {}
+        for challenge_id, (_, missions, challenge_missions) in challenges_with_missions.items():
+            mission_pairs[challenge_id] = list(zip(missions, challenge_missions))
+
+        # 요청 세션이 rollback 되어도 캐시된 인스턴스가 expire 되지 않도록 분리
+        for challenge in challenges:
+            if challenge in session:
+                session.expunge(challenge)
+        for pairs in mission_pairs.values():
+            for mission, challenge_mission in pairs:
+                if mission in session:
+                    session.expunge(mission)
+                if challenge_mission in session:
+                    session.expunge(challenge_mission)
+
+        return ChallengeCatalog(version, challenges, mission_pairs)
+
+
+challenge_catalog_cache = ChallengeCatalogCache()
@@ -1,55 +1,18 @@
-from sqlalchemy import func, select
+from sqlalchemy import and_, case, func, select, update
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.common.utils.time import utc_now
 from app.database.generic_repository import GenericRepository
-from app.model.challenge import Challenge, ChallengeMission, Mission
+from app.model.challenge import Challenge, ChallengeMission, Mission, MissionHeadcount
 from app.model.user_challenge import UserChallenge, UserMission
 from app.module.challenge.enums import ChallengeStatusType, MissionStatusType
-from app.module.challenge.errors import ChallengeNotFoundError, MissionDataIncompleteError
 
 
 class ChallengeRepository(GenericRepository):
     def __init__(self):
         super().__init__(Challenge)
 
-    async def get_missions_by_challenge(self, session: AsyncSession, challenge_id: int) -> list[Mission]:
-        missions_stmt = (
-            select(Mission).join(ChallengeMission).where(ChallengeMission.challenge_id == challenge_id)  # type: ignore
-        )
-        missions_result = await session.execute(missions_stmt)
-        missions = list(missions_result.scalars().all())
-
-        if not missions:
-            raise MissionDataIncompleteError(challenge_id)
-
-        return missions
-
-    async def get_challenge_missions(self, session: AsyncSession, challenge_id: int) -> list[ChallengeMission]:
-        cm_stmt = (
-            select(ChallengeMission)
-            .where(ChallengeMission.challenge_id == challenge_id)  # type: ignore
-            .order_by(ChallengeMission.step)  # type: ignore
-        )
-        cm_result = await session.execute(cm_stmt)
-        challenge_missions = list(cm_result.scalars().all())
-
-        if not challenge_missions:
-            raise MissionDataIncompleteError(challenge_id)
-
-        return challenge_missions
-
-    async def get_with_missions(
-        self, session: AsyncSession, challenge_id: int
-    ) -> tuple[Challenge, list[Mission], list[ChallengeMission]]:
-        challenge = await self.get_by_id(session, challenge_id)  # type: ignore
-        if not challenge:
-            raise ChallengeNotFoundError(challenge_id)
-
-        missions = await self.get_missions_by_challenge(session, challenge_id)
-        challenge_missions = await self.get_challenge_missions(session, challenge_id)
-
-        return challenge, missions, challenge_missions
-
     async def get_multiple_with_missions(
         self, session: AsyncSession, challenge_ids: list[int]
     ) -> dict[int, tuple[Challenge, list[Mission], list[ChallengeMission]]]:
@@ -93,15 +56,39 @@ class MissionRepository(GenericRepository):
     def __init__(self):
         super().__init__(Mission)
 
-    async def count_participants(
-        self, session: AsyncSession, mission_id: int, status: str = MissionStatusType.IN_PROGRESS
-    ) -> int:
-        stmt = select(func.count(UserMission.id)).where(  # type: ignore
-            UserMission.mission_id == mission_id, UserMission.status == status  # type: ignore
+    async def count_participants_by_mission(
+        self, session: AsyncSession, status: str = MissionStatusType.IN_PROGRESS
+    ) -> dict[int, int]:
+        stmt = (
+            select(UserMission.mission_id, func.count(UserMission.id))  # type: ignore
+            .where(UserMission.status == status)  # type: ignore
+            .group_by(UserMission.mission_id)  # type: ignore
         )
         result = await session.execute(stmt)
+        return {mission_id: count for mission_id, count in result.all()}
+
+    async def get_headcount(self, session: AsyncSession, mission_id: int) -> int:
+        """mission_headcount 테이블에서 PK로 진행 중인 인원 조회"""
+        stmt = select(MissionHeadcount.headcount).where(MissionHeadcount.mission_id == mission_id)  # type: ignore
+        result = await session.execute(stmt)
         return result.scalar() or 0
 
+    async def get_all_headcounts(self, session: AsyncSession) -> dict[int, int]:
+        result = await session.execute(select(MissionHeadcount.mission_id, MissionHeadcount.headcount))  # type: ignore
+        return {mission_id: headcount for mission_id, headcount in result.all()}
+
+    async def increment_headcount(self, session: AsyncSession, mission_id: int, amount: int = 1) -> None:
+        stmt = insert(MissionHeadcount).values(mission_id=mission_id, headcount=max(amount, 0))
+        stmt = stmt.on_duplicate_key_update(
+            headcount=func.greatest(MissionHeadcount.headcount + amount, 0), updated_at=utc_now()
+        )
+        await session.execute(stmt)
+
+    async def set_headcount(self, session: AsyncSession, mission_id: int, headcount: int) -> None:
+        stmt = insert(MissionHeadcount).values(mission_id=mission_id, headcount=headcount)
+        stmt = stmt.on_duplicate_key_update(headcount=headcount, updated_at=utc_now())
+        await session.execute(stmt)
+
 
 class UserChallengeRepository(GenericRepository):
     def __init__(self):
@@ -110,8 +97,45 @@ class UserChallengeRepository(GenericRepository):
     async def get_current_challenge(self, session: AsyncSession, user_id: int) -> UserChallenge | None:
         return await self.find_one(session, user_id=user_id, status=ChallengeStatusType.IN_PROGRESS)
 
-    async def get_completed_challenges(self, session: AsyncSession, user_id: int) -> list[UserChallenge]:
-        return await self.find_all(session, user_id=user_id, status=ChallengeStatusType.COMPLETED)
+    async def get_home_summary_rows(
+        self, session: AsyncSession, user_id: int
+    ) -> list[tuple[UserChallenge, Challenge, ChallengeMission, Mission, UserMission | None, int | None]]:
+        """홈 화면에 필요한 진행 중/완료 챌린지와 미션, 참여 인원을 한 번의 쿼리로 조회"""
+        headcount = case(
+            (
+                and_(
+                    UserChallenge.status == ChallengeStatusType.IN_PROGRESS,  # type: ignore
+                    UserMission.status == MissionStatusType.IN_PROGRESS,  # type: ignore
+                ),
+                func.coalesce(MissionHeadcount.headcount, 0),
+            ),
+            else_=None,
+        )
+
+        stmt = (
+            select(UserChallenge, Challenge, ChallengeMission, Mission, UserMission, headcount)  # type: ignore
+            .join(Challenge, Challenge.id == UserChallenge.challenge_id)  # type: ignore
+            .join(ChallengeMission, ChallengeMission.challenge_id == Challenge.id)  # type: ignore
+            .join(Mission, Mission.id == ChallengeMission.mission_id)  # type: ignore
+            .outerjoin(
+                UserMission,
+                and_(
+                    UserMission.user_challenge_id == UserChallenge.id,  # type: ignore
+                    UserMission.mission_id == Mission.id,  # type: ignore
+                ),
+            )
+            .outerjoin(MissionHeadcount, MissionHeadcount.mission_id == UserMission.mission_id)  # type: ignore
+            .where(
+                UserChallenge.user_id == user_id,  # type: ignore
+                UserChallenge.status.in_(  # type: ignore
+                    [ChallengeStatusType.IN_PROGRESS, ChallengeStatusType.COMPLETED]
+                ),
+            )
+            .order_by(UserChallenge.id, ChallengeMission.step)  # type: ignore
+        )
+
+        result = await session.execute(stmt)
+        return [tuple(row) for row in result.all()]  # type: ignore
 
     async def create_with_missions(
         self,
@@ -127,50 +151,65 @@ class UserChallengeRepository(GenericRepository):
             challenge_id=challenge_id,
             status=ChallengeStatusType.IN_PROGRESS,
             mission_step=initial_step,
+            mission_count=len(challenge_missions),
         )
 
-        user_mission_repo = UserMissionRepository()
-        for cm in challenge_missions:
-            status = MissionStatusType.IN_PROGRESS if cm.step == initial_step else MissionStatusType.NOT_STARTED
-            await user_mission_repo.create(
-                session,
-                user_challenge_id=user_challenge.id,  # type: ignore
-                mission_id=cm.mission_id,
-                status=status,
-                point=0,
-            )
+        user_mission_rows = [
+            {
+                "user_challenge_id": user_challenge.id,
+                "mission_id": cm.mission_id,
+                "status": MissionStatusType.IN_PROGRESS if cm.step == initial_step else MissionStatusType.NOT_STARTED,
+                "point": 0,
+            }
+            for cm in challenge_missions
+        ]
+        await UserMissionRepository().bulk_create(session, user_mission_rows)
+
+        mission_repo = MissionRepository()
+        for row in user_mission_rows:
+            if row["status"] == MissionStatusType.IN_PROGRESS:
+                await mission_repo.increment_headcount(session, row["mission_id"])
 
         await session.commit()
-        await session.refresh(user_challenge)
 
         return user_challenge  # type: ignore
 
+    async def increment_completed_missions(self, session: AsyncSession, user_challenge_id: int) -> None:
+        """완료 미션 카운터를 올리고, 마지막 미션이면 같은 UPDATE에서 챌린지를 완료 처리
+
+        MySQL은 SET 절을 왼쪽부터 적용하므로 status를 먼저 두어 증가 전 카운터로 판단한다.
+        """
+        is_last_mission = UserChallenge.completed_mission_count + 1 >= UserChallenge.mission_count
+        stmt = (
+            update(UserChallenge)
+            .where(UserChallenge.id == user_challenge_id)  # type: ignore
+            .ordered_values(
+                (
+                    UserChallenge.status,
+                    case((is_last_mission, ChallengeStatusType.COMPLETED), else_=UserChallenge.status),  # type: ignore
+                ),
+                (UserChallenge.completed_mission_count, UserChallenge.completed_mission_count + 1),  # type: ignore
+            )
+        )
+        await session.execute(stmt)
+
 
 class UserMissionRepository(GenericRepository):
     def __init__(self):
         super().__init__(UserMission)
 
-    async def get_missions_by_user_challenge(self, session: AsyncSession, user_challenge_id: int) -> list[UserMission]:
-        return await self.find_all(session, user_challenge_id=user_challenge_id)
-
-    async def get_missions_by_user_challenges_batch(
-        self, session: AsyncSession, user_challenge_ids: list[int]
-    ) -> dict[int, list[UserMission]]:
-        """여러 유저 챌린지의 미션 데이터를 배치로 조회"""
-        if not user_challenge_ids:
-            return {}
-
-        stmt = select(UserMission).where(UserMission.user_challenge_id.in_(user_challenge_ids))  # type: ignore
+    async def complete_mission(self, session: AsyncSession, user_mission_id: int, post_id: int) -> bool:
+        """진행 중인 미션만 PK로 바로 완료 처리하고 처리 여부 반환 (사전 SELECT 없음)"""
+        stmt = (
+            update(UserMission)
+            .where(
+                UserMission.id == user_mission_id,  # type: ignore
+                UserMission.status == MissionStatusType.IN_PROGRESS,  # type: ignore
+            )
+            .values(status=MissionStatusType.COMPLETED, post_id=post_id, completed_at=utc_now())
+        )
         result = await session.execute(stmt)
-        all_user_missions = result.scalars().all()
-
-        grouped: dict[int, list[UserMission]] = {}
-        for um in all_user_missions:
-            if um.user_challenge_id not in grouped:
-                grouped[um.user_challenge_id] = []
-            grouped[um.user_challenge_id].append(um)
-
-        return grouped
+        return result.rowcount == 1  # type: ignore
 
     async def get_user_mission_in_progress(
         self, session: AsyncSession, user_id: int, mission_id: int
@@ -1 +1,2 @@
 FIRST_MISSION_STEP = 1
+CATALOG_VERSION_CHECK_INTERVAL_SEC = 30
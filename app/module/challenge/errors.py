@@ -66,3 +66,11 @@ class ChallengeAlreadyCompletedError(ChallengeError):
         self.user_id = user_id
         self.challenge_id = challenge_id
         super().__init__(f"사용자 {user_id}는 이미 챌린지 {challenge_id}를 완료했습니다.")
+
+
+class InvalidPostCursorError(ChallengeError):
+    status_code: int = status.HTTP_400_BAD_REQUEST
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"잘못된 게시물 커서입니다: {cursor}")
@@ -1,7 +1,8 @@
-from app.api.challenge.v1.schema import ChallengeSummary, MissionBasic, MissionSummary
+from app.api.challenge.v1.schema import ChallengeInfoResponse, ChallengeSummary, MissionBasic, MissionSummary
 from app.model.challenge import Challenge, ChallengeMission, Mission
 from app.model.user_challenge import UserChallenge, UserMission
 from app.module.challenge.enums import MissionStatusType
+from app.module.challenge.schema import HomeSummaryData
 
 
 class ChallengeSerializer:
@@ -14,12 +15,13 @@ class ChallengeSerializer:
         user_missions: list[UserMission],
     ) -> ChallengeSummary:
         user_mission_dict = {um.mission_id: um for um in user_missions} if user_missions else {}
+        mission_dict = {m.id: m for m in missions}
 
         mission_basics: list[MissionBasic] = []
         total_points = 0
 
         for cm in challenge_missions:
-            mission = next((m for m in missions if m.id == cm.mission_id), None)
+            mission = mission_dict.get(cm.mission_id, None)
             if not mission:
                 raise ValueError(f"연동 된 미션 id {cm.mission_id}을 찾는데 실패 했습니다.")
 
@@ -56,9 +58,10 @@ class ChallengeSerializer:
         headcount: int | None = None,
     ) -> MissionSummary | None:
         user_mission_dict = {um.mission_id: um for um in user_missions} if user_missions else {}
+        mission_dict = {m.id: m for m in missions}
 
         for cm in challenge_missions:
-            mission = next((m for m in missions if m.id == cm.mission_id), None)
+            mission = mission_dict.get(cm.mission_id, None)
             if not mission:
                 raise ValueError(f"연동 된 미션 id {cm.mission_id}을 찾는데 실패 했습니다.")
 
@@ -90,12 +93,13 @@ class ChallengeSerializer:
         user_missions: list[UserMission],
     ) -> ChallengeSummary:
         user_mission_dict = {um.mission_id: um for um in user_missions} if user_missions else {}
+        mission_dict = {m.id: m for m in missions}
 
         mission_basics: list[MissionBasic] = []
         total_points = 0
 
         for cm in challenge_missions:
-            mission = next((m for m in missions if m.id == cm.mission_id), None)
+            mission = mission_dict.get(cm.mission_id, None)
             if not mission:
                 raise ValueError(f"연동 된 미션 id {cm.mission_id}을 찾는데 실패 했습니다.")
 
@@ -122,3 +126,36 @@ class ChallengeSerializer:
             missions=mission_basics,
             total_points=total_points,
         )
+
+    @staticmethod
+    def to_challenge_info_response(home_summary: HomeSummaryData) -> ChallengeInfoResponse:
+        current_challenge = None
+        current_mission = None
+        current_data = home_summary.current_challenge
+        if current_data:
+            current_challenge = ChallengeSerializer.to_challenge_summary(
+                current_data.challenge,
+                current_data.missions,
+                current_data.challenge_missions,
+                current_data.user_challenge,
+                current_data.user_missions,
+            )
+            current_mission = ChallengeSerializer.to_current_mission_summary(
+                current_data.missions,
+                current_data.challenge_missions,
+                current_data.user_missions,
+                current_data.headcount,
+            )
+
+        completed_challenges = [
+            ChallengeSerializer.to_challenge_summary(
+                data.challenge, data.missions, data.challenge_missions, data.user_challenge, data.user_missions
+            )
+            for data in home_summary.completed_challenges
+        ]
+
+        return ChallengeInfoResponse(
+            current_mission=current_mission,
+            current_challenge=current_challenge,
+            completed_challenges=completed_challenges or None,
+        )
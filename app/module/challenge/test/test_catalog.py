@@ -0,0 +1,111 @@
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.challenge import Challenge, ChallengeMission, Mission
+from app.module.challenge.catalog import ChallengeCatalog, ChallengeCatalogCache
+from app.module.challenge.errors import ChallengeNotFoundError, MissionDataIncompleteError
+
+
+@pytest.fixture
+def challenge():
+    return Challenge(id=1, title="챌린지", description="설명", goal=2)
+
+
+@pytest.fixture
+def mission_pairs():
+    return [
+        (
+            Mission(id=10, title="미션 1", description="설명", type="photo", point=100),
+            ChallengeMission(id=1, challenge_id=1, mission_id=10, step=1),
+        ),
+        (
+            Mission(id=11, title="미션 2", description="설명", type="photo", point=200),
+            ChallengeMission(id=2, challenge_id=1, mission_id=11, step=2),
+        ),
+    ]
+
+
+@pytest.fixture
+def catalog_cache(challenge, mission_pairs):
+    cache = ChallengeCatalogCache()
+    cache.challenge_repository = Mock()
+    cache.challenge_repository.find_all = AsyncMock(return_value=[challenge])
+    cache.challenge_repository.get_multiple_with_missions = AsyncMock(
+        return_value={1: (challenge, [m for m, _ in mission_pairs], [cm for _, cm in mission_pairs])}
+    )
+    cache.catalog_version_repository = Mock()
+    cache.catalog_version_repository.get_version = AsyncMock(return_value=1)
+    return cache
+
+
+@pytest.fixture
+def mock_session():
+    return MagicMock(spec=AsyncSession)
+
+
+class TestChallengeCatalog:
+    def test_lookups(self, challenge, mission_pairs):
+        # given
+        catalog = ChallengeCatalog(1, [challenge], {1: mission_pairs})
+
+        # when & then
+        assert catalog.get_challenge(1) is challenge
+        assert catalog.get_mission(11).title == "미션 2"
+        assert [cm.step for cm in catalog.get_challenge_missions(1)] == [1, 2]
+        assert [m.id for m in catalog.get_missions(1)] == [10, 11]
+        assert catalog.get_total_points(1) == 300
+        assert catalog.get_mission(99) is None
+
+    def test_missing_data(self, challenge):
+        # given
+        catalog = ChallengeCatalog(1, [challenge], {})
+
+        # when & then
+        with pytest.raises(ChallengeNotFoundError):
+            catalog.get_challenge(2)
+        with pytest.raises(MissionDataIncompleteError):
+            catalog.get_challenge_missions(1)
+
+
+class TestChallengeCatalogCache:
+    @pytest.mark.asyncio
+    async def test_loads_once_within_check_interval(self, catalog_cache, mock_session):
+        # when
+        first = await catalog_cache.get(mock_session)
+        second = await catalog_cache.get(mock_session)
+
+        # then
+        assert first is second
+        catalog_cache.catalog_version_repository.get_version.assert_awaited_once()
+        catalog_cache.challenge_repository.find_all.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_same_version_skips_reload(self, catalog_cache, mock_session):
+        # given
+        with patch("app.module.challenge.catalog.time.monotonic", side_effect=[0.0, 1000.0]):
+            first = await catalog_cache.get(mock_session)
+
+            # when
+            second = await catalog_cache.get(mock_session)
+
+        # then
+        assert first is second
+        assert catalog_cache.catalog_version_repository.get_version.await_count == 2
+        catalog_cache.challenge_repository.find_all.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_version_bump_triggers_reload(self, catalog_cache, mock_session):
+        # given
+        with patch("app.module.challenge.catalog.time.monotonic", side_effect=[0.0, 1000.0]):
+            first = await catalog_cache.get(mock_session)
+            catalog_cache.catalog_version_repository.get_version = AsyncMock(return_value=2)
+
+            # when
+            second = await catalog_cache.get(mock_session)
+
+        # then
+        assert first is not second
+        assert second.version == 2
+        assert catalog_cache.challenge_repository.find_all.await_count == 2
@@ -0,0 +1,78 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.challenge import ChallengeMission
+from app.module.challenge.challenge_repository import (
+    MissionRepository,
+    UserChallengeRepository,
+    UserMissionRepository,
+)
+from app.module.challenge.enums import MissionStatusType
+
+
+@pytest.fixture
+def mock_session():
+    session = AsyncMock(spec=AsyncSession)
+    session.add = MagicMock()
+    return session
+
+
+class TestUserChallengeRepository:
+    @pytest.mark.asyncio
+    async def test_create_with_missions_uses_two_inserts(self, mock_session):
+        # given
+        challenge_missions = [
+            ChallengeMission(id=step, challenge_id=1, mission_id=10 + step, step=step) for step in range(1, 8)
+        ]
+        mock_result = MagicMock()
+        mock_result.lastrowid = 100
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        # when
+        with patch.object(MissionRepository, "increment_headcount", AsyncMock()) as increment_headcount:
+            await UserChallengeRepository().create_with_missions(mock_session, 1, 1, challenge_missions, 1)
+
+        # then
+        mock_session.add.assert_called_once()
+        mock_session.flush.assert_awaited_once()
+        mock_session.execute.assert_awaited_once()
+        mock_session.refresh.assert_not_awaited()
+
+        insert_stmt = mock_session.execute.await_args.args[0]
+        params = insert_stmt.compile().params
+        statuses = [params[f"status_m{i}"] for i in range(7)]
+        assert statuses == [MissionStatusType.IN_PROGRESS] + [MissionStatusType.NOT_STARTED] * 6
+        increment_headcount.assert_awaited_once_with(mock_session, 11)
+
+
+class TestMissionCompletionCounters:
+    @pytest.mark.asyncio
+    async def test_complete_mission_updates_by_primary_key(self, mock_session):
+        # given
+        mock_session.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+
+        # when
+        completed = await UserMissionRepository().complete_mission(mock_session, user_mission_id=10, post_id=3)
+
+        # then
+        sql = str(mock_session.execute.await_args.args[0].compile(dialect=mysql.dialect()))
+        assert completed is True
+        assert sql.startswith("UPDATE user_mission SET")
+        assert "WHERE user_mission.id = %s AND user_mission.status = %s" in sql
+
+    @pytest.mark.asyncio
+    async def test_increment_completed_missions_decides_status_before_counter(self, mock_session):
+        # when
+        await UserChallengeRepository().increment_completed_missions(mock_session, user_challenge_id=1)
+
+        # then
+        sql = str(mock_session.execute.await_args.args[0].compile(dialect=mysql.dialect()))
+        status_at = sql.index(
+            "status=CASE WHEN (user_challenge.completed_mission_count + %s >= user_challenge.mission_count)"
+        )
+        counter_at = sql.index("completed_mission_count=(user_challenge.completed_mission_count + %s)")
+        assert status_at < counter_at
+        assert sql.endswith("WHERE user_challenge.id = %s")
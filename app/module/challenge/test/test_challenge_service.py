@@ -0,0 +1,160 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+
+import app.model  # noqa: F401
+from app.model.challenge import Challenge, ChallengeMission, Mission, MissionHeadcount
+from app.model.user import User
+from app.model.user_challenge import UserChallenge, UserMission
+from app.module.challenge.challenge_service import ChallengeService
+from app.module.challenge.enums import ChallengeStatusType, MissionStatusType
+from app.module.challenge.serializers import ChallengeSerializer
+
+
+@pytest.fixture
+def challenge_service():
+    with patch("app.module.challenge.challenge_service.PostService"):
+        return ChallengeService()
+
+
+@pytest.fixture
+def mock_session():
+    return AsyncMock(spec=AsyncSession)
+
+
+def make_rows(user_challenge: UserChallenge, challenge: Challenge, statuses: list[str], headcount: int | None = None):
+    rows = []
+    for step, status in enumerate(statuses, start=1):
+        mission_id = challenge.id * 10 + step
+        mission = Mission(id=mission_id, title=f"미션 {step}", description="설명", type="photo", point=100)
+        challenge_mission = ChallengeMission(id=mission_id, challenge_id=challenge.id, mission_id=mission_id, step=step)
+        user_mission = UserMission(
+            id=mission_id, user_challenge_id=user_challenge.id, mission_id=mission_id, status=status, point=0
+        )
+        row_headcount = headcount if status == MissionStatusType.IN_PROGRESS else None
+        rows.append((user_challenge, challenge, challenge_mission, mission, user_mission, row_headcount))
+    return rows
+
+
+class TestChallengeService:
+    @pytest.mark.asyncio
+    async def test_get_home_summary_single_query(self, challenge_service, mock_session):
+        # given
+        completed_challenge = Challenge(id=1, title="완료 챌린지", description="설명", goal=2)
+        completed_user_challenge = UserChallenge(
+            id=1, user_id=1, challenge_id=1, status=ChallengeStatusType.COMPLETED, mission_step=2
+        )
+        current_challenge = Challenge(id=2, title="진행 챌린지", description="설명", goal=3)
+        current_user_challenge = UserChallenge(
+            id=2, user_id=1, challenge_id=2, status=ChallengeStatusType.IN_PROGRESS, mission_step=2
+        )
+        rows = make_rows(
+            completed_user_challenge, completed_challenge, [MissionStatusType.COMPLETED, MissionStatusType.COMPLETED]
+        ) + make_rows(
+            current_user_challenge,
+            current_challenge,
+            [MissionStatusType.COMPLETED, MissionStatusType.IN_PROGRESS, MissionStatusType.NOT_STARTED],
+            headcount=5,
+        )
+        result = MagicMock()
+        result.all.return_value = rows
+        mock_session.execute = AsyncMock(return_value=result)
+
+        # when
+        home_summary = await challenge_service.get_home_summary(mock_session, 1)
+
+        # then
+        assert mock_session.execute.await_count == 1
+        assert home_summary.current_challenge is not None
+        assert home_summary.current_challenge.headcount == 5
+        assert [cm.step for cm in home_summary.current_challenge.challenge_missions] == [1, 2, 3]
+        assert len(home_summary.completed_challenges) == 1
+        assert home_summary.completed_challenges[0].challenge.id == 1
+
+        response = ChallengeSerializer.to_challenge_info_response(home_summary)
+        assert response.current_mission is not None
+        assert response.current_mission.id == 22
+        assert response.current_mission.headcount == 5
+        assert response.current_challenge is not None
+        assert response.current_challenge.total_points == 300
+        assert response.completed_challenges is not None
+        assert [c.id for c in response.completed_challenges] == [1]
+
+    @pytest.mark.asyncio
+    async def test_get_home_summary_without_challenges(self, challenge_service, mock_session):
+        # given
+        result = MagicMock()
+        result.all.return_value = []
+        mock_session.execute = AsyncMock(return_value=result)
+
+        # when
+        home_summary = await challenge_service.get_home_summary(mock_session, 1)
+
+        # then
+        assert mock_session.execute.await_count == 1
+        response = ChallengeSerializer.to_challenge_info_response(home_summary)
+        assert response.current_challenge is None
+        assert response.current_mission is None
+        assert response.completed_challenges is None
+
+
+class TestHomeSummaryOnDatabase:
+    @pytest_asyncio.fixture
+    async def engine(self):
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        async with async_sessionmaker(engine)() as session:
+            session.add(User(id=1, provider="kakao", social_id="social_1"))
+            session.add_all(
+                [Challenge(id=1, title="완료", description="", goal=2), Challenge(id=2, title="진행", description="")]
+            )
+            session.add_all(
+                [Mission(id=i, title=f"미션{i}", description="", type="photo", point=100) for i in range(1, 6)]
+            )
+            session.add_all(
+                [ChallengeMission(challenge_id=1, mission_id=i, step=i) for i in (1, 2)]
+                + [ChallengeMission(challenge_id=2, mission_id=i, step=i - 2) for i in (3, 4, 5)]
+            )
+            session.add_all(
+                [
+                    UserChallenge(id=1, user_id=1, challenge_id=1, status=ChallengeStatusType.COMPLETED),
+                    UserChallenge(id=2, user_id=1, challenge_id=2, status=ChallengeStatusType.IN_PROGRESS),
+                ]
+            )
+            statuses = [MissionStatusType.COMPLETED] * 3 + [
+                MissionStatusType.IN_PROGRESS,
+                MissionStatusType.NOT_STARTED,
+            ]
+            session.add_all(
+                [
+                    UserMission(user_challenge_id=1 if i <= 2 else 2, mission_id=i, status=status)
+                    for i, status in enumerate(statuses, start=1)
+                ]
+            )
+            session.add(MissionHeadcount(mission_id=4, headcount=7))
+            await session.commit()
+        yield engine
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_executes_single_statement(self, challenge_service, engine):
+        # given
+        statements: list[str] = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        # when
+        async with async_sessionmaker(engine)() as session:
+            home_summary = await challenge_service.get_home_summary(session, 1)
+
+        # then
+        assert len(statements) == 1, statements
+        assert home_summary.current_challenge is not None
+        assert home_summary.current_challenge.headcount == 7
+        assert [cm.step for cm in home_summary.current_challenge.challenge_missions] == [1, 2, 3]
+        assert [c.challenge.id for c in home_summary.completed_challenges] == [1]
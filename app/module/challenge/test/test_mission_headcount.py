@@ -0,0 +1,49 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.data.challenge.reconcile_mission_headcount import reconcile_mission_headcounts
+
+
+@pytest.fixture
+def mock_session():
+    return AsyncMock(spec=AsyncSession)
+
+
+class TestReconcileMissionHeadcounts:
+    @pytest.mark.asyncio
+    async def test_fixes_only_drifted_missions(self, mock_session):
+        # given
+        with patch("app.data.challenge.reconcile_mission_headcount.MissionRepository") as mock_repository_class:
+            mission_repository = mock_repository_class.return_value
+            mission_repository.count_participants_by_mission = AsyncMock(return_value={1: 3, 2: 5})
+            mission_repository.get_all_headcounts = AsyncMock(return_value={1: 3, 2: 4, 3: 1})
+            mission_repository.set_headcount = AsyncMock()
+
+            # when
+            drifted = await reconcile_mission_headcounts(mock_session)
+
+        # then
+        assert drifted == {2: (4, 5), 3: (1, 0)}
+        assert mission_repository.set_headcount.await_count == 2
+        mission_repository.set_headcount.assert_any_await(mock_session, 2, 5)
+        mission_repository.set_headcount.assert_any_await(mock_session, 3, 0)
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_dry_run_does_not_write(self, mock_session):
+        # given
+        with patch("app.data.challenge.reconcile_mission_headcount.MissionRepository") as mock_repository_class:
+            mission_repository = mock_repository_class.return_value
+            mission_repository.count_participants_by_mission = AsyncMock(return_value={1: 2})
+            mission_repository.get_all_headcounts = AsyncMock(return_value={})
+            mission_repository.set_headcount = AsyncMock()
+
+            # when
+            drifted = await reconcile_mission_headcounts(mock_session, dry_run=True)
+
+        # then
+        assert drifted == {1: (0, 2)}
+        mission_repository.set_headcount.assert_not_awaited()
+        mock_session.commit.assert_not_awaited()
@@ -1 +1,17 @@
 PRESIGNED_URL_EXPIRE_SEC = 60 * 60
+# 남은 유효 시간이 이 값보다 길 때만 캐시된 presigned URL을 재사용
+PRESIGNED_URL_MIN_REMAINING_SEC = PRESIGNED_URL_EXPIRE_SEC // 2
+PRESIGNED_URL_CACHE_MAX_SIZE = 10_000
+# 조회용 presigned URL에 붙는 S3 응답 헤더 override (boto3 Params의 ResponseContentType/ResponseContentDisposition)
+VIEW_URL_QUERY_PARAMS = {"response-content-type": "image/jpeg", "response-content-disposition": "inline"}
+
+# 게시물 이미지 confirmed 태그를 일괄로 붙일 때의 put_object_tagging 동시 호출 수와 키별 재시도
+IMAGE_CONFIRM_CONCURRENCY = 16
+IMAGE_CONFIRM_MAX_ATTEMPTS = 3
+IMAGE_CONFIRM_RETRY_BASE_DELAY_SEC = 0.2
+# throttling, 일시적인 서버 오류처럼 잠시 뒤 다시 시도하면 되는 S3 오류 코드 (5xx 응답도 재시도)
+IMAGE_CONFIRM_RETRYABLE_ERROR_CODES = frozenset(
+    {"SlowDown", "Throttling", "ThrottlingException", "RequestTimeout", "InternalError", "ServiceUnavailable"}
+)
+# 기존 post_image를 outbox에 적재할 때 한 번에 커밋하는 이미지 수
+IMAGE_CONFIRM_BACKFILL_BATCH_SIZE = 1000
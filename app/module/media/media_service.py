@@ -1,27 +1,83 @@
+import logging
 import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-import boto3
-from botocore.exceptions import ClientError
-from mypy_boto3_s3 import S3Client
+from botocore.exceptions import BotoCoreError, ClientError
 
-from app.module.media.constants import PRESIGNED_URL_EXPIRE_SEC
+from app.module.media.constants import (
+    IMAGE_CONFIRM_CONCURRENCY,
+    IMAGE_CONFIRM_MAX_ATTEMPTS,
+    IMAGE_CONFIRM_RETRY_BASE_DELAY_SEC,
+    IMAGE_CONFIRM_RETRYABLE_ERROR_CODES,
+    PRESIGNED_URL_EXPIRE_SEC,
+    VIEW_URL_QUERY_PARAMS,
+)
 from app.module.media.enums import S3ObjectStatus, UploadType
+from app.module.media.presigned_url_cache import presigned_view_url_cache
+from app.module.media.sigv4_presigner import SigV4Presigner
+
+if TYPE_CHECKING:
+    from botocore.credentials import Credentials, ReadOnlyCredentials
+    from mypy_boto3_s3 import S3Client
+
+logger = logging.getLogger(__name__)
 
 
 class MediaService:
     def __init__(self):
-        self.s3_client: S3Client = boto3.client(
-            "s3",
-            region_name=os.getenv("CUSTOM_AWS_REGION"),
-        )
         bucket_name = os.getenv("S3_BUCKET_NAME")
         if not bucket_name:
             raise ValueError("S3_BUCKET_NAME 환경변수가 설정되지 않았습니다.")
         self.bucket_name = bucket_name
         self.presigned_url_expiration = PRESIGNED_URL_EXPIRE_SEC
+        self.view_url_cache = presigned_view_url_cache
+        self.region_name = self._resolve_region_name()
+        # boto3 import와 client 생성은 S3 API를 처음 호출할 때까지 미룬다 (Lambda cold start)
+        self._s3_client: "S3Client | None" = None
+        self._credentials: "Credentials | None" = None
+        self.view_url_presigner = SigV4Presigner(
+            bucket_name,
+            self.region_name,
+            self._get_frozen_credentials,
+            expires_in=self.presigned_url_expiration,
+        )
+
+    @staticmethod
+    def _resolve_region_name() -> str:
+        region_name = os.getenv("CUSTOM_AWS_REGION") or os.getenv("AWS_REGION")
+        if region_name:
+            return region_name
+
+        # Lambda는 AWS_REGION이 항상 있으므로 boto3 설정 파일을 읽는 경로는 로컬 실행에서만 탄다
+        import boto3
+
+        region_name = boto3.session.Session().region_name
+        if not region_name:
+            raise ValueError("S3 리전을 알 수 없습니다. CUSTOM_AWS_REGION 환경변수를 설정해주세요.")
+        return region_name
+
+    @property
+    def s3_client(self) -> "S3Client":
+        if self._s3_client is None:
+            import boto3
+
+            self._s3_client = boto3.client("s3", region_name=self.region_name)
+        return self._s3_client
+
+    def _get_frozen_credentials(self) -> "ReadOnlyCredentials":
+        if self._credentials is None:
+            import boto3
+
+            credentials = boto3.Session().get_credentials()
+            if credentials is None:
+                raise ValueError("AWS 자격 증명을 찾을 수 없습니다.")
+            self._credentials = credentials
+        return self._credentials.get_frozen_credentials()
 
     def generate_file_key(
         self,
@@ -65,11 +121,7 @@ class MediaService:
         file_key: str,
     ) -> None:
         try:
-            self.s3_client.put_object_tagging(
-                Bucket=self.bucket_name,
-                Key=file_key,
-                Tagging={"TagSet": [{"Key": "status", "Value": S3ObjectStatus.CONFIRMED}]},
-            )
+            self._put_confirmed_tag(self.s3_client, file_key)
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
             error_message = e.response.get("Error", {}).get("Message", "Unknown error")
@@ -77,6 +129,50 @@ class MediaService:
         except Exception as e:
             raise Exception(f"파일 태그 업데이트 중 오류 발생: {str(e)}")
 
+    def mark_files_as_confirmed(self, file_keys: list[str], concurrency: int = IMAGE_CONFIRM_CONCURRENCY) -> list[str]:
+        """여러 파일에 confirmed 태그를 동시 호출 수를 제한해 붙이고, 재시도 후에도 실패한 file_key 목록을 반환
+
+        throttling과 5xx는 키별로 지수 백오프하며 다시 시도하고, 없는 객체 등 다시 해도 같은 오류는 바로 실패로 돌려준다.
+        태그는 덮어쓰기이므로 같은 키를 여러 번 confirm해도 결과가 같다.
+        """
+        unique_keys = list(dict.fromkeys(file_keys))
+        if not unique_keys:
+            return []
+
+        # 스레드마다 lazy 생성이 겹치지 않도록 client를 먼저 만들어 넘긴다 (boto3 client는 스레드 간 공유 가능)
+        confirm = partial(self._confirm_with_retry, self.s3_client)
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(unique_keys))) as executor:
+            confirmed_flags = list(executor.map(confirm, unique_keys))
+        return [file_key for file_key, confirmed in zip(unique_keys, confirmed_flags) if not confirmed]
+
+    def _confirm_with_retry(self, s3_client: "S3Client", file_key: str) -> bool:
+        for attempt in range(1, IMAGE_CONFIRM_MAX_ATTEMPTS + 1):
+            try:
+                self._put_confirmed_tag(s3_client, file_key)
+                return True
+            except ClientError as e:
+                error = e.response.get("Error", {})
+                status_code = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+                if error.get("Code") not in IMAGE_CONFIRM_RETRYABLE_ERROR_CODES and status_code < 500:
+                    logger.warning("파일 태그 업데이트 실패: %s %s", file_key, error.get("Code"))
+                    return False
+            except BotoCoreError:
+                # 연결 오류 등 응답을 받지 못한 경우도 일시 오류로 보고 다시 시도한다
+                pass
+
+            if attempt < IMAGE_CONFIRM_MAX_ATTEMPTS:
+                time.sleep(IMAGE_CONFIRM_RETRY_BASE_DELAY_SEC * 2 ** (attempt - 1))
+
+        logger.warning("파일 태그 업데이트 재시도 초과: %s", file_key)
+        return False
+
+    def _put_confirmed_tag(self, s3_client: "S3Client", file_key: str) -> None:
+        s3_client.put_object_tagging(
+            Bucket=self.bucket_name,
+            Key=file_key,
+            Tagging={"TagSet": [{"Key": "status", "Value": S3ObjectStatus.CONFIRMED}]},
+        )
+
     def get_presigned_download_url(self, file_key: str) -> str:
         try:
             return self.s3_client.generate_presigned_url(
@@ -89,19 +185,22 @@ class MediaService:
             error_message = e.response.get("Error", {}).get("Message", "Unknown error")
             raise Exception(f"S3 presigned URL 생성 실패: {error_code} - {error_message}")
 
-    def get_presigned_view_url(self, file_key: str) -> str:
-        try:
-            return self.s3_client.generate_presigned_url(
-                "get_object",
-                Params={
-                    "Bucket": self.bucket_name,
-                    "Key": file_key,
-                    "ResponseContentType": "image/jpeg",
-                    "ResponseContentDisposition": "inline",
-                },
-                ExpiresIn=self.presigned_url_expiration,
-            )
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            error_message = e.response.get("Error", {}).get("Message", "Unknown error")
-            raise Exception(f"S3 presigned URL 생성 실패: {error_code} - {error_message}")
+    def get_presigned_view_urls(self, file_keys: list[str]) -> dict[str, str]:
+        """캐시에 없는 file_key만 모아 SigV4Presigner로 한 번에 서명"""
+        urls: dict[str, str] = {}
+        missing_keys = []
+        for file_key in dict.fromkeys(file_keys):
+            cached_url = self.view_url_cache.get(file_key)
+            if cached_url:
+                urls[file_key] = cached_url
+            else:
+                missing_keys.append(file_key)
+
+        if missing_keys:
+            signed_at = time.monotonic()
+            signed_urls = self.view_url_presigner.sign_many(missing_keys, VIEW_URL_QUERY_PARAMS)
+            for file_key, url in signed_urls.items():
+                self.view_url_cache.set(file_key, url, signed_at)
+            urls.update(signed_urls)
+
+        return urls
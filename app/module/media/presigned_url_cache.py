@@ -0,0 +1,67 @@
+import threading
+import time
+from collections import OrderedDict
+
+from app.module.media.constants import (
+    PRESIGNED_URL_CACHE_MAX_SIZE,
+    PRESIGNED_URL_EXPIRE_SEC,
+    PRESIGNED_URL_MIN_REMAINING_SEC,
+)
+
+
+class PresignedUrlCache:
+    """file_key별로 서명된 URL을 만료 시각과 함께 보관하는 LRU 캐시
+
+    asyncio.to_thread 워커에서도 호출되므로 lock으로 보호한다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = PRESIGNED_URL_CACHE_MAX_SIZE,
+        expire_sec: int = PRESIGNED_URL_EXPIRE_SEC,
+        min_remaining_sec: int = PRESIGNED_URL_MIN_REMAINING_SEC,
+    ):
+        self.max_size = max_size
+        self.expire_sec = expire_sec
+        self.min_remaining_sec = min_remaining_sec
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, file_key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(file_key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            url, expires_at = entry
+            if expires_at - time.monotonic() <= self.min_remaining_sec:
+                del self._entries[file_key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(file_key)
+            self.hits += 1
+            return url
+
+    def set(self, file_key: str, url: str, signed_at: float) -> None:
+        with self._lock:
+            self._entries[file_key] = (url, signed_at + self.expire_sec)
+            self._entries.move_to_end(file_key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+presigned_view_url_cache = PresignedUrlCache()
@@ -1,12 +1,16 @@
 import os
+import threading
+import time
 from datetime import datetime
 from unittest.mock import Mock, patch
 
 import pytest
 from botocore.exceptions import ClientError
 
+from app.module.media.constants import VIEW_URL_QUERY_PARAMS
 from app.module.media.enums import UploadType
 from app.module.media.media_service import MediaService
+from app.module.media.presigned_url_cache import PresignedUrlCache
 
 
 class TestMediaService:
@@ -32,6 +36,28 @@ class TestMediaService:
         with pytest.raises(ValueError, match="S3_BUCKET_NAME 환경변수가 설정되지 않았습니다."):
             MediaService()
 
+    @patch.dict(os.environ, {"S3_BUCKET_NAME": "test-bucket"}, clear=True)
+    @patch("boto3.session.Session")
+    def test_init_falls_back_to_session_region(self, mock_session):
+        # given
+        mock_session.return_value.region_name = "ap-northeast-2"
+
+        # when
+        service = MediaService()
+
+        # then
+        assert service.region_name == "ap-northeast-2"
+
+    @patch.dict(os.environ, {"S3_BUCKET_NAME": "test-bucket"}, clear=True)
+    @patch("boto3.session.Session")
+    def test_init_without_any_region(self, mock_session):
+        # given
+        mock_session.return_value.region_name = None
+
+        # when & then
+        with pytest.raises(ValueError, match="S3 리전을 알 수 없습니다"):
+            MediaService()
+
     @patch.dict(os.environ, {"S3_BUCKET_NAME": "test-bucket", "CUSTOM_AWS_REGION": "us-east-1"})
     @patch("boto3.client")
     @patch("uuid.uuid4")
@@ -152,3 +178,169 @@ class TestMediaService:
         # when & then
         with pytest.raises(Exception, match="예상치 못한 오류 발생: Invalid parameter"):
             service.create_presigned_upload_url(UploadType.CONTENT)
+
+    @patch.dict(os.environ, {"S3_BUCKET_NAME": "test-bucket", "CUSTOM_AWS_REGION": "us-east-1"})
+    @patch("boto3.client")
+    def test_get_presigned_view_urls_reuses_cached_url(self, mock_boto3_client):
+        # given
+        mock_boto3_client.return_value = Mock()
+        service = MediaService()
+        service.view_url_cache = PresignedUrlCache()
+        service.view_url_presigner = Mock()
+        service.view_url_presigner.sign_many.return_value = {"content/2025-09-16/abcd1234.jpg": "https://signed-url"}
+
+        # when
+        first = service.get_presigned_view_urls(["content/2025-09-16/abcd1234.jpg"])
+        second = service.get_presigned_view_urls(["content/2025-09-16/abcd1234.jpg"])
+
+        # then
+        assert first == second == {"content/2025-09-16/abcd1234.jpg": "https://signed-url"}
+        service.view_url_presigner.sign_many.assert_called_once()
+        assert service.view_url_cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    @patch.dict(os.environ, {"S3_BUCKET_NAME": "test-bucket", "CUSTOM_AWS_REGION": "us-east-1"})
+    @patch("boto3.client")
+    def test_get_presigned_view_urls_resigns_near_expiry(self, mock_boto3_client):
+        # given
+        mock_boto3_client.return_value = Mock()
+        service = MediaService()
+        service.view_url_cache = PresignedUrlCache(expire_sec=3600, min_remaining_sec=1800)
+        service.view_url_presigner = Mock()
+        service.view_url_presigner.sign_many.side_effect = [
+            {"content/2025-09-16/abcd1234.jpg": "https://signed-url-1"},
+            {"content/2025-09-16/abcd1234.jpg": "https://signed-url-2"},
+        ]
+
+        # when
+        with patch("app.module.media.presigned_url_cache.time.monotonic", return_value=1000.0 + 1801):
+            with patch("app.module.media.media_service.time.monotonic", return_value=1000.0):
+                first = service.get_presigned_view_urls(["content/2025-09-16/abcd1234.jpg"])
+            second = service.get_presigned_view_urls(["content/2025-09-16/abcd1234.jpg"])
+
+        # then
+        assert first == {"content/2025-09-16/abcd1234.jpg": "https://signed-url-1"}
+        assert second == {"content/2025-09-16/abcd1234.jpg": "https://signed-url-2"}
+        assert service.view_url_presigner.sign_many.call_count == 2
+
+    @patch.dict(os.environ, {"S3_BUCKET_NAME": "test-bucket", "CUSTOM_AWS_REGION": "ap-northeast-2"})
+    @patch("boto3.client")
+    def test_get_presigned_view_urls_signs_only_missing_keys(self, mock_boto3_client):
+        # given
+        mock_boto3_client.return_value = Mock()
+        service = MediaService()
+        service.view_url_cache = PresignedUrlCache()
+        service.view_url_cache.set("a.jpg", "https://cached-a", time.monotonic())
+        service.view_url_presigner = Mock()
+        service.view_url_presigner.sign_many.return_value = {"b.jpg": "https://signed-b"}
+
+        # when
+        urls = service.get_presigned_view_urls(["a.jpg", "b.jpg", "b.jpg"])
+
+        # then
+        assert urls == {"a.jpg": "https://cached-a", "b.jpg": "https://signed-b"}
+        service.view_url_presigner.sign_many.assert_called_once_with(["b.jpg"], VIEW_URL_QUERY_PARAMS)
+        assert service.view_url_cache.get("b.jpg") == "https://signed-b"
+
+
+def client_error(code: str, status_code: int = 400) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": code, "Message": code}, "ResponseMetadata": {"HTTPStatusCode": status_code}},  # type: ignore
+        "PutObjectTagging",
+    )
+
+
+class TestMarkFilesAsConfirmed:
+    @pytest.fixture
+    def service(self):
+        with patch.dict(os.environ, {"S3_BUCKET_NAME": "test-bucket", "CUSTOM_AWS_REGION": "ap-northeast-2"}):
+            service = MediaService()
+        service._s3_client = Mock()
+        return service
+
+    def test_tags_each_unique_key_once(self, service):
+        # when
+        failed = service.mark_files_as_confirmed(["a.jpg", "b.jpg", "a.jpg"])
+
+        # then
+        assert failed == []
+        tagged_keys = sorted(call.kwargs["Key"] for call in service.s3_client.put_object_tagging.call_args_list)
+        assert tagged_keys == ["a.jpg", "b.jpg"]
+        assert service.s3_client.put_object_tagging.call_args.kwargs["Tagging"] == {
+            "TagSet": [{"Key": "status", "Value": "confirmed"}]
+        }
+
+    @patch("app.module.media.media_service.time.sleep")
+    def test_retries_throttling_and_server_errors(self, mock_sleep, service):
+        # given
+        service.s3_client.put_object_tagging.side_effect = [client_error("SlowDown", 503), client_error("X", 500), None]
+
+        # when
+        failed = service.mark_files_as_confirmed(["a.jpg"])
+
+        # then
+        assert failed == []
+        assert service.s3_client.put_object_tagging.call_count == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.2, 0.4]
+
+    @patch("app.module.media.media_service.time.sleep")
+    def test_returns_keys_that_still_fail(self, mock_sleep, service):
+        # given
+        def put_object_tagging(Bucket, Key, Tagging):
+            if Key == "missing.jpg":
+                raise client_error("NoSuchKey", 404)
+            if Key == "throttled.jpg":
+                raise client_error("SlowDown", 503)
+
+        service.s3_client.put_object_tagging.side_effect = put_object_tagging
+
+        # when
+        failed = service.mark_files_as_confirmed(["missing.jpg", "ok.jpg", "throttled.jpg"])
+
+        # then
+        assert failed == ["missing.jpg", "throttled.jpg"]
+        keys = [call.kwargs["Key"] for call in service.s3_client.put_object_tagging.call_args_list]
+        assert keys.count("missing.jpg") == 1
+        assert keys.count("throttled.jpg") == 3
+
+    def test_bounds_concurrent_calls(self, service):
+        # given
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def put_object_tagging(**kwargs):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+        service.s3_client.put_object_tagging.side_effect = put_object_tagging
+
+        # when
+        failed = service.mark_files_as_confirmed([f"{i}.jpg" for i in range(20)], concurrency=4)
+
+        # then
+        assert failed == []
+        assert service.s3_client.put_object_tagging.call_count == 20
+        assert 1 < max_in_flight <= 4
+
+
+class TestPresignedUrlCache:
+    def test_evicts_least_recently_used(self):
+        # given
+        cache = PresignedUrlCache(max_size=2)
+        now = time.monotonic()
+        cache.set("a", "url-a", now)
+        cache.set("b", "url-b", now)
+        cache.get("a")
+
+        # when
+        cache.set("c", "url-c", now)
+
+        # then
+        assert cache.get("a") == "url-a"
+        assert cache.get("b") is None
+        assert cache.get("c") == "url-c"
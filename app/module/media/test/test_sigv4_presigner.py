@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import boto3
+import pytest
+from botocore.config import Config
+from botocore.credentials import ReadOnlyCredentials
+
+from app.module.media.sigv4_presigner import SigV4Presigner, _hmac_sha256
+
+SIGNED_AT = datetime(2026, 10, 17, 12, 20, 48, tzinfo=timezone.utc)
+VIEW_PARAMS = {"ResponseContentType": "image/jpeg", "ResponseContentDisposition": "inline"}
+VIEW_QUERY_PARAMS = {"response-content-type": "image/jpeg", "response-content-disposition": "inline"}
+FILE_KEYS = [
+    "content/2025-09-16/abcd1234.jpg",
+    "profile/2025-09-16/ab cd+1~.jpg",
+    "content/한글 파일(1).jpg",
+    "content/a=b&c;d,e!'*@$.jpg",
+]
+
+
+def boto3_presigned_url(region: str, file_key: str, token: str | None, params: dict[str, str]) -> str:
+    s3_client = boto3.client(
+        "s3",
+        region_name=region,
+        aws_access_key_id="AKIDEXAMPLE",
+        aws_secret_access_key="wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY",
+        aws_session_token=token,
+        config=Config(signature_version="s3v4"),
+    )
+    with patch("botocore.auth.get_current_datetime", return_value=SIGNED_AT.replace(tzinfo=None)):
+        return s3_client.generate_presigned_url(
+            "get_object", Params={"Bucket": "my-bucket", "Key": file_key, **params}, ExpiresIn=3600
+        )
+
+
+def make_presigner(region: str, token: str | None) -> SigV4Presigner:
+    credentials = ReadOnlyCredentials("AKIDEXAMPLE", "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY", token)
+    return SigV4Presigner("my-bucket", region, lambda: credentials, expires_in=3600)
+
+
+class TestSigV4Presigner:
+    @pytest.mark.parametrize("region", ["ap-northeast-2", "us-east-1"])
+    @pytest.mark.parametrize("token", [None, "session/token+="])
+    def test_matches_boto3_view_url(self, region, token):
+        # given
+        presigner = make_presigner(region, token)
+
+        # when
+        urls = presigner.sign_many(FILE_KEYS, VIEW_QUERY_PARAMS, now=SIGNED_AT)
+
+        # then
+        for file_key in FILE_KEYS:
+            assert urls[file_key] == boto3_presigned_url(region, file_key, token, VIEW_PARAMS)
+
+    def test_matches_boto3_without_params(self):
+        # given
+        presigner = make_presigner("ap-northeast-2", None)
+
+        # when
+        url = presigner.sign(FILE_KEYS[1], now=SIGNED_AT)
+
+        # then
+        assert url == boto3_presigned_url("ap-northeast-2", FILE_KEYS[1], None, {})
+
+    def test_signing_key_computed_once_per_day(self):
+        # given
+        presigner = make_presigner("ap-northeast-2", None)
+
+        # when
+        with patch("app.module.media.sigv4_presigner._hmac_sha256", wraps=_hmac_sha256) as mock_hmac:
+            first_key = presigner._get_signing_key("secret", "20261017")
+            same_day_key = presigner._get_signing_key("secret", "20261017")
+            first_day_calls = mock_hmac.call_count
+            next_day_key = presigner._get_signing_key("secret", "20261018")
+
+        # then
+        assert first_key is same_day_key
+        assert first_day_calls == 4
+        assert mock_hmac.call_count == 8
+        assert next_day_key != first_key
+
+    def test_rejects_missing_secret_key(self):
+        # given
+        credentials = ReadOnlyCredentials("AKIDEXAMPLE", None, None)
+        presigner = SigV4Presigner("my-bucket", "ap-northeast-2", lambda: credentials)
+
+        # when & then
+        with pytest.raises(ValueError, match="AWS 자격 증명"):
+            presigner.sign(FILE_KEYS[0], now=SIGNED_AT)
@@ -0,0 +1,21 @@
+# worker가 한 번에 가져가는 이벤트 수와 가져간 이벤트를 다른 worker가 다시 가져가지 못하는 시간
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_LEASE_SEC = 60
+
+# 실패한 이벤트는 RETRY_BASE_DELAY_SEC * 2^(attempts - 1) (최대 RETRY_MAX_DELAY_SEC) 뒤에 다시 시도한다
+OUTBOX_MAX_ATTEMPTS = 8
+OUTBOX_RETRY_BASE_DELAY_SEC = 5
+OUTBOX_RETRY_MAX_DELAY_SEC = 600
+
+# lifespan에서 도는 worker가 빈 배치를 만난 뒤 다시 확인하기까지의 간격
+OUTBOX_POLL_INTERVAL_SEC = 1.0
+
+OUTBOX_LAST_ERROR_MAX_LENGTH = 500
+
+# Lambda 남은 시간이 이보다 적으면 다음 배치를 가져가지 않는다 (가져간 배치는 lease가 끝난 뒤 다시 처리된다)
+OUTBOX_STOP_MARGIN_MS = 10_000
+
+# 처리 완료 후 이 기간이 지난 이벤트는 지운다 (DEAD 이벤트는 확인을 위해 남긴다)
+OUTBOX_RETENTION_DAYS = 7
+OUTBOX_PURGE_BATCH_SIZE = 1000
+OUTBOX_PURGE_INTERVAL_SEC = 3600
@@ -0,0 +1,23 @@
+from enum import StrEnum
+from os import getenv
+
+
+class OutboxEventType(StrEnum):
+    BADGE_EVALUATION = "badge_evaluation"  # 미션 완료 한 건을 배지 통계에 반영
+    MISSION_HEADCOUNT = "mission_headcount"  # 미션 진행 인원 카운터 증감
+    IMAGE_CONFIRMATION = "image_confirmation"  # 게시물에 연결된 S3 이미지에 confirmed 태그
+
+
+class OutboxEventStatus(StrEnum):
+    PENDING = "pending"  # 처리 대기 (재시도 포함)
+    PROCESSED = "processed"
+    DEAD = "dead"  # 최대 시도 횟수를 넘겨 더 이상 가져가지 않음
+
+
+class OutboxConsumerMode(StrEnum):
+    INLINE = "inline"  # API 프로세스의 lifespan에서 worker를 함께 실행 (컨테이너, 로컬)
+    EXTERNAL = "external"  # 별도 worker(Lambda 스케줄 등)가 처리
+
+    @classmethod
+    def from_env(cls) -> "OutboxConsumerMode":
+        return cls(getenv("OUTBOX_CONSUMER", cls.INLINE))
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from app.module.outbox.enums import OutboxEventType
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """요청 트랜잭션에서 outbox_event에 적재할 부수 효과 한 건
+
+    idempotency_key는 부수 효과를 만든 원천(게시물 등)과 종류로 정해지므로,
+    같은 요청이 재시도되어도 이벤트는 한 번만 적재된다.
+    """
+
+    event_type: OutboxEventType
+    idempotency_key: str
+    payload: dict[str, Any] = field(default_factory=dict)
+
+    def to_row(self) -> dict[str, Any]:
+        return {"event_type": self.event_type, "idempotency_key": self.idempotency_key, "payload": self.payload}
+
+
+@dataclass(frozen=True)
+class ClaimedEvent:
+    id: int
+    event_type: OutboxEventType
+    payload: dict[str, Any]
+    attempts: int  # 이번에 가져간 것을 포함한 시도 횟수
+
+
+def badge_evaluation(post_id: int, user_id: int, completed_at: datetime) -> OutboxMessage:
+    return OutboxMessage(
+        OutboxEventType.BADGE_EVALUATION,
+        f"post:{post_id}:badge",
+        {"user_id": user_id, "completed_at": completed_at.isoformat()},
+    )
+
+
+def mission_headcount(post_id: int, mission_id: int, amount: int) -> OutboxMessage:
+    return OutboxMessage(
+        OutboxEventType.MISSION_HEADCOUNT,
+        f"post:{post_id}:headcount",
+        {"mission_id": mission_id, "amount": amount},
+    )
+
+
+def image_confirmation(post_id: int, file_key: str) -> OutboxMessage:
+    return OutboxMessage(OutboxEventType.IMAGE_CONFIRMATION, f"post:{post_id}:image", {"file_key": file_key})
@@ -0,0 +1,52 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.module.outbox.enums import OutboxEventType
+
+OutboxHandler = Callable[[AsyncSession, dict[str, Any]], Awaitable[None]]
+# 같은 종류의 이벤트 payload를 한 번에 받아 이벤트별 성공 여부를 순서대로 돌려주는 처리기 (DB 밖의 멱등한 효과용)
+OutboxBatchHandler = Callable[[list[dict[str, Any]]], Awaitable[list[bool]]]
+
+
+def default_handlers() -> dict[OutboxEventType, OutboxHandler]:
+    """이벤트 종류별 처리기. 서비스 생성(S3 설정 확인 등)은 worker가 처음 이벤트를 처리할 때까지 미룬다
+
+    DB에 쓰는 처리기는 worker가 outbox 처리 완료 표시와 같은 트랜잭션에서 실행하므로 한 번만 반영되고,
+    DB 밖의 효과는 default_batch_handlers에서 배치 단위로 처리한다.
+    """
+    from app.common.container import container
+    from app.module.badge.badge_service import BadgeService
+    from app.module.challenge.challenge_repository import MissionRepository
+
+    badge_service = container.get(BadgeService)
+    mission_repository = MissionRepository()
+
+    async def evaluate_badges(session: AsyncSession, payload: dict[str, Any]) -> None:
+        completed_at = datetime.fromisoformat(payload["completed_at"])
+        await badge_service.record_mission_completion(session, payload["user_id"], completed_at)
+
+    async def update_mission_headcount(session: AsyncSession, payload: dict[str, Any]) -> None:
+        await mission_repository.increment_headcount(session, payload["mission_id"], payload["amount"])
+
+    return {
+        OutboxEventType.BADGE_EVALUATION: evaluate_badges,
+        OutboxEventType.MISSION_HEADCOUNT: update_mission_headcount,
+    }
+
+
+def default_batch_handlers() -> dict[OutboxEventType, OutboxBatchHandler]:
+    """배치 안의 같은 종류 이벤트를 모아 한 번에 처리하는 처리기. 여러 번 실행되어도 결과가 같아야 한다"""
+    from app.common.container import container
+    from app.module.media.media_service import MediaService
+
+    media_service = container.get(MediaService)
+
+    async def confirm_images(payloads: list[dict[str, Any]]) -> list[bool]:
+        file_keys = [payload["file_key"] for payload in payloads]
+        failed_keys = set(await asyncio.to_thread(media_service.mark_files_as_confirmed, file_keys))
+        return [file_key not in failed_keys for file_key in file_keys]
+
+    return {OutboxEventType.IMAGE_CONFIRMATION: confirm_images}
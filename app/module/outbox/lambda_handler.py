@@ -0,0 +1,14 @@
+import asyncio
+from typing import Any
+
+from app.module.outbox.worker import outbox_worker
+
+# DB 커넥션 풀이 이벤트 루프에 묶이므로 warm invocation 사이에 같은 루프를 재사용한다
+loop = asyncio.new_event_loop()
+
+
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    get_remaining_time_ms = context.get_remaining_time_in_millis
+    result = loop.run_until_complete(outbox_worker.drain(get_remaining_time_ms=get_remaining_time_ms))
+    purged = loop.run_until_complete(outbox_worker.purge_if_due(get_remaining_time_ms=get_remaining_time_ms))
+    return {**result.to_dict(), "purged": purged}
@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.generic_repository import GenericRepository
+from app.model.outbox import OutboxEvent
+from app.module.outbox.constants import OUTBOX_LAST_ERROR_MAX_LENGTH
+from app.module.outbox.enums import OutboxEventStatus, OutboxEventType
+from app.module.outbox.events import ClaimedEvent, OutboxMessage
+
+
+class OutboxRepository(GenericRepository):
+    def __init__(self):
+        super().__init__(OutboxEvent)
+
+    async def enqueue(self, session: AsyncSession, messages: list[OutboxMessage]) -> int:
+        """이벤트들을 multi-row INSERT IGNORE 한 번으로 적재하고 새로 적재한 수를 반환
+
+        idempotency_key가 이미 있는 이벤트는 0 row로 무시된다. 로컬 worker 테스트를 위해 SQLite에서는 OR IGNORE로 컴파일한다.
+        """
+        if not messages:
+            return 0
+
+        stmt = (
+            insert(OutboxEvent)
+            .values([message.to_row() for message in messages])
+            .prefix_with("IGNORE", dialect="mysql")
+            .prefix_with("OR IGNORE", dialect="sqlite")
+        )
+        result = await session.execute(stmt)
+        return result.rowcount  # type: ignore
+
+    async def claim_batch(
+        self, session: AsyncSession, batch_size: int, lease_sec: float, now: datetime
+    ) -> list[ClaimedEvent]:
+        """처리할 이벤트를 가져가고 lease 동안 다른 worker가 가져가지 못하도록 available_at을 미룬다
+
+        SKIP LOCKED로 다른 worker가 잠근 행은 건너뛰므로 여러 worker가 동시에 돌아도 서로 기다리지 않는다.
+        호출 측이 커밋해야 lease가 다른 worker에 보인다.
+        """
+        stmt = (
+            select(OutboxEvent.id, OutboxEvent.event_type, OutboxEvent.payload, OutboxEvent.attempts)  # type: ignore
+            .where(OutboxEvent.status == OutboxEventStatus.PENDING, OutboxEvent.available_at <= now)  # type: ignore
+            .order_by(OutboxEvent.available_at, OutboxEvent.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        rows = (await session.execute(stmt)).all()
+        if not rows:
+            return []
+
+        await session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_([row.id for row in rows]))  # type: ignore
+            .values(attempts=OutboxEvent.attempts + 1, available_at=now + timedelta(seconds=lease_sec))
+        )
+        return [ClaimedEvent(row.id, OutboxEventType(row.event_type), row.payload, row.attempts + 1) for row in rows]
+
+    async def mark_processed(self, session: AsyncSession, event_id: int, now: datetime) -> bool:
+        """아직 처리되지 않은 이벤트만 처리 완료로 바꾸고 바꿨는지 반환
+
+        부수 효과와 같은 트랜잭션에서 먼저 실행하면 행 락으로 같은 이벤트의 동시 처리가 직렬화되고,
+        lease가 끝나 다른 worker가 이미 처리한 이벤트는 0 row가 되어 부수 효과를 건너뛸 수 있다.
+        """
+        stmt = (
+            update(OutboxEvent)
+            .where(OutboxEvent.id == event_id, OutboxEvent.status == OutboxEventStatus.PENDING)  # type: ignore
+            .values(status=OutboxEventStatus.PROCESSED, processed_at=now, last_error=None)
+        )
+        result = await session.execute(stmt)
+        return result.rowcount == 1  # type: ignore
+
+    async def mark_processed_many(self, session: AsyncSession, event_ids: list[int], now: datetime) -> int:
+        """배치 처리기로 처리한 이벤트들을 UPDATE 한 번으로 처리 완료로 바꾸고 바꾼 수를 반환"""
+        if not event_ids:
+            return 0
+
+        stmt = (
+            update(OutboxEvent)
+            .where(
+                OutboxEvent.id.in_(event_ids),  # type: ignore
+                OutboxEvent.status == OutboxEventStatus.PENDING,  # type: ignore
+            )
+            .values(status=OutboxEventStatus.PROCESSED, processed_at=now, last_error=None)
+        )
+        result = await session.execute(stmt)
+        return result.rowcount  # type: ignore
+
+    async def record_failure(self, session: AsyncSession, event_id: int, error: str, retry_at: datetime | None) -> None:
+        """실패 사유를 남기고 retry_at에 다시 가져가도록 미룬다. retry_at이 None이면 DEAD로 둔다"""
+        values: dict = {"last_error": error[:OUTBOX_LAST_ERROR_MAX_LENGTH]}
+        if retry_at is None:
+            values["status"] = OutboxEventStatus.DEAD
+        else:
+            values["available_at"] = retry_at
+
+        stmt = (
+            update(OutboxEvent)
+            .where(OutboxEvent.id == event_id, OutboxEvent.status == OutboxEventStatus.PENDING)  # type: ignore
+            .values(**values)
+        )
+        await session.execute(stmt)
+
+    async def purge_processed(self, session: AsyncSession, before: datetime, limit: int) -> int:
+        """before 이전에 처리 완료된 이벤트를 최대 limit개 지우고 지운 수를 반환
+
+        처리 완료된 이벤트의 available_at은 마지막 lease 만료 시각이라 processed_at과 lease 길이만큼만 차이 나므로,
+        processed_at 대신 available_at으로 골라 (status, available_at, id) 인덱스를 그대로 쓴다.
+        """
+        stmt = (
+            select(OutboxEvent.id)  # type: ignore
+            .where(OutboxEvent.status == OutboxEventStatus.PROCESSED, OutboxEvent.available_at < before)  # type: ignore
+            .order_by(OutboxEvent.available_at, OutboxEvent.id)
+            .limit(limit)
+        )
+        event_ids = list((await session.execute(stmt)).scalars().all())
+        if not event_ids:
+            return 0
+
+        result = await session.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(event_ids)))  # type: ignore
+        return result.rowcount  # type: ignore
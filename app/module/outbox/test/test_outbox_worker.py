@@ -0,0 +1,310 @@
+"""outbox worker를 실제 DB에 대해 돌리는 테스트
+
+기본은 aiosqlite 메모리 DB로 실행하고, OUTBOX_TEST_MYSQL_URL을 주면 같은 테스트를 MySQL에서도 실행한다.
+
+    docker run --rm -d -p 3306:3306 -e MYSQL_ROOT_PASSWORD=pw -e MYSQL_DATABASE=outbox_test mysql:8.0
+    OUTBOX_TEST_MYSQL_URL=mysql+aiomysql://root:pw@127.0.0.1:3306/outbox_test python -m pytest app/module/outbox
+"""
+
+import os
+from datetime import timedelta
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+
+from app.common.utils.time import utc_now
+from app.model.outbox import OutboxEvent
+from app.module.outbox import events
+from app.module.outbox.enums import OutboxEventStatus, OutboxEventType
+from app.module.outbox.outbox_repository import OutboxRepository
+from app.module.outbox.worker import OutboxWorker
+
+
+@pytest_asyncio.fixture(params=["sqlite", "mysql"])
+async def session_maker(request):
+    if request.param == "sqlite":
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    else:
+        mysql_url = os.getenv("OUTBOX_TEST_MYSQL_URL")
+        if not mysql_url:
+            pytest.skip("OUTBOX_TEST_MYSQL_URL이 설정되지 않았습니다.")
+        engine = create_async_engine(mysql_url)
+
+    tables = [OutboxEvent.__table__]  # type: ignore[attr-defined]
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all, tables=tables)
+        await conn.run_sync(SQLModel.metadata.create_all, tables=tables)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all, tables=tables)
+    await engine.dispose()
+
+
+async def enqueue(session_maker, messages: list[events.OutboxMessage]) -> int:
+    async with session_maker() as session:
+        inserted = await OutboxRepository().enqueue(session, messages)
+        await session.commit()
+    return inserted
+
+
+async def load_events(session_maker) -> list[OutboxEvent]:
+    async with session_maker() as session:
+        return list((await session.execute(select(OutboxEvent).order_by(OutboxEvent.id))).scalars())  # type: ignore
+
+
+class RecordingHandlers:
+    def __init__(self, failures: int = 0):
+        self.calls: list[tuple[OutboxEventType, dict[str, Any]]] = []
+        self.failures = failures
+
+    def provider(self):
+        async def handle_headcount(session: AsyncSession, payload: dict[str, Any]) -> None:
+            self.calls.append((OutboxEventType.MISSION_HEADCOUNT, payload))
+
+        return {OutboxEventType.MISSION_HEADCOUNT: handle_headcount}
+
+    def batch_provider(self):
+        async def confirm_images(payloads: list[dict[str, Any]]) -> list[bool]:
+            self.calls.extend((OutboxEventType.IMAGE_CONFIRMATION, payload) for payload in payloads)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("S3 일시 오류")
+            return [not payload["file_key"].startswith("missing/") for payload in payloads]
+
+        return {OutboxEventType.IMAGE_CONFIRMATION: confirm_images}
+
+    def worker(self, session_maker, **kwargs) -> OutboxWorker:
+        return OutboxWorker(self.provider, self.batch_provider, session_maker_provider=lambda: session_maker, **kwargs)
+
+
+class TestOutboxRepository:
+    @pytest.mark.asyncio
+    async def test_enqueue_ignores_duplicate_idempotency_key(self, session_maker):
+        # given
+        messages = [events.mission_headcount(1, 10, -1), events.image_confirmation(1, "content/a.jpg")]
+
+        # when
+        first = await enqueue(session_maker, messages)
+        second = await enqueue(session_maker, messages + [events.mission_headcount(2, 10, -1)])
+
+        # then
+        assert (first, second) == (2, 1)
+        assert [event.idempotency_key for event in await load_events(session_maker)] == [
+            "post:1:headcount",
+            "post:1:image",
+            "post:2:headcount",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_claimed_event_is_hidden_until_lease_expires(self, session_maker):
+        # given
+        await enqueue(session_maker, [events.mission_headcount(1, 10, -1)])
+        repository = OutboxRepository()
+
+        # when
+        async with session_maker() as session:
+            claimed = await repository.claim_batch(session, 10, lease_sec=60, now=utc_now())
+            await session.commit()
+        async with session_maker() as session:
+            claimed_again = await repository.claim_batch(session, 10, lease_sec=60, now=utc_now())
+
+        # then
+        assert [(event.event_type, event.payload, event.attempts) for event in claimed] == [
+            (OutboxEventType.MISSION_HEADCOUNT, {"mission_id": 10, "amount": -1}, 1)
+        ]
+        assert claimed_again == []
+
+    @pytest.mark.asyncio
+    async def test_mark_processed_only_once(self, session_maker):
+        # given
+        await enqueue(session_maker, [events.mission_headcount(1, 10, -1)])
+        [event] = await load_events(session_maker)
+
+        # when
+        async with session_maker() as session:
+            first = await OutboxRepository().mark_processed(session, event.id, utc_now())
+            second = await OutboxRepository().mark_processed(session, event.id, utc_now())
+            await session.commit()
+
+        # then
+        assert (first, second) == (True, False)
+
+
+class TestOutboxWorker:
+    @pytest.mark.asyncio
+    async def test_drain_processes_events_in_enqueue_order(self, session_maker):
+        # given
+        handlers = RecordingHandlers()
+        worker = handlers.worker(session_maker, batch_size=2)
+        await enqueue(
+            session_maker,
+            [
+                events.mission_headcount(1, 10, -1),
+                events.mission_headcount(2, 11, -1),
+                events.mission_headcount(3, 12, -1),
+            ],
+        )
+
+        # when
+        result = await worker.drain()
+
+        # then
+        assert result.to_dict() == {"claimed": 3, "processed": 3, "skipped": 0, "failed": 0}
+        assert [payload["mission_id"] for _, payload in handlers.calls] == [10, 11, 12]
+        stored = await load_events(session_maker)
+        assert {event.status for event in stored} == {OutboxEventStatus.PROCESSED}
+        assert all(event.processed_at is not None for event in stored)
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_receives_all_events_of_its_type_at_once(self, session_maker):
+        # given
+        handlers = RecordingHandlers()
+        worker = handlers.worker(session_maker, retry_base_delay_sec=60)
+        await enqueue(
+            session_maker,
+            [
+                events.image_confirmation(1, "content/a.jpg"),
+                events.mission_headcount(1, 10, -1),
+                events.image_confirmation(2, "missing/b.jpg"),
+                events.image_confirmation(3, "content/c.jpg"),
+            ],
+        )
+
+        # when
+        result = await worker.drain()
+
+        # then
+        assert result.to_dict() == {"claimed": 4, "processed": 3, "skipped": 0, "failed": 1}
+        assert [event_type for event_type, _ in handlers.calls] == [
+            OutboxEventType.MISSION_HEADCOUNT,
+            OutboxEventType.IMAGE_CONFIRMATION,
+            OutboxEventType.IMAGE_CONFIRMATION,
+            OutboxEventType.IMAGE_CONFIRMATION,
+        ]
+        statuses = {event.idempotency_key: event.status for event in await load_events(session_maker)}
+        assert statuses == {
+            "post:1:image": OutboxEventStatus.PROCESSED,
+            "post:1:headcount": OutboxEventStatus.PROCESSED,
+            "post:2:image": OutboxEventStatus.PENDING,
+            "post:3:image": OutboxEventStatus.PROCESSED,
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_event_is_retried_until_success(self, session_maker):
+        # given
+        handlers = RecordingHandlers(failures=1)
+        worker = handlers.worker(session_maker, retry_base_delay_sec=0)
+        await enqueue(session_maker, [events.image_confirmation(1, "content/a.jpg")])
+
+        # when
+        first = await worker.drain()
+        [failed_event] = await load_events(session_maker)
+        second = await worker.drain()
+
+        # then
+        assert (first.failed, second.processed) == (1, 1)
+        assert failed_event.status == OutboxEventStatus.PENDING
+        assert failed_event.last_error == "RuntimeError: S3 일시 오류"
+        [event] = await load_events(session_maker)
+        assert (event.status, event.attempts, event.last_error) == (OutboxEventStatus.PROCESSED, 2, None)
+
+    @pytest.mark.asyncio
+    async def test_failed_event_waits_for_backoff(self, session_maker):
+        # given
+        handlers = RecordingHandlers(failures=1)
+        worker = handlers.worker(session_maker, retry_base_delay_sec=60)
+        await enqueue(session_maker, [events.image_confirmation(1, "content/a.jpg")])
+
+        # when
+        await worker.drain()
+        second = await worker.drain()
+
+        # then
+        assert second.claimed == 0
+        assert len(handlers.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_event_becomes_dead_after_max_attempts(self, session_maker):
+        # given
+        handlers = RecordingHandlers(failures=2)
+        worker = handlers.worker(session_maker, max_attempts=2, retry_base_delay_sec=0)
+        await enqueue(session_maker, [events.image_confirmation(1, "content/a.jpg")])
+
+        # when
+        await worker.drain()
+        await worker.drain()
+        third = await worker.drain()
+
+        # then
+        [event] = await load_events(session_maker)
+        assert (event.status, event.attempts) == (OutboxEventStatus.DEAD, 2)
+        assert third.claimed == 0
+
+    @pytest.mark.asyncio
+    async def test_handler_writes_roll_back_with_failed_event(self, session_maker):
+        # given
+        async def write_then_fail(session: AsyncSession, payload: dict[str, Any]) -> None:
+            await OutboxRepository().enqueue(session, [events.mission_headcount(99, 10, -1)])
+            raise RuntimeError("처리 중 실패")
+
+        worker = OutboxWorker(
+            lambda: {OutboxEventType.BADGE_EVALUATION: write_then_fail},
+            dict,
+            retry_base_delay_sec=60,
+            session_maker_provider=lambda: session_maker,
+        )
+        await enqueue(session_maker, [events.badge_evaluation(1, 123, utc_now())])
+
+        # when
+        result = await worker.drain()
+
+        # then
+        assert result.failed == 1
+        [event] = await load_events(session_maker)
+        assert (event.idempotency_key, event.status) == ("post:1:badge", OutboxEventStatus.PENDING)
+
+    @pytest.mark.asyncio
+    async def test_drain_stops_when_lambda_time_is_short(self, session_maker):
+        # given
+        handlers = RecordingHandlers()
+        worker = handlers.worker(session_maker)
+        await enqueue(session_maker, [events.mission_headcount(1, 10, -1)])
+
+        # when
+        result = await worker.drain(get_remaining_time_ms=lambda: 1_000)
+
+        # then
+        assert result.claimed == 0
+        assert handlers.calls == []
+
+    @pytest.mark.asyncio
+    async def test_purge_deletes_only_processed_events_past_retention(self, session_maker):
+        # given
+        handlers = RecordingHandlers()
+        worker = handlers.worker(session_maker, retention_days=7, purge_batch_size=1)
+        await enqueue(session_maker, [events.mission_headcount(post_id, 10, -1) for post_id in (1, 2, 3)])
+        await worker.drain()
+        await enqueue(session_maker, [events.mission_headcount(4, 10, -1)])
+        async with session_maker() as session:
+            await session.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.idempotency_key.in_(["post:1:headcount", "post:2:headcount", "post:4:headcount"]))
+                .values(available_at=utc_now() - timedelta(days=8))
+            )
+            await session.commit()
+
+        # when
+        purged = await worker.purge_if_due()
+        purged_again = await worker.purge_if_due()
+
+        # then
+        assert (purged, purged_again) == (2, 0)
+        assert [event.idempotency_key for event in await load_events(session_maker)] == [
+            "post:3:headcount",
+            "post:4:headcount",
+        ]
@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from app.common.utils.time import utc_now
+from app.module.outbox.constants import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_LEASE_SEC,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_POLL_INTERVAL_SEC,
+    OUTBOX_PURGE_BATCH_SIZE,
+    OUTBOX_PURGE_INTERVAL_SEC,
+    OUTBOX_RETENTION_DAYS,
+    OUTBOX_RETRY_BASE_DELAY_SEC,
+    OUTBOX_RETRY_MAX_DELAY_SEC,
+    OUTBOX_STOP_MARGIN_MS,
+)
+from app.module.outbox.enums import OutboxEventType
+from app.module.outbox.events import ClaimedEvent
+from app.module.outbox.handlers import (
+    OutboxBatchHandler,
+    OutboxHandler,
+    default_batch_handlers,
+    default_handlers,
+)
+from app.module.outbox.outbox_repository import OutboxRepository
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+def _default_session_maker() -> "async_sessionmaker":
+    from app.database.config import get_async_session_maker
+
+    return get_async_session_maker()
+
+
+@dataclass
+class DrainResult:
+    claimed: int = 0
+    processed: int = 0
+    skipped: int = 0  # lease가 끝난 사이 다른 worker가 먼저 처리한 이벤트
+    failed: int = 0
+
+    def merge(self, other: "DrainResult") -> None:
+        self.claimed += other.claimed
+        self.processed += other.processed
+        self.skipped += other.skipped
+        self.failed += other.failed
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class OutboxWorker:
+    """outbox_event를 배치로 가져가 이벤트 종류별 처리기를 실행하는 worker (at-least-once)
+
+    이벤트마다 처리 완료 표시와 처리기의 DB 쓰기를 한 트랜잭션으로 커밋하므로, worker가 중간에 죽어
+    lease가 끝난 이벤트를 다시 가져가도 DB 효과는 한 번만 남는다. 실패한 이벤트는 지수 백오프로 다시 시도하고
+    max_attempts를 넘기면 DEAD로 남긴다. 배치 안의 이벤트는 적재 순서대로 하나씩 처리하고,
+    배치 처리기가 있는 종류(S3 이미지 확정 등)는 모아서 한 번에 처리한 뒤 UPDATE 한 번으로 완료 표시한다.
+    처리 완료 후 retention_days가 지난 이벤트는 purge_interval_sec마다 지운다.
+    """
+
+    def __init__(
+        self,
+        handlers_provider: Callable[[], dict[OutboxEventType, OutboxHandler]] = default_handlers,
+        batch_handlers_provider: Callable[[], dict[OutboxEventType, OutboxBatchHandler]] = default_batch_handlers,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        lease_sec: float = OUTBOX_LEASE_SEC,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        retry_base_delay_sec: float = OUTBOX_RETRY_BASE_DELAY_SEC,
+        retry_max_delay_sec: float = OUTBOX_RETRY_MAX_DELAY_SEC,
+        poll_interval_sec: float = OUTBOX_POLL_INTERVAL_SEC,
+        retention_days: int = OUTBOX_RETENTION_DAYS,
+        purge_batch_size: int = OUTBOX_PURGE_BATCH_SIZE,
+        purge_interval_sec: float = OUTBOX_PURGE_INTERVAL_SEC,
+        session_maker_provider: Callable[[], "async_sessionmaker"] = _default_session_maker,
+    ):
+        self.outbox_repository = OutboxRepository()
+        self.handlers_provider = handlers_provider
+        self.batch_handlers_provider = batch_handlers_provider
+        self.batch_size = batch_size
+        self.lease_sec = lease_sec
+        self.max_attempts = max_attempts
+        self.retry_base_delay_sec = retry_base_delay_sec
+        self.retry_max_delay_sec = retry_max_delay_sec
+        self.poll_interval_sec = poll_interval_sec
+        self.retention_days = retention_days
+        self.purge_batch_size = purge_batch_size
+        self.purge_interval_sec = purge_interval_sec
+        self.session_maker_provider = session_maker_provider
+        self._last_purged_at: float | None = None
+        self._handlers: dict[OutboxEventType, OutboxHandler] | None = None
+        self._batch_handlers: dict[OutboxEventType, OutboxBatchHandler] | None = None
+
+    @property
+    def handlers(self) -> dict[OutboxEventType, OutboxHandler]:
+        if self._handlers is None:
+            self._handlers = self.handlers_provider()
+        return self._handlers
+
+    @property
+    def batch_handlers(self) -> dict[OutboxEventType, OutboxBatchHandler]:
+        if self._batch_handlers is None:
+            self._batch_handlers = self.batch_handlers_provider()
+        return self._batch_handlers
+
+    async def drain_once(self) -> DrainResult:
+        async with self.session_maker_provider()() as session:
+            events = await self.outbox_repository.claim_batch(session, self.batch_size, self.lease_sec, utc_now())
+            await session.commit()
+
+        result = DrainResult(claimed=len(events))
+        batched: dict[OutboxEventType, list[ClaimedEvent]] = {}
+        for event in events:
+            if event.event_type in self.batch_handlers:
+                batched.setdefault(event.event_type, []).append(event)
+            else:
+                await self._process(event, result)
+
+        for event_type, batch in batched.items():
+            await self._process_batch(self.batch_handlers[event_type], batch, result)
+        return result
+
+    async def drain(
+        self, max_batches: int | None = None, get_remaining_time_ms: Optional[Callable[[], int]] = None
+    ) -> DrainResult:
+        """가득 찬 배치가 이어지는 동안 계속 가져가 처리. Lambda에서는 남은 시간이 부족하면 멈춘다"""
+        total = DrainResult()
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            if get_remaining_time_ms and get_remaining_time_ms() < OUTBOX_STOP_MARGIN_MS:
+                break
+
+            result = await self.drain_once()
+            total.merge(result)
+            batches += 1
+            if result.claimed < self.batch_size:
+                break
+        return total
+
+    async def purge_if_due(self, get_remaining_time_ms: Optional[Callable[[], int]] = None) -> int:
+        """retention이 지난 처리 완료 이벤트를 purge_batch_size씩 지우고 지운 수를 반환. purge_interval_sec마다 한 번만 돈다"""
+        now = time.monotonic()
+        if self._last_purged_at is not None and now - self._last_purged_at < self.purge_interval_sec:
+            return 0
+        self._last_purged_at = now
+
+        before = utc_now() - timedelta(days=self.retention_days)
+        purged = 0
+        while not (get_remaining_time_ms and get_remaining_time_ms() < OUTBOX_STOP_MARGIN_MS):
+            async with self.session_maker_provider()() as session:
+                deleted = await self.outbox_repository.purge_processed(session, before, self.purge_batch_size)
+                await session.commit()
+            purged += deleted
+            if deleted < self.purge_batch_size:
+                break
+        return purged
+
+    async def run_forever(self) -> None:
+        """컨테이너처럼 오래 떠 있는 프로세스에서 lifespan 동안 outbox를 계속 비운다"""
+        while True:
+            try:
+                result = await self.drain()
+                await self.purge_if_due()
+            except Exception:
+                # DB 연결 실패 등은 다음 주기에 다시 시도하고, 가져간 이벤트는 lease가 끝나면 다시 처리된다
+                logger.exception("outbox 배치 처리 실패")
+                result = DrainResult()
+
+            if result.claimed < self.batch_size:
+                await asyncio.sleep(self.poll_interval_sec)
+
+    async def _process(self, event: ClaimedEvent, result: DrainResult) -> None:
+        try:
+            async with self.session_maker_provider()() as session:
+                if not await self.outbox_repository.mark_processed(session, event.id, utc_now()):
+                    result.skipped += 1
+                    return
+
+                handler = self.handlers.get(event.event_type)
+                if handler is None:
+                    raise ValueError(f"처리기가 없는 outbox 이벤트입니다: {event.event_type}")
+                await handler(session, event.payload)
+                await session.commit()
+        except Exception as e:
+            logger.exception("outbox 이벤트 처리 실패: id=%s type=%s", event.id, event.event_type)
+            result.failed += 1
+            await self._record_failure(event, f"{type(e).__name__}: {e}")
+            return
+
+        result.processed += 1
+
+    async def _process_batch(
+        self, handler: OutboxBatchHandler, events: list[ClaimedEvent], result: DrainResult
+    ) -> None:
+        try:
+            succeeded_flags = await handler([event.payload for event in events])
+        except Exception as e:
+            logger.exception("outbox 배치 처리 실패: type=%s count=%s", events[0].event_type, len(events))
+            succeeded_flags = [False] * len(events)
+            error = f"{type(e).__name__}: {e}"
+        else:
+            error = "배치 처리기에서 실패"
+
+        succeeded = [event for event, ok in zip(events, succeeded_flags) if ok]
+        if succeeded:
+            try:
+                async with self.session_maker_provider()() as session:
+                    marked = await self.outbox_repository.mark_processed_many(
+                        session, [event.id for event in succeeded], utc_now()
+                    )
+                    await session.commit()
+            except Exception:
+                # 완료 표시를 못 해도 lease가 끝나면 다시 처리되며, 배치 처리기의 효과는 멱등하다
+                logger.exception("outbox 배치 완료 표시 실패: count=%s", len(succeeded))
+            else:
+                result.processed += marked
+                result.skipped += len(succeeded) - marked
+
+        for event, ok in zip(events, succeeded_flags):
+            if not ok:
+                result.failed += 1
+                await self._record_failure(event, error)
+
+    async def _record_failure(self, event: ClaimedEvent, error: str) -> None:
+        retry_at = None
+        if event.attempts < self.max_attempts:
+            delay = min(self.retry_base_delay_sec * 2 ** (event.attempts - 1), self.retry_max_delay_sec)
+            retry_at = utc_now() + timedelta(seconds=delay)
+
+        try:
+            async with self.session_maker_provider()() as session:
+                await self.outbox_repository.record_failure(session, event.id, error, retry_at)
+                await session.commit()
+        except Exception:
+            # 기록하지 못해도 lease가 끝나면 다시 가져가므로 이벤트는 유실되지 않는다
+            logger.exception("outbox 이벤트 실패 기록 실패: id=%s", event.id)
+
+
+outbox_worker = OutboxWorker()
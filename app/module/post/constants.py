@@ -1 +1,7 @@
 PAGE_POST_LIMIT = 6
+
+# write-behind 모드에서 좋아요 수 증감분을 모아 반영하는 주기와 한도
+LIKE_BUFFER_FLUSH_INTERVAL_SEC = 0.3
+LIKE_BUFFER_MAX_PENDING_POSTS = 500
+# 이보다 오래 반영되지 못한 증감분(Lambda가 멈춰 있던 경우 등)은 버리고 reconciliation에 맡긴다
+LIKE_BUFFER_MAX_STALENESS_SEC = 5.0
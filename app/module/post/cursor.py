@@ -0,0 +1,27 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import NamedTuple
+
+from app.module.challenge.errors import InvalidPostCursorError
+
+
+class PostCursor(NamedTuple):
+    """미션 피드 keyset 위치 (created_at DESC, id DESC 정렬의 마지막 게시물)"""
+
+    created_at: datetime
+    post_id: int
+
+
+def encode_post_cursor(created_at: datetime, post_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{post_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_post_cursor(cursor: str) -> PostCursor:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, post_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").split("|")
+        return PostCursor(datetime.fromisoformat(created_at), int(post_id))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise InvalidPostCursorError(cursor)
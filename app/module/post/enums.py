@@ -0,0 +1,13 @@
+from enum import StrEnum
+from os import getenv
+
+
+class LikeCountMode(StrEnum):
+    SYNC = "sync"  # 토글마다 post_like_stats 카운터를 바로 증감
+    WRITE_BEHIND = (
+        "write_behind"  # 증감분을 프로세스 버퍼에 모아 주기적으로 한 번에 반영 (인기 게시물의 행 락 경합 완화)
+    )
+
+    @classmethod
+    def from_env(cls) -> "LikeCountMode":
+        return cls(getenv("LIKE_COUNT_MODE", cls.SYNC))
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from sqlalchemy import event
+
+from app.module.post.constants import (
+    LIKE_BUFFER_FLUSH_INTERVAL_SEC,
+    LIKE_BUFFER_MAX_PENDING_POSTS,
+    LIKE_BUFFER_MAX_STALENESS_SEC,
+)
+from app.module.post.post_repository import PostRepository
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_SESSION_PENDING_KEY = "like_count_buffer.pending"
+
+
+def _default_session_maker() -> "async_sessionmaker":
+    from app.database.config import get_async_session_maker
+
+    return get_async_session_maker()
+
+
+class LikeCountBuffer:
+    """post별 좋아요 수 증감분을 모았다가 한 번의 배치로 post_like_stats에 반영하는 write-behind 버퍼
+
+    같은 post의 증감은 합쳐지므로 인기 게시물이라도 flush 주기마다 카운터 행을 한 번만 갱신한다.
+    증감분은 요청 트랜잭션이 커밋된 뒤에만 버퍼에 들어가므로 롤백된 토글은 카운터에 반영되지 않는다.
+    flush는 요청 트랜잭션과 분리된 세션에서 커밋하며, 실패한 증감분은 버퍼로 되돌린다.
+    max_staleness_sec보다 오래 쌓인 증감분은 반영하지 않고 버리며, 어긋난 카운터는 reconciliation 작업이 맞춘다.
+    """
+
+    def __init__(
+        self,
+        flush_interval_sec: float = LIKE_BUFFER_FLUSH_INTERVAL_SEC,
+        max_pending_posts: int = LIKE_BUFFER_MAX_PENDING_POSTS,
+        max_staleness_sec: float = LIKE_BUFFER_MAX_STALENESS_SEC,
+        session_maker_provider: Callable[[], "async_sessionmaker"] = _default_session_maker,
+    ):
+        self.post_repository = PostRepository()
+        self.flush_interval_sec = flush_interval_sec
+        self.max_pending_posts = max_pending_posts
+        self.max_staleness_sec = max_staleness_sec
+        self.session_maker_provider = session_maker_provider
+        self.flushed_batches = 0
+        self.discarded_deltas = 0
+        self._deltas: dict[int, int] = {}
+        self._pending_since: float | None = None
+        self._lock = threading.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    def add(self, post_id: int, delta: int) -> None:
+        with self._lock:
+            self._deltas[post_id] = self._deltas.get(post_id, 0) + delta
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+
+    def add_after_commit(self, session: "AsyncSession", post_id: int, delta: int) -> None:
+        """session의 트랜잭션이 커밋되면 증감분을 버퍼에 넣고, 롤백되면 버린다"""
+        pending = session.info.get(_SESSION_PENDING_KEY)
+        if pending is None:
+            pending = session.info[_SESSION_PENDING_KEY] = []
+            event.listen(session.sync_session, "after_commit", self._on_commit)
+            event.listen(session.sync_session, "after_rollback", self._on_rollback)
+        pending.append((post_id, delta))
+
+    def _on_commit(self, session: "Session") -> None:
+        for post_id, delta in session.info.pop(_SESSION_PENDING_KEY, []):
+            self.add(post_id, delta)
+        if self.is_due():
+            # 커밋이 끝난 뒤 요청과 분리해서 flush하므로 flush 실패가 요청 결과에 영향을 주지 않는다
+            task = asyncio.get_running_loop().create_task(self._flush_if_due_logging_errors())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    def _on_rollback(self, session: "Session") -> None:
+        session.info.pop(_SESSION_PENDING_KEY, None)
+
+    def pending_delta(self, post_id: int) -> int:
+        with self._lock:
+            return self._deltas.get(post_id, 0)
+
+    def is_due(self) -> bool:
+        with self._lock:
+            if self._pending_since is None:
+                return False
+            elapsed = time.monotonic() - self._pending_since
+            return elapsed >= self.flush_interval_sec or len(self._deltas) >= self.max_pending_posts
+
+    def drain(self) -> tuple[dict[int, int], float | None]:
+        """버퍼를 비우고 반영할 증감분과 가장 오래된 증감 시각을 반환. 너무 오래된 증감분은 버린다"""
+        with self._lock:
+            deltas, self._deltas = self._deltas, {}
+            pending_since, self._pending_since = self._pending_since, None
+
+        if pending_since is not None and time.monotonic() - pending_since > self.max_staleness_sec:
+            self.discarded_deltas += sum(abs(delta) for delta in deltas.values())
+            return {}, None
+        return {post_id: delta for post_id, delta in deltas.items() if delta}, pending_since
+
+    def _restore(self, deltas: dict[int, int], pending_since: float | None) -> None:
+        # 실패한 증감분은 원래 시각을 유지해 재시도가 staleness 한도를 넘기지 않게 한다
+        with self._lock:
+            for post_id, delta in deltas.items():
+                self._deltas[post_id] = self._deltas.get(post_id, 0) + delta
+            if pending_since is not None:
+                self._pending_since = min(self._pending_since or pending_since, pending_since)
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            deltas, pending_since = self.drain()
+            if not deltas:
+                return 0
+
+            try:
+                async with self.session_maker_provider()() as session:
+                    await self.post_repository.apply_like_count_deltas(session, deltas)
+                    await session.commit()
+            except Exception:
+                self._restore(deltas, pending_since)
+                raise
+
+            self.flushed_batches += 1
+            return len(deltas)
+
+    async def flush_if_due(self) -> None:
+        if self.is_due():
+            await self.flush()
+
+    async def _flush_if_due_logging_errors(self) -> None:
+        try:
+            await self.flush_if_due()
+        except Exception:
+            # 다음 flush에서 다시 시도하고, 오래된 증감분은 drain에서 버려진다
+            logger.exception("좋아요 수 flush 실패")
+
+    async def run_periodic_flush(self) -> None:
+        """컨테이너처럼 오래 떠 있는 프로세스에서 lifespan 동안 주기적으로 flush"""
+        while True:
+            await asyncio.sleep(self.flush_interval_sec)
+            await self._flush_if_due_logging_errors()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            pending_posts = len(self._deltas)
+        return {
+            "pending_posts": pending_posts,
+            "flushed_batches": self.flushed_batches,
+            "discarded_deltas": self.discarded_deltas,
+        }
+
+
+like_count_buffer = LikeCountBuffer()
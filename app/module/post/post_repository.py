@@ -1,65 +1,59 @@
-from sqlalchemy import desc, func, select
+from datetime import datetime
+
+from sqlalchemy import Select, and_, case, delete, desc, func, or_, select, update
+from sqlalchemy.dialects.mysql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from app.common.utils.time import utc_now
 from app.database.generic_repository import GenericRepository
-from app.model.post import Post, PostImage, PostLike
+from app.model.post import Post, PostImage, PostLike, PostLikeStats
 from app.model.user import User
+from app.module.post.cursor import PostCursor
 
 
 class PostRepository(GenericRepository):
     def __init__(self):
         super().__init__(Post)
 
-    async def get_recent_posts_by_mission(
-        self, session: AsyncSession, mission_id: int, limit: int = 6
-    ) -> list[tuple[int, User, PostImage | None]]:
-        stmt = (
-            select(Post.id, Post.created_at, User, PostImage)  # type: ignore
-            .join(User, Post.user_id == User.id)  # type: ignore
-            .outerjoin(PostImage, PostImage.post_id == Post.id)  # type: ignore
-            .where(Post.mission_id == mission_id)  # type: ignore
-            .order_by(desc(Post.created_at))  # type: ignore
-            .limit(limit)
-        )
+    async def get_mission_feed(
+        self, session: AsyncSession, mission_id: int, limit: int, cursor: PostCursor | None = None
+    ) -> list[tuple[int, datetime, User, PostImage | None]]:
+        stmt = self._mission_feed_stmt(mission_id, limit, cursor)
 
         result = await session.execute(stmt)
         rows = result.all()
 
-        return [(post_id, user, post_image) for post_id, _, user, post_image in rows]
+        return [(post_id, created_at, user, post_image) for post_id, created_at, user, post_image in rows]
 
-    async def get_posts_by_mission_with_cursor(
-        self, session: AsyncSession, mission_id: int, limit: int, cursor: int | None = None
-    ) -> list[tuple[int, User, PostImage | None]]:
+    @staticmethod
+    def _mission_feed_stmt(mission_id: int, limit: int, cursor: PostCursor | None = None) -> Select:
+        # ix_post_mission_id_created_at_id 인덱스를 역순으로 읽어 filesort 없이 정렬
         stmt = (
-            select(Post.id, User, PostImage)  # type: ignore
+            select(Post.id, Post.created_at, User, PostImage)  # type: ignore
             .join(User, Post.user_id == User.id)  # type: ignore
             .outerjoin(PostImage, PostImage.post_id == Post.id)  # type: ignore
             .where(Post.mission_id == mission_id)  # type: ignore
         )
 
         if cursor is not None:
-            stmt = stmt.where(Post.id < cursor)  # type: ignore
-
-        stmt = stmt.order_by(desc(Post.id)).limit(limit)  # type: ignore
-
-        result = await session.execute(stmt)
-        rows = result.all()
+            stmt = stmt.where(
+                or_(
+                    Post.created_at < cursor.created_at,  # type: ignore
+                    and_(Post.created_at == cursor.created_at, Post.id < cursor.post_id),  # type: ignore
+                )
+            )
 
-        return [(post_id, user, post_image) for post_id, user, post_image in rows]
+        return stmt.order_by(desc(Post.created_at), desc(Post.id)).limit(limit)  # type: ignore
 
     async def get_post_info(
         self, session: AsyncSession, post_id: int
     ) -> tuple[int, User, PostImage | None, int] | None:
-        like_count_subquery = (
-            select(func.count(PostLike.id))  # type: ignore
-            .where(PostLike.post_id == post_id)  # type: ignore
-            .scalar_subquery()
-        )
-
         stmt = (
-            select(Post.id, User, PostImage, like_count_subquery)  # type: ignore
+            select(Post.id, User, PostImage, func.coalesce(PostLikeStats.like_count, 0))  # type: ignore
             .join(User, Post.user_id == User.id)  # type: ignore
             .outerjoin(PostImage, PostImage.post_id == Post.id)  # type: ignore
+            .outerjoin(PostLikeStats, PostLikeStats.post_id == Post.id)  # type: ignore
             .where(Post.id == post_id)  # type: ignore
         )
 
@@ -71,20 +65,92 @@ class PostRepository(GenericRepository):
 
         return (row[0], row[1], row[2], row[3])
 
-    async def get_post_like(self, session: AsyncSession, user_id: int, post_id: int) -> PostLike | None:
-        stmt = select(PostLike).where(PostLike.user_id == user_id, PostLike.post_id == post_id)  # type: ignore
+    async def get_like_summaries(
+        self, session: AsyncSession, post_ids: list[int], viewer_id: int
+    ) -> dict[int, tuple[int, bool]]:
+        """피드 한 페이지의 post별 (좋아요 수, 조회자 좋아요 여부)를 IN 쿼리 한 번으로 조회
+
+        좋아요 수는 post_like_stats PK로, 조회자 좋아요 여부는 post_like의 (user_id, post_id) unique 인덱스로 찾는다.
+        """
+        if not post_ids:
+            return {}
+
+        viewer_like = aliased(PostLike)
+        stmt = (
+            select(
+                Post.id,
+                func.coalesce(PostLikeStats.like_count, 0),
+                viewer_like.id.is_not(None),  # type: ignore
+            )
+            .outerjoin(PostLikeStats, PostLikeStats.post_id == Post.id)  # type: ignore
+            .outerjoin(
+                viewer_like,
+                and_(viewer_like.post_id == Post.id, viewer_like.user_id == viewer_id),  # type: ignore
+            )
+            .where(Post.id.in_(post_ids))  # type: ignore
+        )
+
         result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        return {post_id: (like_count, bool(is_liked)) for post_id, like_count, is_liked in result.all()}
+
+    async def insert_post_like_if_absent(self, session: AsyncSession, user_id: int, post_id: int) -> bool:
+        """좋아요가 없을 때만 추가하고 추가 여부 반환
 
-    async def add_post_like(self, session: AsyncSession, user_id: int, post_id: int) -> None:
-        post_like = PostLike(user_id=user_id, post_id=post_id)
-        session.add(post_like)
-        await session.flush()
+        INSERT IGNORE는 (user_id, post_id) 중복과 없는 post_id의 FK 오류를 모두 0 row로 돌려준다.
+        """
+        stmt = insert(PostLike).values(user_id=user_id, post_id=post_id).prefix_with("IGNORE")
+        result = await session.execute(stmt)
+        return result.rowcount == 1  # type: ignore
 
-    async def delete_post_like(self, session: AsyncSession, post_like: PostLike) -> None:
-        await session.delete(post_like)
+    async def delete_post_like(self, session: AsyncSession, user_id: int, post_id: int) -> bool:
+        stmt = delete(PostLike).where(PostLike.user_id == user_id, PostLike.post_id == post_id)  # type: ignore
+        result = await session.execute(stmt)
+        return result.rowcount == 1  # type: ignore
+
+    async def increment_like_count(self, session: AsyncSession, post_id: int, amount: int) -> int:
+        """post_like_stats 카운터를 원자적으로 증감하고 증감 후 값을 반환
+
+        갱신 값을 LAST_INSERT_ID(expr)로 감싸면 MySQL이 OK 패킷의 insert id로 돌려주므로 다시 조회하지 않는다.
+        행이 새로 만들어진 경우 insert id는 0이며, 그때의 값은 max(amount, 0)이다.
+        """
+        initial_count = max(amount, 0)
+        stmt = insert(PostLikeStats).values(post_id=post_id, like_count=initial_count)
+        stmt = stmt.on_duplicate_key_update(
+            like_count=func.last_insert_id(func.greatest(PostLikeStats.like_count + amount, 0)),
+            updated_at=utc_now(),
+        )
+        result = await session.execute(stmt)
+        return result.lastrowid or initial_count  # type: ignore
 
-    async def get_post_like_count(self, session: AsyncSession, post_id: int) -> int:
-        stmt = select(func.count(PostLike.id)).where(PostLike.post_id == post_id)  # type: ignore
+    async def get_like_count(self, session: AsyncSession, post_id: int) -> int:
+        stmt = select(PostLikeStats.like_count).where(PostLikeStats.post_id == post_id)  # type: ignore
         result = await session.execute(stmt)
-        return result.scalar() or 0
+        return result.scalar_one_or_none() or 0
+
+    async def apply_like_count_deltas(self, session: AsyncSession, deltas: dict[int, int]) -> None:
+        """write-behind 버퍼에 모인 post별 증감분을 문장 두 개로 반영
+
+        증가분은 multi-row upsert로, 감소분은 CASE로 묶은 UPDATE 한 번으로 처리해 flush당 카운터 행을 한 번씩만 잠근다.
+        """
+        now = utc_now()
+        increments = {post_id: delta for post_id, delta in deltas.items() if delta > 0}
+        decrements = {post_id: delta for post_id, delta in deltas.items() if delta < 0}
+
+        if increments:
+            stmt = insert(PostLikeStats).values(
+                [{"post_id": post_id, "like_count": delta} for post_id, delta in sorted(increments.items())]
+            )
+            stmt = stmt.on_duplicate_key_update(
+                like_count=PostLikeStats.like_count + stmt.inserted.like_count,
+                updated_at=now,
+            )
+            await session.execute(stmt)
+
+        if decrements:
+            delta_case = case(decrements, value=PostLikeStats.post_id)
+            stmt = (
+                update(PostLikeStats)
+                .where(PostLikeStats.post_id.in_(sorted(decrements)))  # type: ignore
+                .values(like_count=func.greatest(PostLikeStats.like_count + delta_case, 0), updated_at=now)
+            )
+            await session.execute(stmt)
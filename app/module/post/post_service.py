@@ -1,22 +1,24 @@
-import asyncio
-
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.challenge.v1.schema import MissionPost
 from app.api.post.v1.schema import PostInfoResponse, PostRequest
+from app.common.container import container
 from app.common.utils.time import utc_now
 from app.database.generic_repository import GenericRepository
 from app.model.post import PostImage
-from app.model.user import User
 from app.module.challenge.challenge_repository import (
-    ChallengeRepository,
+    MissionRepository,
     UserChallengeRepository,
     UserMissionRepository,
 )
-from app.module.challenge.enums import ChallengeStatusType, MissionStatusType
 from app.module.challenge.errors import UserMissionNotInProgressError
 from app.module.media.enums import UploadType
 from app.module.media.media_service import MediaService
+from app.module.outbox import events
+from app.module.outbox.outbox_repository import OutboxRepository
+from app.module.post.cursor import decode_post_cursor, encode_post_cursor
+from app.module.post.enums import LikeCountMode
+from app.module.post.like_buffer import like_count_buffer
 from app.module.post.post_repository import PostRepository
 
 
@@ -24,10 +26,13 @@ class PostService:
     def __init__(self):
         self.post_repository = PostRepository()
         self.post_image_repository = GenericRepository(PostImage)
-        self.media_service = MediaService()
+        self.media_service = container.get(MediaService)
         self.user_mission_repository = UserMissionRepository()
         self.user_challenge_repository = UserChallengeRepository()
-        self.challenge_repository = ChallengeRepository()
+        self.mission_repository = MissionRepository()
+        self.outbox_repository = OutboxRepository()
+        self.like_count_mode = LikeCountMode.from_env()
+        self.like_count_buffer = like_count_buffer
 
     async def add_post(
         self,
@@ -35,27 +40,32 @@ class PostService:
         post_request: PostRequest,
         session: AsyncSession,
     ) -> None:
+        """게시물 작성과 미션 완료를 SELECT 한 번 + PK 기반 쓰기 문장으로 처리
+
+        post id는 INSERT의 lastrowid를 그대로 쓰고, user_mission과 user_challenge는 다시 조회하지 않고 PK로 UPDATE한다.
+        챌린지 완료 여부는 user_challenge의 완료 미션 카운터로 같은 UPDATE 안에서 판단한다.
+        진행 인원 카운터, 배지 평가, 이미지 확정은 같은 트랜잭션에서 outbox_event에 적재하고 worker가 커밋 이후에 처리한다.
+        """
         user_mission = await self._validate_user_mission(session, user_id, post_request.mission_id)
 
-        post = await self.post_repository.create(
-            session,
-            return_instance=True,
-            user_id=user_id,
-            mission_id=post_request.mission_id,
-            content=post_request.content,
+        [post_id] = await self.post_repository.bulk_create(
+            session, [{"user_id": user_id, "mission_id": post_request.mission_id, "content": post_request.content}]
         )
+        await self._create_post_image_if_exists(session, post_id, post_request.image_key)
 
-        await self._create_post_image_if_exists(session, post.id, post_request.image_key)  # type: ignore
+        # 조회 이후 다른 요청이 먼저 완료했다면 0 row이며, 예외로 게시물 INSERT까지 롤백된다
+        if not await self.user_mission_repository.complete_mission(session, user_mission.id, post_id):
+            raise UserMissionNotInProgressError(user_id, post_request.mission_id)
 
-        await self.user_mission_repository.update(
-            session,
-            user_mission.id,  # type: ignore
-            status=MissionStatusType.COMPLETED,
-            post_id=post.id,  # type: ignore
-            completed_at=utc_now(),
-        )
+        await self.user_challenge_repository.increment_completed_missions(session, user_mission.user_challenge_id)
 
-        await self._complete_challenge_if_finished(session, user_mission.user_challenge_id)
+        messages = [
+            events.mission_headcount(post_id, user_mission.mission_id, -1),
+            events.badge_evaluation(post_id, user_id, utc_now()),
+        ]
+        if post_request.image_key:
+            messages.append(events.image_confirmation(post_id, post_request.image_key))
+        await self.outbox_repository.enqueue(session, messages)
 
     async def _validate_user_mission(self, session: AsyncSession, user_id: int, mission_id: int):
         user_mission = await self.user_mission_repository.get_user_mission_in_progress(session, user_id, mission_id)
@@ -65,64 +75,44 @@ class PostService:
 
     async def _create_post_image_if_exists(self, session: AsyncSession, post_id: int, image_key: str | None) -> None:
         if image_key:
-            await self.post_image_repository.create(
+            await self.post_image_repository.bulk_create(
                 session,
-                post_id=post_id,
-                file_key=image_key,
-                upload_type=UploadType.from_file_key(image_key),
+                [{"post_id": post_id, "file_key": image_key, "upload_type": UploadType.from_file_key(image_key)}],
             )
 
-    async def _complete_challenge_if_finished(self, session: AsyncSession, user_challenge_id: int) -> None:
-        user_challenge = await self.user_challenge_repository.get_by_id(session, user_challenge_id)
-        if not user_challenge:
-            return
-
-        is_finished = await self._is_challenge_finished(session, user_challenge)
-        if is_finished:
-            await self.user_challenge_repository.update(
-                session, user_challenge.id, status=ChallengeStatusType.COMPLETED  # type: ignore
+    async def get_mission_feed(
+        self, session: AsyncSession, mission_id: int, limit: int, viewer_id: int, cursor: str | None = None
+    ) -> tuple[list[MissionPost], str | None]:
+        post_cursor = decode_post_cursor(cursor) if cursor else None
+        rows = await self.post_repository.get_mission_feed(session, mission_id, limit, post_cursor)
+
+        file_keys = [post_image.file_key for _, _, _, post_image in rows if post_image]
+        image_urls = self.media_service.get_presigned_view_urls(file_keys) if file_keys else {}
+
+        # 타일마다 게시물 상세를 다시 부르지 않도록 페이지 전체의 좋아요 정보를 한 번에 붙인다
+        post_ids = [post_id for post_id, _, _, _ in rows]
+        like_summaries = await self.post_repository.get_like_summaries(session, post_ids, viewer_id) if rows else {}
+
+        posts = []
+        for post_id, _, user, post_image in rows:
+            like_count, is_liked = like_summaries.get(post_id, (0, False))
+            posts.append(
+                MissionPost(
+                    user_id=user.id,
+                    post_id=post_id,
+                    nickname=user.nickname,
+                    image_url=image_urls[post_image.file_key] if post_image else None,
+                    like_count=self._visible_like_count(post_id, like_count),
+                    is_liked=is_liked,
+                )
             )
 
-    async def _is_challenge_finished(self, session: AsyncSession, user_challenge) -> bool:
-        challenge_missions = await self.challenge_repository.get_challenge_missions(
-            session, user_challenge.challenge_id
-        )
-        completed_count = await self.user_mission_repository.count(
-            session, user_challenge_id=user_challenge.id, status=MissionStatusType.COMPLETED
-        )
-        return completed_count == len(challenge_missions)
-
-    async def get_recent_mission_posts_with_images(
-        self, session: AsyncSession, mission_id: int, limit: int
-    ) -> list[MissionPost]:
-        recent_posts = await self.post_repository.get_recent_posts_by_mission(session, mission_id, limit)
-
-        tasks = [self._create_mission_post(post_id, user, post_image) for post_id, user, post_image in recent_posts]
-        results = await asyncio.gather(*tasks)
-
-        return results
-
-    async def get_mission_posts_paginated(
-        self, session: AsyncSession, mission_id: int, limit: int, cursor: int | None = None
-    ) -> list[MissionPost]:
-        posts = await self.post_repository.get_posts_by_mission_with_cursor(session, mission_id, limit, cursor)
+        next_cursor = None
+        if rows:
+            last_post_id, last_created_at, _, _ = rows[-1]
+            next_cursor = encode_post_cursor(last_created_at, last_post_id)
 
-        tasks = [self._create_mission_post(post_id, user, post_image) for post_id, user, post_image in posts]
-        results = await asyncio.gather(*tasks)
-
-        return results
-
-    async def _create_mission_post(self, post_id: int, user: User, post_image: PostImage | None) -> MissionPost:
-        image_url = None
-        if post_image:
-            image_url = await asyncio.to_thread(self.media_service.get_presigned_view_url, post_image.file_key)
-
-        return MissionPost(
-            user_id=user.id,
-            post_id=post_id,
-            nickname=user.nickname,
-            image_url=image_url,
-        )
+        return posts, next_cursor
 
     async def get_post_info(self, session: AsyncSession, post_id: int) -> PostInfoResponse:
         post_data = await self.post_repository.get_post_info(session, post_id)
@@ -134,7 +124,7 @@ class PostService:
 
         image_url = None
         if post_image:
-            image_url = await asyncio.to_thread(self.media_service.get_presigned_view_url, post_image.file_key)
+            image_url = self.media_service.get_presigned_view_urls([post_image.file_key])[post_image.file_key]
 
         return PostInfoResponse(
             user_id=user.id,
@@ -145,15 +135,31 @@ class PostService:
         )
 
     async def toggle_post_like(self, session: AsyncSession, user_id: int, post_id: int) -> tuple[bool, int]:
-        existing_like = await self.post_repository.get_post_like(session, user_id, post_id)
-
-        if existing_like:
-            await self.post_repository.delete_post_like(session, existing_like)
-            is_liked = False
-        else:
-            await self.post_repository.add_post_like(session, user_id, post_id)
-            is_liked = True
-
-        await session.flush()
-        like_count = await self.post_repository.get_post_like_count(session, post_id)
-        return is_liked, like_count
+        """좋아요 추가/취소와 post_like_stats 카운터 증감을 같은 트랜잭션에서 처리
+
+        INSERT IGNORE가 0 row면 이미 좋아요한 상태이므로 삭제한다. 조건부 INSERT/DELETE의 영향 row 수로
+        판단하므로 동시에 토글해도 카운터가 실제 좋아요 수와 어긋나지 않는다.
+        write-behind 모드에서는 좋아요 행만 바로 쓰고 카운터 증감은 버퍼에 맡긴다.
+        """
+        if await self.post_repository.insert_post_like_if_absent(session, user_id, post_id):
+            return True, await self._apply_like_delta(session, post_id, 1)
+
+        if await self.post_repository.delete_post_like(session, user_id, post_id):
+            return False, await self._apply_like_delta(session, post_id, -1)
+
+        raise ValueError(f"Post {post_id}가 존재하지 않습니다.")
+
+    async def _apply_like_delta(self, session: AsyncSession, post_id: int, delta: int) -> int:
+        if self.like_count_mode == LikeCountMode.SYNC:
+            return await self.post_repository.increment_like_count(session, post_id, delta)
+
+        self.like_count_buffer.add_after_commit(session, post_id, delta)
+        like_count = await self.post_repository.get_like_count(session, post_id)
+        # 이번 증감분은 요청이 커밋된 뒤에야 버퍼에 들어가므로 따로 더한다
+        return self._visible_like_count(post_id, like_count, uncommitted_delta=delta)
+
+    def _visible_like_count(self, post_id: int, like_count: int, uncommitted_delta: int = 0) -> int:
+        # write-behind 모드에서는 DB 카운터에 아직 반영되지 않은 이 프로세스의 증감분을 더한 근사치
+        if self.like_count_mode == LikeCountMode.SYNC:
+            return like_count
+        return max(like_count + self.like_count_buffer.pending_delta(post_id) + uncommitted_delta, 0)
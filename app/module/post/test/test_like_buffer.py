@@ -0,0 +1,164 @@
+import asyncio
+import time
+from typing import cast
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.module.post.like_buffer import LikeCountBuffer
+
+
+class FakeSessionMaker:
+    def __init__(self, session):
+        self.session = session
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self.session
+
+    async def __aexit__(self, *args):
+        return False
+
+
+@pytest.fixture
+def session():
+    session = Mock()
+    session.commit = AsyncMock()
+    return session
+
+
+@pytest_asyncio.fixture
+async def request_session():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with async_sessionmaker(engine)() as session:
+        yield session
+    await engine.dispose()
+
+
+def make_buffer(session, **kwargs) -> LikeCountBuffer:
+    buffer = LikeCountBuffer(
+        session_maker_provider=lambda: cast(async_sessionmaker, FakeSessionMaker(session)), **kwargs
+    )
+    buffer.post_repository = Mock()
+    buffer.post_repository.apply_like_count_deltas = AsyncMock()
+    return buffer
+
+
+class TestLikeCountBuffer:
+    @pytest.mark.asyncio
+    async def test_coalesces_deltas_into_one_flush(self, session):
+        # given
+        buffer = make_buffer(session)
+        for _ in range(100):
+            buffer.add(10, 1)
+        buffer.add(10, -1)
+        buffer.add(11, -1)
+        buffer.add(12, 1)
+        buffer.add(12, -1)
+
+        # when
+        flushed = await buffer.flush()
+
+        # then
+        assert flushed == 2
+        buffer.post_repository.apply_like_count_deltas.assert_awaited_once_with(session, {10: 99, 11: -1})
+        session.commit.assert_awaited_once()
+        assert buffer.stats() == {"pending_posts": 0, "flushed_batches": 1, "discarded_deltas": 0}
+
+    @pytest.mark.asyncio
+    async def test_flush_if_due_waits_for_interval_or_size(self, session):
+        # given
+        buffer = make_buffer(session, flush_interval_sec=60, max_pending_posts=3)
+        buffer.add(1, 1)
+        buffer.add(2, 1)
+
+        # when
+        await buffer.flush_if_due()
+        buffer.add(3, 1)
+        await buffer.flush_if_due()
+
+        # then
+        buffer.post_repository.apply_like_count_deltas.assert_awaited_once_with(session, {1: 1, 2: 1, 3: 1})
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_deltas(self, session):
+        # given
+        buffer = make_buffer(session)
+        buffer.post_repository.apply_like_count_deltas.side_effect = RuntimeError("db down")
+        buffer.add(10, 2)
+
+        # when
+        with pytest.raises(RuntimeError):
+            await buffer.flush()
+        buffer.add(10, 1)
+
+        # then
+        assert buffer.pending_delta(10) == 3
+
+    @pytest.mark.asyncio
+    async def test_discards_deltas_older_than_staleness_bound(self, session):
+        # given
+        buffer = make_buffer(session, max_staleness_sec=5)
+        buffer.add(10, 1)
+        buffer.add(11, -2)
+        buffer._pending_since = time.monotonic() - 10
+
+        # when
+        flushed = await buffer.flush()
+
+        # then
+        assert flushed == 0
+        buffer.post_repository.apply_like_count_deltas.assert_not_called()
+        assert buffer.stats()["discarded_deltas"] == 3
+
+
+class TestAddAfterCommit:
+    @pytest.mark.asyncio
+    async def test_buffers_delta_only_after_commit(self, session, request_session):
+        # given
+        buffer = make_buffer(session, flush_interval_sec=60)
+        buffer.add_after_commit(request_session, 10, 1)
+        buffer.add_after_commit(request_session, 10, 1)
+        assert buffer.pending_delta(10) == 0
+
+        # when
+        await request_session.commit()
+
+        # then
+        assert buffer.pending_delta(10) == 2
+
+    @pytest.mark.asyncio
+    async def test_discards_delta_on_rollback(self, session, request_session):
+        # given
+        buffer = make_buffer(session, flush_interval_sec=60)
+        await request_session.execute(text("SELECT 1"))
+        buffer.add_after_commit(request_session, 10, 1)
+
+        # when
+        await request_session.rollback()
+        await request_session.commit()
+
+        # then
+        assert buffer.pending_delta(10) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_after_commit_is_logged_not_raised(self, session, request_session, caplog):
+        # given
+        buffer = make_buffer(session, flush_interval_sec=0)
+        buffer.post_repository.apply_like_count_deltas.side_effect = RuntimeError("db down")
+        buffer.add_after_commit(request_session, 10, 1)
+
+        # when
+        await request_session.commit()
+        await asyncio.gather(*buffer._flush_tasks)
+
+        # then
+        buffer.post_repository.apply_like_count_deltas.assert_awaited_once_with(session, {10: 1})
+        assert buffer.pending_delta(10) == 1
+        assert "좋아요 수 flush 실패" in caplog.text
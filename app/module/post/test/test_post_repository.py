@@ -0,0 +1,166 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+
+import app.model  # noqa: F401
+from app.model.post import Post, PostLike, PostLikeStats
+from app.model.user import User
+from app.module.challenge.errors import InvalidPostCursorError
+from app.module.post.cursor import PostCursor, decode_post_cursor, encode_post_cursor
+from app.module.post.post_repository import PostRepository
+
+
+@pytest.fixture(scope="module")
+def sqlite_engine():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def explain(engine, stmt) -> list[str]:
+    compiled = stmt.compile(engine)
+    params = tuple(
+        value.isoformat(" ") if isinstance(value, datetime) else value
+        for value in (compiled.params[name] for name in compiled.positiontup)
+    )
+    with engine.connect() as conn:
+        return [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)]
+
+
+class TestMissionFeedQuery:
+    @pytest.mark.parametrize(
+        "cursor", [None, PostCursor(datetime(2026, 10, 17, 12, 0, 0), 100)], ids=["first_page", "next_page"]
+    )
+    def test_uses_feed_index_without_filesort(self, sqlite_engine, cursor):
+        # given
+        stmt = PostRepository._mission_feed_stmt(mission_id=1, limit=6, cursor=cursor)
+
+        # when
+        plan = explain(sqlite_engine, stmt)
+
+        # then
+        assert any("ix_post_mission_id_created_at_id" in detail for detail in plan), plan
+        assert not any("TEMP B-TREE" in detail for detail in plan), plan
+
+
+class TestPostLikeCounter:
+    @pytest.fixture
+    def session(self):
+        session = Mock()
+        session.execute = AsyncMock(return_value=Mock(rowcount=1, lastrowid=0))
+        return session
+
+    @staticmethod
+    def compiled_sql(session) -> str:
+        stmt = session.execute.await_args.args[0]
+        return str(stmt.compile(dialect=mysql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_insert_like_ignores_duplicate(self, session):
+        # when
+        inserted = await PostRepository().insert_post_like_if_absent(session, user_id=1, post_id=10)
+
+        # then
+        assert inserted is True
+        assert self.compiled_sql(session).startswith("INSERT IGNORE INTO post_like")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("amount, lastrowid, expected", [(1, 0, 1), (1, 5, 5), (-1, 0, 0), (-1, 2, 2)])
+    async def test_increment_returns_counter_from_last_insert_id(self, session, amount, lastrowid, expected):
+        # given
+        session.execute.return_value = Mock(lastrowid=lastrowid)
+
+        # when
+        like_count = await PostRepository().increment_like_count(session, post_id=10, amount=amount)
+
+        # then
+        sql = self.compiled_sql(session)
+        assert like_count == expected
+        assert "like_count = last_insert_id(greatest(post_like_stats.like_count + " in sql
+
+    @pytest.mark.asyncio
+    async def test_apply_deltas_batches_increments_and_decrements(self, session):
+        # when
+        await PostRepository().apply_like_count_deltas(session, {10: 3, 11: -2, 12: 1, 13: -1})
+
+        # then
+        upsert, update = [
+            str(call.args[0].compile(dialect=mysql.dialect())) for call in session.execute.await_args_list
+        ]
+        assert upsert.startswith("INSERT INTO post_like_stats")
+        assert "like_count = (post_like_stats.like_count + VALUES(like_count))" in upsert
+        assert update.startswith("UPDATE post_like_stats SET")
+        assert "like_count=greatest(post_like_stats.like_count + CASE post_like_stats.post_id" in update
+        assert "post_like_stats.post_id IN" in update
+
+
+class TestLikeSummaries:
+    @pytest_asyncio.fixture
+    async def session(self):
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            session.add_all(
+                [User(id=1, provider="kakao", social_id="s1"), User(id=2, provider="kakao", social_id="s2")]
+            )
+            session.add_all([Post(id=post_id, user_id=1, mission_id=post_id, content="") for post_id in (10, 11, 12)])
+            session.add_all(
+                [PostLike(user_id=1, post_id=10), PostLike(user_id=2, post_id=10), PostLike(user_id=2, post_id=11)]
+            )
+            session.add_all([PostLikeStats(post_id=10, like_count=2), PostLikeStats(post_id=11, like_count=1)])
+            await session.commit()
+            yield session
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_returns_count_and_viewer_like_per_post(self, session):
+        # given
+        repository = PostRepository()
+        session.execute = AsyncMock(wraps=session.execute)
+
+        # when
+        summaries = await repository.get_like_summaries(session, [10, 11, 12], viewer_id=1)
+
+        # then
+        assert summaries == {10: (2, True), 11: (1, False), 12: (0, False)}
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_page_skips_query(self, session):
+        # given
+        session.execute = AsyncMock()
+
+        # when
+        summaries = await PostRepository().get_like_summaries(session, [], viewer_id=1)
+
+        # then
+        assert summaries == {}
+        session.execute.assert_not_called()
+
+
+class TestPostCursor:
+    def test_round_trip(self):
+        # given
+        created_at = datetime(2026, 10, 17, 12, 0, 0, 123456)
+
+        # when
+        token = encode_post_cursor(created_at, 42)
+
+        # then
+        assert "=" not in token
+        assert decode_post_cursor(token) == PostCursor(created_at, 42)
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "!!", encode_post_cursor(datetime(2026, 1, 1), 1)[:-3]])
+    def test_invalid_cursor(self, token):
+        # when & then
+        with pytest.raises(InvalidPostCursorError):
+            decode_post_cursor(token)
@@ -1,14 +1,33 @@
+from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from app.api.post.v1.schema import PostRequest
 from app.database.generic_repository import GenericRepository
-from app.model.post import Post
+from app.model.badge import Badge
+from app.model.post import PostImage
+from app.model.user import User
 from app.model.user_challenge import UserMission
+from app.module.badge.badge_service import BadgeService
+from app.module.badge.catalog import BadgeCatalog
+from app.module.badge.enums import BadgeNames
+from app.module.challenge.challenge_repository import (
+    MissionRepository,
+    UserChallengeRepository,
+    UserMissionRepository,
+)
 from app.module.challenge.enums import MissionStatusType
+from app.module.challenge.errors import UserMissionNotInProgressError
 from app.module.media.enums import UploadType
+from app.module.outbox.enums import OutboxEventType
+from app.module.outbox.outbox_repository import OutboxRepository
+from app.module.post.cursor import PostCursor, decode_post_cursor, encode_post_cursor
+from app.module.post.enums import LikeCountMode
+from app.module.post.like_buffer import LikeCountBuffer
 from app.module.post.post_service import PostService
 
 
@@ -18,9 +37,10 @@ def post_service():
         service = PostService()
         service.post_repository = Mock(spec=GenericRepository)
         service.post_image_repository = Mock(spec=GenericRepository)
-        service.user_mission_repository = Mock(spec=GenericRepository)
-        service.user_challenge_repository = Mock(spec=GenericRepository)
-        service.challenge_repository = Mock(spec=GenericRepository)
+        service.user_mission_repository = Mock(spec=UserMissionRepository)
+        service.user_challenge_repository = Mock(spec=UserChallengeRepository)
+        service.mission_repository = Mock(spec=MissionRepository)
+        service.outbox_repository = Mock(spec=OutboxRepository)
         service.media_service = Mock()
     return service
 
@@ -41,96 +61,249 @@ def post_request_without_image():
 
 
 class TestPostService:
+    @pytest.fixture
+    def user_mission(self):
+        return UserMission(id=10, user_challenge_id=1, mission_id=1, status=MissionStatusType.IN_PROGRESS)
+
     @pytest.mark.asyncio
-    async def test_add_post_with_image(self, post_service, mock_session, post_request):
+    async def test_add_post_with_image(self, post_service, mock_session, post_request, user_mission):
         # given
-        mock_user_mission = Mock(spec=UserMission)
-        mock_user_mission.id = 10
-        mock_user_mission.user_challenge_id = 1
-        mock_post = Mock(spec=Post)
-        mock_post.id = 1
-        post_service.user_mission_repository.get_user_mission_in_progress = AsyncMock(return_value=mock_user_mission)
-        post_service.post_repository.create = AsyncMock(return_value=mock_post)
-        post_service.post_image_repository.create = AsyncMock()
-        post_service.user_mission_repository.update = AsyncMock()
-        post_service.user_challenge_repository.get_by_id = AsyncMock(return_value=None)
+        post_service.user_mission_repository.get_user_mission_in_progress.return_value = user_mission
+        post_service.post_repository.bulk_create = AsyncMock(return_value=[1])
+        post_service.post_image_repository.bulk_create = AsyncMock(return_value=[5])
+        post_service.user_mission_repository.complete_mission.return_value = True
 
         # when
         await post_service.add_post(user_id=123, post_request=post_request, session=mock_session)
 
         # then
-        post_service.user_mission_repository.get_user_mission_in_progress.assert_called_once_with(mock_session, 123, 1)
-        post_service.post_repository.create.assert_called_once_with(
-            mock_session,
-            return_instance=True,
-            user_id=123,
-            mission_id=1,
-            content="테스트 게시물",
+        post_service.user_mission_repository.get_user_mission_in_progress.assert_awaited_once_with(mock_session, 123, 1)
+        post_service.post_repository.bulk_create.assert_awaited_once_with(
+            mock_session, [{"user_id": 123, "mission_id": 1, "content": "테스트 게시물"}]
         )
-        post_service.post_image_repository.create.assert_called_once_with(
-            mock_session, post_id=1, file_key="content/2025-09-16/test.jpg", upload_type=UploadType.CONTENT
+        post_service.post_image_repository.bulk_create.assert_awaited_once_with(
+            mock_session, [{"post_id": 1, "file_key": "content/2025-09-16/test.jpg", "upload_type": UploadType.CONTENT}]
         )
-        post_service.user_mission_repository.update.assert_called_once()
-        call_args = post_service.user_mission_repository.update.call_args
-        assert call_args[0][0] == mock_session
-        assert call_args[0][1] == 10
-        assert call_args[1]["status"] == MissionStatusType.COMPLETED
-        assert call_args[1]["post_id"] == 1
+        post_service.user_mission_repository.complete_mission.assert_awaited_once_with(mock_session, 10, 1)
+        post_service.user_challenge_repository.increment_completed_missions.assert_awaited_once_with(mock_session, 1)
+        post_service.mission_repository.increment_headcount.assert_not_called()
+
+        [messages] = post_service.outbox_repository.enqueue.await_args.args[1:]
+        assert [(message.event_type, message.idempotency_key) for message in messages] == [
+            (OutboxEventType.MISSION_HEADCOUNT, "post:1:headcount"),
+            (OutboxEventType.BADGE_EVALUATION, "post:1:badge"),
+            (OutboxEventType.IMAGE_CONFIRMATION, "post:1:image"),
+        ]
+        assert messages[0].payload == {"mission_id": 1, "amount": -1}
+        assert messages[1].payload["user_id"] == 123
+        assert messages[2].payload == {"file_key": "content/2025-09-16/test.jpg"}
 
     @pytest.mark.asyncio
-    async def test_add_post_without_image(self, post_service, mock_session, post_request_without_image):
+    async def test_add_post_without_image(self, post_service, mock_session, post_request_without_image, user_mission):
         # given
-        mock_user_mission = Mock(spec=UserMission)
-        mock_user_mission.id = 20
-        mock_user_mission.user_challenge_id = 1
-        mock_post = Mock(spec=Post)
-        mock_post.id = 1
-        post_service.user_mission_repository.get_user_mission_in_progress = AsyncMock(return_value=mock_user_mission)
-        post_service.post_repository.create = AsyncMock(return_value=mock_post)
-        post_service.post_image_repository.create = AsyncMock()
-        post_service.user_mission_repository.update = AsyncMock()
-        post_service.user_challenge_repository.get_by_id = AsyncMock(return_value=None)
+        post_service.user_mission_repository.get_user_mission_in_progress.return_value = user_mission
+        post_service.post_repository.bulk_create = AsyncMock(return_value=[1])
+        post_service.post_image_repository.bulk_create = AsyncMock()
+        post_service.user_mission_repository.complete_mission.return_value = True
 
         # when
         await post_service.add_post(user_id=123, post_request=post_request_without_image, session=mock_session)
 
         # then
-        post_service.user_mission_repository.get_user_mission_in_progress.assert_called_once_with(mock_session, 123, 1)
-        post_service.post_repository.create.assert_called_once_with(
-            mock_session,
-            return_instance=True,
-            user_id=123,
-            mission_id=1,
-            content="테스트 게시물",
-        )
-        post_service.post_image_repository.create.assert_not_called()
-        post_service.user_mission_repository.update.assert_called_once()
-        call_args = post_service.user_mission_repository.update.call_args
-        assert call_args[0][1] == 20
-        assert call_args[1]["status"] == MissionStatusType.COMPLETED
+        post_service.post_image_repository.bulk_create.assert_not_called()
+        post_service.user_mission_repository.complete_mission.assert_awaited_once_with(mock_session, 10, 1)
+        [messages] = post_service.outbox_repository.enqueue.await_args.args[1:]
+        assert OutboxEventType.IMAGE_CONFIRMATION not in [message.event_type for message in messages]
 
     @pytest.mark.asyncio
-    async def test_add_post_with_profile_image_type(self, post_service, mock_session):
+    async def test_add_post_with_profile_image_type(self, post_service, mock_session, user_mission):
         # given
         profile_request = PostRequest(
             mission_id=2, content="프로필 이미지 테스트", image_key="profile/2025-09-16/profile.jpg"
         )
-        mock_user_mission = Mock(spec=UserMission)
-        mock_user_mission.id = 30
-        mock_user_mission.user_challenge_id = 1
-        mock_post = Mock(spec=Post)
-        mock_post.id = 3
-        post_service.user_mission_repository.get_user_mission_in_progress = AsyncMock(return_value=mock_user_mission)
-        post_service.post_repository.create = AsyncMock(return_value=mock_post)
-        post_service.post_image_repository.create = AsyncMock()
-        post_service.user_mission_repository.update = AsyncMock()
-        post_service.user_challenge_repository.get_by_id = AsyncMock(return_value=None)
+        post_service.user_mission_repository.get_user_mission_in_progress.return_value = user_mission
+        post_service.post_repository.bulk_create = AsyncMock(return_value=[3])
+        post_service.post_image_repository.bulk_create = AsyncMock(return_value=[5])
+        post_service.user_mission_repository.complete_mission.return_value = True
 
         # when
         await post_service.add_post(user_id=789, post_request=profile_request, session=mock_session)
 
         # then
-        post_service.post_image_repository.create.assert_called_once_with(
-            mock_session, post_id=3, file_key="profile/2025-09-16/profile.jpg", upload_type=UploadType.PROFILE
+        post_service.post_image_repository.bulk_create.assert_awaited_once_with(
+            mock_session,
+            [{"post_id": 3, "file_key": "profile/2025-09-16/profile.jpg", "upload_type": UploadType.PROFILE}],
+        )
+
+    @pytest.mark.asyncio
+    async def test_add_post_when_mission_completed_concurrently(
+        self, post_service, mock_session, post_request_without_image, user_mission
+    ):
+        # given
+        post_service.user_mission_repository.get_user_mission_in_progress.return_value = user_mission
+        post_service.post_repository.bulk_create = AsyncMock(return_value=[1])
+        post_service.user_mission_repository.complete_mission.return_value = False
+
+        # when & then
+        with pytest.raises(UserMissionNotInProgressError):
+            await post_service.add_post(user_id=123, post_request=post_request_without_image, session=mock_session)
+        post_service.user_challenge_repository.increment_completed_missions.assert_not_called()
+        post_service.outbox_repository.enqueue.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_mission_feed_returns_keyset_cursor(self, post_service, mock_session):
+        # given
+        created_at = datetime(2026, 10, 17, 12, 0, 0)
+        user = User(id=1, nickname="닉네임")
+        rows = [
+            (12, created_at, user, PostImage(post_id=12, file_key="content/a.jpg", upload_type=UploadType.CONTENT)),
+            (11, created_at, user, None),
+        ]
+        post_service.post_repository.get_mission_feed = AsyncMock(return_value=rows)
+        post_service.post_repository.get_like_summaries = AsyncMock(return_value={12: (3, True)})
+        post_service.media_service.get_presigned_view_urls.return_value = {"content/a.jpg": "https://signed-a"}
+        cursor = encode_post_cursor(datetime(2026, 10, 17, 13, 0, 0), 20)
+
+        # when
+        posts, next_cursor = await post_service.get_mission_feed(mock_session, 1, 2, 7, cursor)
+
+        # then
+        post_service.post_repository.get_mission_feed.assert_awaited_once_with(
+            mock_session, 1, 2, PostCursor(datetime(2026, 10, 17, 13, 0, 0), 20)
+        )
+        post_service.media_service.get_presigned_view_urls.assert_called_once_with(["content/a.jpg"])
+        post_service.post_repository.get_like_summaries.assert_awaited_once_with(mock_session, [12, 11], 7)
+        assert [post.image_url for post in posts] == ["https://signed-a", None]
+        assert [(post.like_count, post.is_liked) for post in posts] == [(3, True), (0, False)]
+        assert decode_post_cursor(next_cursor) == PostCursor(created_at, 11)
+
+
+class TestTogglePostLike:
+    @pytest.mark.asyncio
+    async def test_like_increments_counter(self, post_service, mock_session):
+        # given
+        post_service.post_repository.insert_post_like_if_absent = AsyncMock(return_value=True)
+        post_service.post_repository.delete_post_like = AsyncMock()
+        post_service.post_repository.increment_like_count = AsyncMock(return_value=4)
+
+        # when
+        result = await post_service.toggle_post_like(mock_session, user_id=1, post_id=10)
+
+        # then
+        assert result == (True, 4)
+        post_service.post_repository.increment_like_count.assert_awaited_once_with(mock_session, 10, 1)
+        post_service.post_repository.delete_post_like.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unlike_decrements_counter(self, post_service, mock_session):
+        # given
+        post_service.post_repository.insert_post_like_if_absent = AsyncMock(return_value=False)
+        post_service.post_repository.delete_post_like = AsyncMock(return_value=True)
+        post_service.post_repository.increment_like_count = AsyncMock(return_value=3)
+
+        # when
+        result = await post_service.toggle_post_like(mock_session, user_id=1, post_id=10)
+
+        # then
+        assert result == (False, 3)
+        post_service.post_repository.increment_like_count.assert_awaited_once_with(mock_session, 10, -1)
+
+    @pytest.mark.asyncio
+    async def test_missing_post(self, post_service, mock_session):
+        # given
+        post_service.post_repository.insert_post_like_if_absent = AsyncMock(return_value=False)
+        post_service.post_repository.delete_post_like = AsyncMock(return_value=False)
+        post_service.post_repository.increment_like_count = AsyncMock()
+
+        # when & then
+        with pytest.raises(ValueError):
+            await post_service.toggle_post_like(mock_session, user_id=1, post_id=999)
+        post_service.post_repository.increment_like_count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_behind_buffers_counter_delta_after_commit(self, post_service, mock_session):
+        # given
+        mock_session.info = {}
+        mock_session.sync_session = Session()
+        post_service.like_count_mode = LikeCountMode.WRITE_BEHIND
+        post_service.like_count_buffer = LikeCountBuffer(flush_interval_sec=60)
+        post_service.post_repository.insert_post_like_if_absent = AsyncMock(return_value=True)
+        post_service.post_repository.increment_like_count = AsyncMock()
+        post_service.post_repository.get_like_count = AsyncMock(return_value=7)
+
+        # when
+        result = await post_service.toggle_post_like(mock_session, user_id=1, post_id=10)
+
+        # then
+        assert result == (True, 8)
+        assert mock_session.info["like_count_buffer.pending"] == [(10, 1)]
+        assert post_service.like_count_buffer.pending_delta(10) == 0
+        post_service.post_repository.increment_like_count.assert_not_called()
+
+
+class TestAddPostQueryBudget:
+    @pytest.fixture
+    def counting_session(self):
+        user_mission = UserMission(id=10, user_challenge_id=1, mission_id=1, status=MissionStatusType.IN_PROGRESS)
+
+        def execute(stmt, *args, **kwargs):
+            return Mock(
+                lastrowid=100,
+                rowcount=1,
+                scalar_one_or_none=Mock(return_value=user_mission),
+                first=Mock(return_value=None),
+            )
+
+        session = Mock(spec=AsyncSession)
+        session.execute = AsyncMock(side_effect=execute)
+        return session
+
+    @staticmethod
+    def compiled_statements(session) -> list[str]:
+        return [str(call.args[0].compile(dialect=mysql.dialect())) for call in session.execute.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_completes_mission_within_statement_budget(self, counting_session, post_request):
+        # given
+        with patch("app.module.post.post_service.MediaService"):
+            post_service = PostService()
+
+        # when
+        await post_service.add_post(user_id=123, post_request=post_request, session=counting_session)
+
+        # then
+        statements = self.compiled_statements(counting_session)
+        expected_prefixes = [
+            "SELECT user_mission.",
+            "INSERT INTO post (",
+            "INSERT INTO post_image (",
+            "UPDATE user_mission SET",
+            "UPDATE user_challenge SET",
+            "INSERT IGNORE INTO outbox_event (",
+        ]
+        assert [sql.startswith(prefix) for sql, prefix in zip(statements, expected_prefixes)] == [True] * 6, statements
+        assert len(statements) == 6
+        counting_session.get.assert_not_called()
+        counting_session.flush.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_badge_evaluation_within_statement_budget(self, counting_session):
+        # given
+        badge_service = BadgeService()
+        badge_service.badge_catalog_cache = Mock()
+        badge_service.badge_catalog_cache.get = AsyncMock(
+            return_value=BadgeCatalog(1, [Badge(id=1, category="", name=BadgeNames.FIRST_STEP, description="")])
         )
-        post_service.user_mission_repository.update.assert_called_once()
+
+        # when
+        await badge_service.record_mission_completion(counting_session, 123)
+
+        # then
+        statements = self.compiled_statements(counting_session)
+        expected_prefixes = [
+            "SELECT user_badge_stats.",
+            "INSERT IGNORE INTO user_badge (",
+            "INSERT INTO user_badge_stats (",
+        ]
+        assert [sql.startswith(prefix) for sql, prefix in zip(statements, expected_prefixes)] == [True] * 3, statements
+        assert len(statements) == 3
@@ -0,0 +1,121 @@
+"""챌린지 참여(user_challenge + user_mission 생성) 경로의 DB 왕복 횟수/지연 시간 비교
+
+기존 방식(미션마다 create + flush)과 bulk_create 방식을 같은 DB에서 반복 실행한다.
+모든 쓰기는 반복마다 rollback 되므로 데이터는 남지 않는다.
+
+    ENVIRONMENT=dev python -m benchmarks.enrollment_benchmark --user-id 1 --challenge-id 2
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.model.challenge import ChallengeMission
+from app.module.challenge.catalog import challenge_catalog_cache
+from app.module.challenge.challenge_repository import UserChallengeRepository, UserMissionRepository
+from app.module.challenge.constants import FIRST_MISSION_STEP
+from app.module.challenge.enums import ChallengeStatusType, MissionStatusType
+
+EnrollFunc = Callable[[AsyncSession, int, int, list[ChallengeMission]], Awaitable[None]]
+
+
+async def enroll_per_row(
+    session: AsyncSession, user_id: int, challenge_id: int, challenge_missions: list[ChallengeMission]
+) -> None:
+    user_challenge = await UserChallengeRepository().create(
+        session, user_id=user_id, challenge_id=challenge_id, status=ChallengeStatusType.IN_PROGRESS
+    )
+    user_mission_repo = UserMissionRepository()
+    for cm in challenge_missions:
+        status = MissionStatusType.IN_PROGRESS if cm.step == FIRST_MISSION_STEP else MissionStatusType.NOT_STARTED
+        await user_mission_repo.create(
+            session, user_challenge_id=user_challenge.id, mission_id=cm.mission_id, status=status, point=0
+        )
+    await session.refresh(user_challenge)
+
+
+async def enroll_bulk(
+    session: AsyncSession, user_id: int, challenge_id: int, challenge_missions: list[ChallengeMission]
+) -> None:
+    user_challenge = await UserChallengeRepository().create(
+        session, user_id=user_id, challenge_id=challenge_id, status=ChallengeStatusType.IN_PROGRESS
+    )
+    await UserMissionRepository().bulk_create(
+        session,
+        [
+            {
+                "user_challenge_id": user_challenge.id,
+                "mission_id": cm.mission_id,
+                "status": (
+                    MissionStatusType.IN_PROGRESS if cm.step == FIRST_MISSION_STEP else MissionStatusType.NOT_STARTED
+                ),
+                "point": 0,
+            }
+            for cm in challenge_missions
+        ],
+    )
+
+
+async def run(label: str, enroll: EnrollFunc, user_id: int, challenge_id: int, iterations: int) -> None:
+    from app.database.config import get_async_session_maker, get_database_engine
+
+    statements: list[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = get_database_engine()
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+
+    session_maker = get_async_session_maker()
+    latencies: list[float] = []
+    round_trips: list[int] = []
+    try:
+        for _ in range(iterations):
+            async with session_maker() as session:
+                catalog = await challenge_catalog_cache.get(session)
+                challenge_missions = catalog.get_challenge_missions(challenge_id)
+                statements.clear()
+
+                started = time.perf_counter()
+                await enroll(session, user_id, challenge_id, challenge_missions)
+                latencies.append((time.perf_counter() - started) * 1000)
+                round_trips.append(len(statements))
+
+                await session.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+    latencies.sort()
+    p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+    print(
+        f"{label:<10} 왕복 {statistics.mean(round_trips):>5.1f}회 | "
+        f"평균 {statistics.mean(latencies):>7.2f}ms | p95 {p95:>7.2f}ms"
+    )
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="챌린지 참여 bulk insert 벤치마크")
+    parser.add_argument("--user-id", type=int, required=True, help="챌린지에 참여하지 않은 유저 ID")
+    parser.add_argument("--challenge-id", type=int, required=True, help="참여할 챌린지 ID")
+    parser.add_argument("--iterations", type=int, default=50, help="반복 횟수")
+    args = parser.parse_args()
+
+    await run("per-row", enroll_per_row, args.user_id, args.challenge_id, args.iterations)
+    await run("bulk", enroll_bulk, args.user_id, args.challenge_id, args.iterations)
+
+
+if __name__ == "__main__":
+    if not os.getenv("ENVIRONMENT"):
+        print("⚠️  ENVIRONMENT 환경변수를 설정해주세요 (dev/prod)")
+        sys.exit(1)
+
+    asyncio.run(main())
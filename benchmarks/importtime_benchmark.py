@@ -0,0 +1,120 @@
+"""`python -X importtime -c "import main"`으로 Lambda cold start의 import 비용을 패키지별로 집계
+
+STARTUP_MODE(eager/lazy)별로 새 인터프리터를 여러 번 띄워 중앙값을 구하고,
+패키지별 self 시간 합계를 예산(IMPORT_BUDGET_MS)과 비교한다. --strict면 예산 초과 시 exit 1.
+
+    JWT_SECRET=... JWT_ALGORITHM=HS256 python -m benchmarks.importtime_benchmark --repeat 5
+"""
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+# lazy 모드 기준 패키지별 import 예산 (ms). 여기 없는 패키지는 "기타"로 합산
+IMPORT_BUDGET_MS = {
+    "fastapi": 250.0,
+    "pydantic": 120.0,
+    "starlette": 40.0,
+    "mangum": 20.0,
+    "app.common": 20.0,
+    "boto3": 0.0,
+    "botocore": 15.0,
+    "httpx": 0.0,
+    "sqlalchemy": 0.0,
+    "sqlmodel": 0.0,
+    "dotenv": 0.0,
+}
+TOTAL_BUDGET_MS = 400.0
+
+_line_re = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def package_of(module: str) -> str:
+    parts = module.split(".")
+    # 앱 코드는 app.module.media처럼 기능 단위로, 외부 패키지는 최상위 이름으로 묶는다
+    depth = 3 if parts[0] == "app" and len(parts) > 2 and parts[1] in ("module", "api") else 2
+    return ".".join(parts[:depth]) if parts[0] == "app" else parts[0]
+
+
+def measure_once(mode: str) -> tuple[float, dict[str, float]]:
+    env = {**os.environ, "STARTUP_MODE": mode}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        error_lines = [line for line in completed.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"[{mode}] import main 실패:\n" + "\n".join(error_lines[-5:]))
+
+    self_ms_by_package: dict[str, float] = defaultdict(float)
+    total_ms = 0.0
+    for line in completed.stderr.splitlines():
+        match = _line_re.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        self_ms_by_package[package_of(module)] += int(self_us) / 1000
+        if module == "main" and not indent:
+            total_ms = int(cumulative_us) / 1000
+
+    return total_ms, self_ms_by_package
+
+
+def report(mode: str, repeat: int, top: int) -> bool:
+    totals = []
+    samples: dict[str, list[float]] = defaultdict(list)
+    for _ in range(repeat):
+        total_ms, by_package = measure_once(mode)
+        totals.append(total_ms)
+        for package, ms in by_package.items():
+            samples[package].append(ms)
+
+    medians = {
+        package: statistics.median(values + [0.0] * (repeat - len(values))) for package, values in samples.items()
+    }
+    total_ms = statistics.median(totals)
+    # 예산은 lazy 모드 기준이므로 eager 모드는 집계만 출력
+    check_budget = mode == "lazy"
+    within_budget = total_ms <= TOTAL_BUDGET_MS
+
+    budget_label = f" (예산 {TOTAL_BUDGET_MS:.0f}ms)" if check_budget else ""
+    print(f"\n[{mode}] import main 중앙값 {total_ms:.1f}ms{budget_label}")
+    print(f"{'package':<24}{'self ms':>10}{'budget':>10}")
+    for package, ms in sorted(medians.items(), key=lambda item: item[1], reverse=True)[:top]:
+        budget = IMPORT_BUDGET_MS.get(package)
+        over = check_budget and budget is not None and ms > max(budget, 1.0)
+        within_budget = within_budget and not over
+        budget_label = f"{budget:.0f}" if budget is not None else "-"
+        print(f"{package:<24}{ms:>10.1f}{budget_label:>10}{'  초과' if over else ''}")
+
+    for package, budget in IMPORT_BUDGET_MS.items():
+        if check_budget and budget == 0.0 and medians.get(package, 0.0) > 1.0:
+            print(f"⚠️  {package}는 cold start에서 import되지 않아야 합니다 ({medians[package]:.1f}ms)")
+            within_budget = False
+
+    return within_budget
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="cold start import 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="모드별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 패키지 수")
+    parser.add_argument("--modes", nargs="+", default=["eager", "lazy"], choices=["eager", "lazy"])
+    parser.add_argument("--strict", action="store_true", help="lazy 모드가 예산을 넘으면 exit 1")
+    args = parser.parse_args()
+
+    results = {mode: report(mode, args.repeat, args.top) for mode in args.modes}
+
+    if args.strict and not results.get("lazy", True):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
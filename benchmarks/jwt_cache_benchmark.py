@@ -0,0 +1,64 @@
+"""같은 access token이 반복되는 요청 패턴에서 verify_access_token의 요청당 인증 비용 비교
+
+--users명의 토큰으로 --requests번 인증하며, 캐시 없이 매번 HMAC 검증 + JWTPayload 변환을 하는 경우와
+DecodedTokenCache를 거치는 경우의 요청당 시간을 잰다. 두 경우 모두 폐기 목록(Bloom filter) 확인을 포함하며,
+폐기 목록은 빈 상태로 고정해 DB 없이 실행한다.
+
+    JWT_SECRET=... JWT_ALGORITHM=HS256 python -m benchmarks.jwt_cache_benchmark --requests 100000 --users 200
+"""
+
+import asyncio
+import random
+import time
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.module.auth.dependency import verify_access_token
+from app.module.auth.revocation import AccessTokenRevocationList
+from app.module.auth.services.jwt_service import JWTService
+from app.module.auth.token_cache import DecodedTokenCache
+
+
+class UncachedJWTService(JWTService):
+    def decode_token(self, token: str):
+        return self._decode_token(token)
+
+
+def empty_revocation_list() -> AccessTokenRevocationList:
+    revocation_list = AccessTokenRevocationList(sync_interval_sec=float("inf"))
+    revocation_list.replace([])
+    return revocation_list
+
+
+async def run(label: str, jwt_service: JWTService, workload: list[HTTPAuthorizationCredentials]) -> None:
+    started = time.perf_counter()
+    for credentials in workload:
+        await verify_access_token(credentials, jwt_service)
+    elapsed = time.perf_counter() - started
+
+    stats = jwt_service.token_cache.stats()
+    print(f"{label:<8} 요청당 {elapsed / len(workload) * 1_000_000:>7.2f}µs | hit rate {stats['hit_rate']:.4f}")
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="access token 검증 캐시 벤치마크")
+    parser.add_argument("--requests", type=int, default=100_000, help="전체 인증 요청 수")
+    parser.add_argument("--users", type=int, default=200, help="서로 다른 토큰 수")
+    args = parser.parse_args()
+
+    token_issuer = JWTService(DecodedTokenCache())
+    tokens = [
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials=token_issuer.generate_access_token(f"social_{i}", i))
+        for i in range(args.users)
+    ]
+    rng = random.Random(0)
+    workload = [rng.choice(tokens) for _ in range(args.requests)]
+
+    await run("캐시 없음", UncachedJWTService(DecodedTokenCache(), empty_revocation_list()), workload)
+    await run("LRU 캐시", JWTService(DecodedTokenCache(), empty_revocation_list()), workload)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""카카오 토큰 검증에서 요청마다 AsyncClient를 만드는 방식과 공유 클라이언트(keep-alive) 방식의 지연 비교
+
+로컬 stub 서버를 띄우고 --connect-delay-ms로 새 커넥션마다 드는 TCP/TLS handshake 비용을 흉내 낸다.
+실제 카카오 서버를 대상으로 재려면 --url에 토큰 검증 URL을 넘긴다 (응답 코드와 무관하게 지연만 잰다).
+
+    python -m benchmarks.kakao_client_benchmark --requests 100 --connect-delay-ms 30
+"""
+
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.common.http_client import SharedHttpClient
+from app.module.auth.test.kakao_stub_server import KakaoStubServer
+
+HEADERS = {"Content-Type": "application/x-www-form-urlencoded;charset=utf-8"}
+
+
+def summarize(label: str, latencies: list[float], connections: int | None) -> None:
+    latencies.sort()
+    p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+    connection_label = f" | 새 커넥션 {connections}개" if connections is not None else ""
+    print(f"{label:<14} 평균 {statistics.mean(latencies):>7.2f}ms | p95 {p95:>7.2f}ms{connection_label}")
+
+
+async def per_request_client(url: str, requests: int) -> list[float]:
+    latencies = []
+    for i in range(requests):
+        started = time.perf_counter()
+        async with httpx.AsyncClient() as client:
+            await client.post(url, data={"id_token": f"valid:user_{i}"}, headers=HEADERS)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def shared_client(url: str, requests: int) -> tuple[list[float], SharedHttpClient]:
+    http_client = SharedHttpClient()
+    latencies = []
+    try:
+        for i in range(requests):
+            started = time.perf_counter()
+            await http_client.get().post(url, data={"id_token": f"valid:user_{i}"}, headers=HEADERS)
+            latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        await http_client.aclose()
+    return latencies, http_client
+
+
+async def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="카카오 토큰 검증 HTTP 클라이언트 벤치마크")
+    parser.add_argument("--requests", type=int, default=100, help="방식별 요청 수")
+    parser.add_argument("--connect-delay-ms", type=float, default=30.0, help="stub 서버의 커넥션당 handshake 지연")
+    parser.add_argument("--response-delay-ms", type=float, default=5.0, help="stub 서버의 응답 지연")
+    parser.add_argument("--url", default=None, help="stub 대신 사용할 토큰 검증 URL")
+    args = parser.parse_args()
+
+    if args.url:
+        summarize("요청마다 생성", await per_request_client(args.url, args.requests), None)
+        latencies, http_client = await shared_client(args.url, args.requests)
+        summarize("공유 클라이언트", latencies, None)
+        print(f"HTTP/2: {http_client.http2} | 지표: {http_client.metrics.snapshot()}")
+        return
+
+    with KakaoStubServer(args.connect_delay_ms / 1000, args.response_delay_ms / 1000) as stub:
+        latencies = await per_request_client(stub.token_info_url, args.requests)
+        summarize("요청마다 생성", latencies, stub.connections)
+
+        stub.connections = 0
+        latencies, http_client = await shared_client(stub.token_info_url, args.requests)
+        summarize("공유 클라이언트", latencies, stub.connections)
+        print(f"지표: {http_client.metrics.snapshot()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""엔진 프로필(lambda/container/rds_proxy)별 동시 요청 처리량과 풀 지표 비교
+
+프로필마다 엔진을 새로 만들고 동시에 --concurrency개의 요청(세션 열기 → 쿼리 → 반납)을 실행한다.
+--query-sleep-ms를 주면 MySQL SLEEP()으로 쿼리 시간을 흉내낸다.
+
+    ENVIRONMENT=dev python -m benchmarks.pool_benchmark --requests 500 --concurrency 20
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database.engine_profile import create_engine_for_profile
+from app.database.enums import EngineProfile
+from app.database.pool_metrics import PoolMetrics
+
+
+async def run(profile: EngineProfile, database_url: str, requests: int, concurrency: int, sleep_ms: int) -> None:
+    metrics = PoolMetrics()
+    engine = create_engine_for_profile(database_url, profile, metrics)
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    query = text(f"SELECT SLEEP({sleep_ms / 1000})") if sleep_ms else text("SELECT 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def handle_request() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            async with session_maker() as session:
+                await session.execute(query)
+                await session.commit()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(handle_request() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await engine.dispose()
+
+    latencies.sort()
+    p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+    snapshot = metrics.snapshot()
+    print(
+        f"{profile:<10} {requests / elapsed:>8.1f} req/s | 평균 {statistics.mean(latencies):>7.2f}ms | "
+        f"p95 {p95:>7.2f}ms | checkout 대기 평균 {snapshot['wait_ms_avg']:>7.2f}ms "
+        f"최대 {snapshot['wait_ms_max']:>7.2f}ms | overflow 최대 {snapshot['overflow_max']} | "
+        f"timeout {snapshot['timeouts']}"
+    )
+
+
+async def main():
+    import argparse
+
+    from app.database.config import env
+
+    parser = argparse.ArgumentParser(description="DB 엔진 프로필 부하 벤치마크")
+    parser.add_argument("--requests", type=int, default=500, help="전체 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--query-sleep-ms", type=int, default=0, help="요청당 쿼리 시간 (MySQL SLEEP)")
+    parser.add_argument(
+        "--profiles", nargs="+", default=[p.value for p in EngineProfile], choices=[p.value for p in EngineProfile]
+    )
+    args = parser.parse_args()
+
+    for profile in args.profiles:
+        await run(EngineProfile(profile), env.db_url, args.requests, args.concurrency, args.query_sleep_ms)
+
+
+if __name__ == "__main__":
+    if not os.getenv("ENVIRONMENT"):
+        print("⚠️  ENVIRONMENT 환경변수를 설정해주세요 (dev/prod)")
+        sys.exit(1)
+
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""요청마다 Depends()로 서비스 그래프를 만드는 방식과 ServiceContainer 재사용 방식의 요청당 비용 비교
+
+tracemalloc으로 요청 1회당 할당 바이트/객체 수를, perf_counter로 요청당 시간을 잰다.
+S3/DB 호출은 하지 않으므로 S3_BUCKET_NAME 등은 더미 값으로 충분하다.
+
+    JWT_SECRET=... JWT_ALGORITHM=HS256 python -m benchmarks.service_container_benchmark
+"""
+
+import os
+import time
+import tracemalloc
+from collections.abc import Callable
+
+os.environ.setdefault("S3_BUCKET_NAME", "benchmark-bucket")
+os.environ.setdefault("CUSTOM_AWS_REGION", "ap-northeast-2")
+
+from app.common.container import ServiceContainer, container  # noqa: E402
+from app.module.auth.services.jwt_service import JWTService  # noqa: E402
+from app.module.badge.badge_service import BadgeService  # noqa: E402
+from app.module.challenge.challenge_service import ChallengeService  # noqa: E402
+from app.module.media.media_service import MediaService  # noqa: E402
+from app.module.post.post_service import PostService  # noqa: E402
+
+# 게시물 작성 요청 하나가 의존하는 서비스들 (post_router.add_post + verify_access_token)
+REQUEST_SERVICES = (PostService, BadgeService, JWTService, ChallengeService)
+
+
+def make_per_request_depends(eager_s3_client: bool) -> Callable[[], None]:
+    def per_request_depends() -> None:
+        # 요청마다 빈 컨테이너에서 시작하면 Depends() 시절처럼 서비스 그래프 전체가 새로 만들어진다
+        container.reset()
+        for cls in REQUEST_SERVICES:
+            container.get(cls)
+        if eager_s3_client:
+            container.get(MediaService).s3_client
+
+    return per_request_depends
+
+
+def make_container_lookup(eager_s3_client: bool) -> Callable[[], None]:
+    service_container = ServiceContainer()
+
+    def container_lookup() -> None:
+        for cls in REQUEST_SERVICES:
+            service_container.get(cls)
+
+    container.reset()
+    container_lookup()  # 첫 요청에서 그래프 생성
+    if eager_s3_client:
+        container.get(MediaService).s3_client
+    return container_lookup
+
+
+def measure(label: str, handle_request: Callable[[], None], requests: int) -> None:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    handle_request()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    allocated_bytes = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    allocated_blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        handle_request()
+    per_request_us = (time.perf_counter() - started) / requests * 1_000_000
+
+    print(f"{label:<16} 요청당 {per_request_us:>9.2f}µs | 할당 {allocated_bytes:>8,}B / {allocated_blocks:>5,}개 블록")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="서비스 컨테이너 요청당 비용 벤치마크")
+    parser.add_argument("--requests", type=int, default=10_000, help="반복 요청 수")
+    parser.add_argument(
+        "--eager-s3-client", action="store_true", help="MediaService 생성 시 boto3 client를 만들던 이전 동작을 재현"
+    )
+    args = parser.parse_args()
+
+    measure("per-request", make_per_request_depends(args.eager_s3_client), args.requests)
+    measure("container", make_container_lookup(args.eager_s3_client), args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ resource "aws_ssm_parameter" "app_config" {
     "jwt_algorithm" = "HS256"
     "s3_bucket_name" = "challenge-backend-media-${var.environment}"
     "custom_aws_region" = var.aws_region
+    "kakao_app_keys" = var.kakao_app_keys
   }
 
   name  = "/${var.project_name}/${var.environment}/app/${each.key}"
@@ -23,7 +24,8 @@ resource "aws_ssm_parameter" "app_config" {
 # RDS 연결 정보 - 민감하지 않은 정보만
 resource "aws_ssm_parameter" "db_config" {
   for_each = {
-    "host"     = aws_db_instance.mysql.endpoint
+    # endpoint는 "address:port" 형식이므로 호스트에는 address만 넣는다 (포트는 port 파라미터)
+    "host"     = aws_db_instance.mysql.address
     "port"     = tostring(aws_db_instance.mysql.port)
     "database" = aws_db_instance.mysql.db_name
     "username" = aws_db_instance.mysql.username
@@ -67,3 +67,14 @@ variable "jwt_algorithm" {
   type        = string
   default     = "HS256"
 }
+
+# 필수: terraform.<env>.tfvars에 반드시 지정해야 한다 (SSM 파라미터는 빈 값을 저장할 수 없다)
+variable "kakao_app_keys" {
+  description = "카카오 id_token aud로 허용할 앱 키 (콤마 구분, 필수)"
+  type        = string
+
+  validation {
+    condition     = length(trimspace(var.kakao_app_keys)) > 0
+    error_message = "kakao_app_keys는 비워 둘 수 없습니다. 카카오 앱 키를 콤마로 구분해 지정해주세요."
+  }
+}
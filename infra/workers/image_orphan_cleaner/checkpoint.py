@@ -0,0 +1,30 @@
+import json
+from typing import Optional
+
+from botocore.exceptions import ClientError
+
+
+class S3CheckpointStore:
+    """다음 invocation이 이어서 처리할 수 있도록 list_objects_v2 continuation token을 S3에 저장"""
+
+    def __init__(self, s3_client, bucket_name: str, key: str):
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.key = key
+
+    def load(self) -> Optional[str]:
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=self.key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            raise
+
+        return json.loads(response["Body"].read()).get("continuation_token")
+
+    def save(self, continuation_token: str) -> None:
+        body = json.dumps({"continuation_token": continuation_token})
+        self.s3_client.put_object(Bucket=self.bucket_name, Key=self.key, Body=body.encode("utf-8"))
+
+    def clear(self) -> None:
+        self.s3_client.delete_object(Bucket=self.bucket_name, Key=self.key)
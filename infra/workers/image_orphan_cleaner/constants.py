@@ -0,0 +1,12 @@
+# list_objects_v2 한 페이지와 delete_objects 한 번의 최대 키 수
+S3_PAGE_SIZE = 1000
+DELETE_BATCH_SIZE = 1000
+# get_object_tagging 동시 호출 수
+TAG_LOOKUP_CONCURRENCY = 32
+# 남은 실행 시간이 이보다 적으면 다음 페이지를 시작하지 않고 checkpoint 후 종료
+STOP_MARGIN_MS = 30_000
+# 워커들이 상태(checkpoint)를 저장하는 prefix. 이미지가 아니므로 orphan 판별 대상에서 뺀다
+WORKER_STATE_PREFIX = "_workers/"
+CHECKPOINT_KEY = f"{WORKER_STATE_PREFIX}image_orphan_cleaner/checkpoint.json"
+# generate_file_key 레이아웃: {upload_type}/{YYYY-MM-DD}/{uuid}.jpg
+FILE_KEY_DATE_PREFIX_PATTERN = r"^[a-z]+/\d{4}-\d{2}-\d{2}/"
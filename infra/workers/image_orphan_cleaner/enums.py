@@ -4,3 +4,8 @@ from enum import StrEnum
 class S3ObjectStatus(StrEnum):
     PENDING = "pending"  # 업로드 직후, 게시물 작성 전
     CONFIRMED = "confirmed"  # 게시물 업로드와 게시물 저장 연결 됨
+
+
+class OrphanDetectionMode(StrEnum):
+    TAG = "tag"  # 객체마다 get_object_tagging으로 status 태그 확인
+    DATABASE = "database"  # post_image.file_key 목록과 S3 목록을 비교
@@ -1,16 +1,29 @@
 import os
 from typing import Any
 
+from enums import OrphanDetectionMode
+from key_set import MySQLPostImageKeySource, PostImageKeySet
 from service import S3CleanupService
 
 
-def lambda_handler(event: dict[str, Any], context: Any) -> None:
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     bucket_name = os.environ["BUCKET_NAME"]
     safety_margin_days = int(os.environ.get("SAFETY_MARGIN_DAYS", "2"))
+    detection_mode = OrphanDetectionMode(os.environ.get("ORPHAN_DETECTION_MODE", OrphanDetectionMode.TAG))
 
-    cleanup_service = S3CleanupService(bucket_name=bucket_name, safety_margin_days=safety_margin_days)
+    key_source = None
+    key_set = None
+    if detection_mode == OrphanDetectionMode.DATABASE:
+        key_source = MySQLPostImageKeySource.from_env()
+        key_set = PostImageKeySet(key_source)
 
-    cleanup_service.cleanup_orphan_files()
+    cleanup_service = S3CleanupService(bucket_name=bucket_name, safety_margin_days=safety_margin_days, key_set=key_set)
 
-    return
+    try:
+        result = cleanup_service.cleanup_orphan_files(get_remaining_time_ms=context.get_remaining_time_in_millis)
+    finally:
+        if key_source:
+            key_source.close()
+
+    return result.model_dump()
@@ -0,0 +1,98 @@
+import os
+import re
+from bisect import bisect_left
+from typing import Iterable, Optional, Protocol
+
+import pymysql
+from constants import FILE_KEY_DATE_PREFIX_PATTERN
+
+_date_prefix_re = re.compile(FILE_KEY_DATE_PREFIX_PATTERN)
+
+
+def db_address_from_env() -> tuple[str, int]:
+    """DB_HOST/DB_PORT에서 접속 주소를 읽는다. DB_HOST가 RDS endpoint("address:port") 형식이어도 받아들인다"""
+    host, _, host_port = os.environ["DB_HOST"].partition(":")
+    return host, int(host_port or os.environ.get("DB_PORT", "3306"))
+
+
+class PostImageKeySource(Protocol):
+    def fetch_keys_with_prefix(self, prefix: str) -> Iterable[str]: ...
+
+    def fetch_existing_keys(self, file_keys: list[str]) -> Iterable[str]: ...
+
+
+class MySQLPostImageKeySource:
+    """post_image.file_key를 조회하는 pymysql 기반 소스 (ix_post_image_file_key 사용)"""
+
+    def __init__(self, connection: pymysql.connections.Connection):
+        self.connection = connection
+
+    @classmethod
+    def from_env(cls) -> "MySQLPostImageKeySource":
+        host, port = db_address_from_env()
+        connection = pymysql.connect(
+            host=host,
+            port=port,
+            user=os.environ["DB_USER"],
+            password=os.environ["DB_PASSWORD"],
+            database=os.environ["DB_NAME"],
+            charset="utf8mb4",
+        )
+        return cls(connection)
+
+    def fetch_keys_with_prefix(self, prefix: str) -> Iterable[str]:
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT file_key FROM post_image WHERE file_key LIKE %s", (f"{escaped}%",))
+            return [row[0] for row in cursor.fetchall()]
+
+    def fetch_existing_keys(self, file_keys: list[str]) -> Iterable[str]:
+        if not file_keys:
+            return []
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT file_key FROM post_image WHERE file_key IN %s", (file_keys,))
+            return [row[0] for row in cursor.fetchall()]
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class PostImageKeySet:
+    """날짜 prefix 단위로 post_image.file_key를 정렬 배열로 들고 S3 목록과 비교
+
+    S3 목록은 키 순서로 오므로 한 번에 한 prefix(하루치 키)만 메모리에 둔다.
+    정렬 배열에 없는 키는 삭제 직전에 DB로 한 번 더 확인해 그 사이 생성된 게시물을 보호한다.
+    """
+
+    def __init__(self, source: PostImageKeySource):
+        self.source = source
+        self._prefix: Optional[str] = None
+        self._keys: list[str] = []
+
+    def find_orphans(self, file_keys: list[str]) -> list[str]:
+        candidates = []
+        for file_key in file_keys:
+            match = _date_prefix_re.match(file_key)
+            if not match:
+                # 레이아웃을 모르는 객체는 지우지 않는다
+                continue
+
+            if match.group(0) != self._prefix:
+                self._load(match.group(0))
+
+            if not self._contains(file_key):
+                candidates.append(file_key)
+
+        if not candidates:
+            return []
+
+        existing_keys = set(self.source.fetch_existing_keys(candidates))
+        return [file_key for file_key in candidates if file_key not in existing_keys]
+
+    def _load(self, prefix: str) -> None:
+        self._prefix = prefix
+        self._keys = sorted(self.source.fetch_keys_with_prefix(prefix))
+
+    def _contains(self, file_key: str) -> bool:
+        index = bisect_left(self._keys, file_key)
+        return index < len(self._keys) and self._keys[index] == file_key
@@ -26,8 +26,9 @@ class S3Object(BaseModel):
         )
 
     def is_old_enough(self, cutoff_time: datetime) -> bool:
-        last_modified_naive = self.last_modified.replace(tzinfo=None)
-        return last_modified_naive < cutoff_time
+        if cutoff_time.tzinfo is None:
+            return self.last_modified.replace(tzinfo=None) < cutoff_time
+        return self.last_modified < cutoff_time
 
 
 class S3Tag(BaseModel):
@@ -57,3 +58,11 @@ class S3ObjectTags(BaseModel):
     def has_status_confirmed(self, confirmed_value: str) -> bool:
         status_value = self.get_tag_value("status")
         return status_value == confirmed_value
+
+
+class CleanupResult(BaseModel):
+    scanned: int = Field(default=0, description="조회한 객체 수")
+    deleted: int = Field(default=0, description="삭제한 객체 수")
+    failed: int = Field(default=0, description="삭제 실패한 객체 수")
+    resumed: bool = Field(default=False, description="이전 checkpoint에서 이어서 실행했는지 여부")
+    completed: bool = Field(default=False, description="버킷 끝까지 처리했는지 여부")
@@ -1,45 +1,102 @@
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, Optional
 
 import boto3
+from botocore.exceptions import ClientError
+from checkpoint import S3CheckpointStore
+from constants import (
+    CHECKPOINT_KEY,
+    DELETE_BATCH_SIZE,
+    S3_PAGE_SIZE,
+    STOP_MARGIN_MS,
+    TAG_LOOKUP_CONCURRENCY,
+    WORKER_STATE_PREFIX,
+)
 from enums import S3ObjectStatus
-from schema import S3Object, S3ObjectTags
+from key_set import PostImageKeySet
+from schema import CleanupResult, S3Object, S3ObjectTags
 
 
 class S3CleanupService:
-    def __init__(self, bucket_name: str, safety_margin_days: int = 2):
-        self.s3_client = boto3.client("s3")
+    def __init__(
+        self,
+        bucket_name: str,
+        safety_margin_days: int = 2,
+        tag_lookup_concurrency: int = TAG_LOOKUP_CONCURRENCY,
+        page_size: int = S3_PAGE_SIZE,
+        s3_client=None,
+        key_set: Optional[PostImageKeySet] = None,
+    ):
+        self.s3_client = s3_client or boto3.client("s3")
         self.bucket_name = bucket_name
         self.safety_margin_days = safety_margin_days
+        self.tag_lookup_concurrency = tag_lookup_concurrency
+        self.page_size = min(page_size, DELETE_BATCH_SIZE)
+        self.checkpoint_store = S3CheckpointStore(self.s3_client, bucket_name, CHECKPOINT_KEY)
+        # key_set이 있으면 태그 조회 없이 post_image 목록과 비교 (목록 조회 + 삭제 API만 사용)
+        self.key_set = key_set
 
-    def cleanup_orphan_files(self) -> None:
-        cutoff_time = datetime.now() - timedelta(days=self.safety_margin_days)
+    def cleanup_orphan_files(self, get_remaining_time_ms: Optional[Callable[[], int]] = None) -> CleanupResult:
+        """페이지 단위로 목록 조회 → 태그 동시 조회 → delete_objects 일괄 삭제 → checkpoint 저장
 
-        objects = self._list_all_objects()
+        남은 실행 시간이 STOP_MARGIN_MS보다 적으면 중단하고, 다음 invocation이 checkpoint부터 이어서 처리한다.
+        """
+        cutoff_time = datetime.now(timezone.utc) - timedelta(days=self.safety_margin_days)
+        result = CleanupResult()
 
-        for obj in objects:
-            if not obj.is_old_enough(cutoff_time):
-                continue
+        continuation_token = self.checkpoint_store.load()
+        result.resumed = continuation_token is not None
 
-            if self._is_confirmed_file(obj.key):
-                continue
+        with ThreadPoolExecutor(max_workers=self.tag_lookup_concurrency) as executor:
+            for objects, next_token in self._iter_pages(continuation_token):
+                result.scanned += len(objects)
 
-            self._delete_file(obj.key)
+                candidates = [obj.key for obj in objects if obj.is_old_enough(cutoff_time)]
+                orphan_keys = self._find_orphan_keys(candidates, executor)
 
-        return
+                # 삭제를 끝낸 뒤에 checkpoint를 옮겨야 재개 시 누락되는 키가 없다
+                deleted, failed = self._delete_files(orphan_keys)
+                result.deleted += deleted
+                result.failed += failed
 
-    def _list_all_objects(self) -> list[S3Object]:
-        result = []
+                if next_token is None:
+                    self.checkpoint_store.clear()
+                    result.completed = True
+                    break
 
-        paginator = self.s3_client.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=self.bucket_name)
-
-        for page in pages:
-            if "Contents" in page:
-                s3_objects = [S3Object.from_s3_response(dict(obj_data)) for obj_data in page["Contents"]]
-                result.extend(s3_objects)
+                self.checkpoint_store.save(next_token)
+                if get_remaining_time_ms and get_remaining_time_ms() < STOP_MARGIN_MS:
+                    break
 
         return result
 
+    def _iter_pages(self, continuation_token: Optional[str]) -> Iterator[tuple[list[S3Object], Optional[str]]]:
+        while True:
+            params = {"Bucket": self.bucket_name, "MaxKeys": self.page_size}
+            if continuation_token:
+                params["ContinuationToken"] = continuation_token
+
+            page = self.s3_client.list_objects_v2(**params)
+            objects = [
+                S3Object.from_s3_response(dict(obj_data))
+                for obj_data in page.get("Contents", [])
+                if not obj_data["Key"].startswith(WORKER_STATE_PREFIX)
+            ]
+            continuation_token = page.get("NextContinuationToken") if page.get("IsTruncated") else None
+
+            yield objects, continuation_token
+
+            if continuation_token is None:
+                return
+
+    def _find_orphan_keys(self, file_keys: list[str], executor: ThreadPoolExecutor) -> list[str]:
+        if self.key_set is not None:
+            return self.key_set.find_orphans(file_keys)
+
+        confirmed_flags = executor.map(self._is_confirmed_file, file_keys)
+        return [key for key, confirmed in zip(file_keys, confirmed_flags) if not confirmed]
+
     def _is_confirmed_file(self, file_key: str) -> bool:
         try:
             response = self.s3_client.get_object_tagging(Bucket=self.bucket_name, Key=file_key)
@@ -50,9 +107,21 @@ class S3CleanupService:
             # status=confirmed 태그 확인
             return s3_tags.has_status_confirmed(S3ObjectStatus.CONFIRMED)
 
-        except Exception:
-            return False
-
-    def _delete_file(self, file_key: str) -> None:
-        self.s3_client.delete_object(Bucket=self.bucket_name, Key=file_key)
-        return
+        except ClientError as e:
+            # 이미 지워진 객체만 삭제 대상으로 두고, throttling 등 일시 오류는 삭제하지 않는다
+            return e.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404")
+
+    def _delete_files(self, file_keys: list[str]) -> tuple[int, int]:
+        deleted = 0
+        failed = 0
+        for start in range(0, len(file_keys), DELETE_BATCH_SIZE):
+            batch = file_keys[start : start + DELETE_BATCH_SIZE]
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            errors = response.get("Errors", [])
+            failed += len(errors)
+            deleted += len(batch) - len(errors)
+
+        return deleted, failed
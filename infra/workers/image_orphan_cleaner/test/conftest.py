@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 워커는 Lambda 패키지 루트 기준의 flat import(from service import ...)를 사용
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,81 @@
+from key_set import PostImageKeySet, db_address_from_env
+
+
+class FakePostImageKeySource:
+    def __init__(self, file_keys: set[str]):
+        self.file_keys = file_keys
+        self.prefix_queries: list[str] = []
+        self.verify_queries: list[list[str]] = []
+
+    def fetch_keys_with_prefix(self, prefix: str) -> list[str]:
+        self.prefix_queries.append(prefix)
+        return [key for key in self.file_keys if key.startswith(prefix)]
+
+    def fetch_existing_keys(self, file_keys: list[str]) -> list[str]:
+        self.verify_queries.append(file_keys)
+        return [key for key in file_keys if key in self.file_keys]
+
+
+class TestPostImageKeySet:
+    def test_finds_keys_missing_from_post_image(self):
+        # given
+        source = FakePostImageKeySource({"content/2025-09-16/a.jpg", "content/2025-09-17/c.jpg"})
+        key_set = PostImageKeySet(source)
+
+        # when
+        orphans = key_set.find_orphans(
+            [
+                "content/2025-09-16/a.jpg",
+                "content/2025-09-16/b.jpg",
+                "content/2025-09-17/c.jpg",
+                "content/2025-09-17/d.jpg",
+            ]
+        )
+
+        # then
+        assert orphans == ["content/2025-09-16/b.jpg", "content/2025-09-17/d.jpg"]
+        assert source.prefix_queries == ["content/2025-09-16/", "content/2025-09-17/"]
+        assert source.verify_queries == [["content/2025-09-16/b.jpg", "content/2025-09-17/d.jpg"]]
+
+    def test_exact_verification_keeps_keys_added_after_load(self):
+        # given
+        source = FakePostImageKeySource(set())
+        key_set = PostImageKeySet(source)
+        key_set.find_orphans(["content/2025-09-16/a.jpg"])
+        source.file_keys.add("content/2025-09-16/b.jpg")
+
+        # when
+        orphans = key_set.find_orphans(["content/2025-09-16/b.jpg"])
+
+        # then
+        assert orphans == []
+
+    def test_skips_keys_outside_file_key_layout(self):
+        # given
+        source = FakePostImageKeySource(set())
+        key_set = PostImageKeySet(source)
+
+        # when
+        orphans = key_set.find_orphans(["misc/readme.txt", "_workers/x.json"])
+
+        # then
+        assert orphans == []
+        assert source.prefix_queries == []
+
+
+class TestDbAddressFromEnv:
+    def test_reads_host_and_port(self, monkeypatch):
+        # given
+        monkeypatch.setenv("DB_HOST", "db.example.com")
+        monkeypatch.setenv("DB_PORT", "3307")
+
+        # when & then
+        assert db_address_from_env() == ("db.example.com", 3307)
+
+    def test_accepts_rds_endpoint_with_port(self, monkeypatch):
+        # given
+        monkeypatch.setenv("DB_HOST", "db.example.com:3306")
+        monkeypatch.delenv("DB_PORT", raising=False)
+
+        # when & then
+        assert db_address_from_env() == ("db.example.com", 3306)
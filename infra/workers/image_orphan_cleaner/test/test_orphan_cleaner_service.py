@@ -0,0 +1,127 @@
+from unittest.mock import Mock, patch
+
+import boto3
+import pytest
+
+moto = pytest.importorskip("moto")
+
+from constants import CHECKPOINT_KEY  # noqa: E402
+from enums import S3ObjectStatus  # noqa: E402
+from key_set import PostImageKeySet  # noqa: E402
+from service import S3CleanupService  # noqa: E402
+
+BUCKET_NAME = "test-bucket"
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "ap-northeast-2")
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="ap-northeast-2")
+        client.create_bucket(Bucket=BUCKET_NAME, CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"})
+        yield client
+
+
+def put_objects(s3_client, count: int, confirmed_every: int = 3) -> set[str]:
+    confirmed_keys = set()
+    for i in range(count):
+        key = f"content/2025-09-16/{i:05d}.jpg"
+        s3_client.put_object(Bucket=BUCKET_NAME, Key=key, Body=b"x")
+        if i % confirmed_every == 0:
+            s3_client.put_object_tagging(
+                Bucket=BUCKET_NAME,
+                Key=key,
+                Tagging={"TagSet": [{"Key": "status", "Value": S3ObjectStatus.CONFIRMED}]},
+            )
+            confirmed_keys.add(key)
+    return confirmed_keys
+
+
+def list_keys(s3_client) -> set[str]:
+    paginator = s3_client.get_paginator("list_objects_v2")
+    return {obj["Key"] for page in paginator.paginate(Bucket=BUCKET_NAME) for obj in page.get("Contents", [])}
+
+
+class TestS3CleanupService:
+    def test_deletes_only_unconfirmed_files_in_batches(self, s3_client):
+        # given
+        confirmed_keys = put_objects(s3_client, 25)
+        service = S3CleanupService(BUCKET_NAME, safety_margin_days=-1, page_size=10, s3_client=s3_client)
+
+        # when
+        with patch.object(s3_client, "delete_objects", wraps=s3_client.delete_objects) as mock_delete_objects:
+            result = service.cleanup_orphan_files()
+
+        # then
+        assert list_keys(s3_client) == confirmed_keys
+        assert result.scanned == 25
+        assert result.deleted == 25 - len(confirmed_keys)
+        assert result.completed is True
+        assert mock_delete_objects.call_count == 3
+        assert all(len(call.kwargs["Delete"]["Objects"]) <= 10 for call in mock_delete_objects.call_args_list)
+
+    def test_keeps_files_within_safety_margin(self, s3_client):
+        # given
+        put_objects(s3_client, 5)
+        service = S3CleanupService(BUCKET_NAME, safety_margin_days=2, s3_client=s3_client)
+
+        # when
+        result = service.cleanup_orphan_files()
+
+        # then
+        assert result.deleted == 0
+        assert len(list_keys(s3_client)) == 5
+
+    def test_resumes_from_checkpoint(self, s3_client):
+        # given
+        confirmed_keys = put_objects(s3_client, 25)
+        service = S3CleanupService(BUCKET_NAME, safety_margin_days=-1, page_size=10, s3_client=s3_client)
+
+        # when
+        first = service.cleanup_orphan_files(get_remaining_time_ms=lambda: 0)
+        checkpoint_saved = CHECKPOINT_KEY in list_keys(s3_client)
+        second = service.cleanup_orphan_files()
+
+        # then
+        assert first.completed is False
+        assert first.scanned == 10
+        assert checkpoint_saved
+        assert second.resumed is True
+        assert second.completed is True
+        assert second.scanned == 15
+        assert list_keys(s3_client) == confirmed_keys
+
+    def test_tag_lookup_error_is_not_deleted(self, s3_client):
+        # given
+        put_objects(s3_client, 3, confirmed_every=100)
+        service = S3CleanupService(BUCKET_NAME, safety_margin_days=-1, s3_client=s3_client)
+        throttled = s3_client.exceptions.ClientError({"Error": {"Code": "SlowDown"}}, "GetObjectTagging")
+
+        # when
+        with patch.object(s3_client, "get_object_tagging", side_effect=throttled):
+            result = service.cleanup_orphan_files()
+
+        # then
+        assert result.deleted == 0
+        assert len(list_keys(s3_client)) == 3
+
+    def test_database_mode_skips_tag_lookups(self, s3_client):
+        # given
+        confirmed_keys = put_objects(s3_client, 25)
+        key_set = Mock(spec=PostImageKeySet)
+        key_set.find_orphans.side_effect = lambda keys: [key for key in keys if key not in confirmed_keys]
+        service = S3CleanupService(
+            BUCKET_NAME, safety_margin_days=-1, page_size=10, s3_client=s3_client, key_set=key_set
+        )
+
+        # when
+        with patch.object(s3_client, "get_object_tagging") as mock_get_object_tagging:
+            result = service.cleanup_orphan_files()
+
+        # then
+        mock_get_object_tagging.assert_not_called()
+        assert key_set.find_orphans.call_count == 3
+        assert result.deleted == 25 - len(confirmed_keys)
+        assert list_keys(s3_client) == confirmed_keys
@@ -0,0 +1,18 @@
+import os
+from typing import Any
+
+import boto3
+from reconcile_checkpoint import S3CheckpointStore
+from reconciler import CHECKPOINT_KEY, LikeCountReconciler
+
+
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    checkpoint_store = S3CheckpointStore(boto3.client("s3"), os.environ["BUCKET_NAME"], CHECKPOINT_KEY)
+    reconciler = LikeCountReconciler.from_env(checkpoint_store=checkpoint_store)
+
+    try:
+        result = reconciler.reconcile(get_remaining_time_ms=context.get_remaining_time_in_millis)
+    finally:
+        reconciler.close()
+
+    return result.to_dict()
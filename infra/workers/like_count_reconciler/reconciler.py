@@ -0,0 +1,152 @@
+import os
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional
+
+import pymysql
+from reconcile_checkpoint import S3CheckpointStore
+
+RECONCILE_CHUNK_SIZE = 1000
+# 최근 이 시간 안에 카운터가 갱신됐거나 좋아요가 생긴 게시물은 write-behind flush가 진행 중일 수 있으므로 건너뛴다
+RECONCILE_SETTLE_SEC = 60
+# Lambda 남은 실행 시간이 이보다 적으면 다음 chunk를 시작하지 않는다
+RECONCILE_STOP_MARGIN_MS = 10_000
+CHECKPOINT_KEY = "_workers/like_count_reconciler/checkpoint.json"
+
+_SELECT_CHUNK_SQL = """
+SELECT p.id,
+       COALESCE(s.like_count, 0),
+       COUNT(l.id),
+       COALESCE(s.updated_at, '1970-01-01') < UTC_TIMESTAMP() - INTERVAL %s SECOND
+           AND COALESCE(MAX(l.created_at), '1970-01-01') < UTC_TIMESTAMP() - INTERVAL %s SECOND
+FROM post p
+LEFT JOIN post_like_stats s ON s.post_id = p.id
+LEFT JOIN post_like l ON l.post_id = p.id
+WHERE p.id > %s
+GROUP BY p.id, s.like_count, s.updated_at
+ORDER BY p.id
+LIMIT %s
+"""
+
+# 조회와 갱신 사이에 바뀐 좋아요도 반영되도록 갱신 문장 안에서 다시 센다
+_REPAIR_SQL = """
+INSERT INTO post_like_stats (post_id, like_count, created_at, updated_at, is_deleted)
+SELECT p.id, (SELECT COUNT(l.id) FROM post_like l WHERE l.post_id = p.id), UTC_TIMESTAMP(), UTC_TIMESTAMP(), FALSE
+FROM post p
+WHERE p.id IN %s
+ON DUPLICATE KEY UPDATE like_count = VALUES(like_count), updated_at = VALUES(updated_at)
+"""
+
+
+def db_address_from_env() -> tuple[str, int]:
+    """DB_HOST/DB_PORT에서 접속 주소를 읽는다. DB_HOST가 RDS endpoint("address:port") 형식이어도 받아들인다"""
+    host, _, host_port = os.environ["DB_HOST"].partition(":")
+    return host, int(host_port or os.environ.get("DB_PORT", "3306"))
+
+
+@dataclass
+class ReconcileResult:
+    scanned: int = 0
+    drifted: int = 0
+    repaired: int = 0
+    skipped_unsettled: int = 0
+    last_post_id: int = 0
+    resumed: bool = False
+    completed: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class LikeCountReconciler:
+    """post_like_stats.like_count를 post_like 실제 행 수와 맞추는 작업
+
+    write-behind 버퍼가 flush 전에 프로세스와 함께 사라지거나 staleness 한도를 넘겨 버린 증감분을 복구한다.
+    post id 순으로 chunk 단위로 비교하고 어긋난 행만 다시 세어 덮어쓰므로 여러 번 실행해도 결과가 같다.
+    checkpoint_store가 있으면 시간 부족으로 멈춘 지점부터 다음 invocation이 이어서 처리한다.
+    """
+
+    def __init__(
+        self,
+        connection: pymysql.connections.Connection,
+        chunk_size: int = RECONCILE_CHUNK_SIZE,
+        settle_sec: int = RECONCILE_SETTLE_SEC,
+        checkpoint_store: Optional[S3CheckpointStore] = None,
+    ):
+        self.connection = connection
+        self.checkpoint_store = checkpoint_store
+        self.chunk_size = chunk_size
+        self.settle_sec = settle_sec
+
+    @classmethod
+    def from_env(cls, checkpoint_store: Optional[S3CheckpointStore] = None) -> "LikeCountReconciler":
+        host, port = db_address_from_env()
+        connection = pymysql.connect(
+            host=host,
+            port=port,
+            user=os.environ["DB_USER"],
+            password=os.environ["DB_PASSWORD"],
+            database=os.environ["DB_NAME"],
+            charset="utf8mb4",
+        )
+        return cls(
+            connection,
+            settle_sec=int(os.environ.get("RECONCILE_SETTLE_SEC", RECONCILE_SETTLE_SEC)),
+            checkpoint_store=checkpoint_store,
+        )
+
+    def reconcile(self, get_remaining_time_ms: Optional[Callable[[], int]] = None) -> ReconcileResult:
+        result = ReconcileResult()
+        if self.checkpoint_store:
+            checkpoint = self.checkpoint_store.load()
+            result.resumed = checkpoint is not None
+            result.last_post_id = checkpoint or 0
+
+        while True:
+            rows = self._fetch_chunk(result.last_post_id)
+            if not rows:
+                result.completed = True
+                break
+
+            drifted_ids = []
+            for post_id, stored_count, actual_count, is_settled in rows:
+                if stored_count == actual_count:
+                    continue
+                if is_settled:
+                    drifted_ids.append(post_id)
+                else:
+                    result.skipped_unsettled += 1
+
+            result.scanned += len(rows)
+            result.drifted += len(drifted_ids)
+            result.repaired += self._repair(drifted_ids)
+            result.last_post_id = rows[-1][0]
+
+            if len(rows) < self.chunk_size:
+                result.completed = True
+                break
+
+            # 보정을 commit한 뒤에 checkpoint를 옮겨야 재개 시 빠지는 게시물이 없다
+            if self.checkpoint_store:
+                self.checkpoint_store.save(result.last_post_id)
+            if get_remaining_time_ms and get_remaining_time_ms() < RECONCILE_STOP_MARGIN_MS:
+                break
+
+        if result.completed and self.checkpoint_store:
+            self.checkpoint_store.clear()
+        return result
+
+    def _fetch_chunk(self, after_post_id: int) -> list[tuple[int, int, int, bool]]:
+        with self.connection.cursor() as cursor:
+            cursor.execute(_SELECT_CHUNK_SQL, (self.settle_sec, self.settle_sec, after_post_id, self.chunk_size))
+            return [(row[0], row[1], row[2], bool(row[3])) for row in cursor.fetchall()]
+
+    def _repair(self, post_ids: list[int]) -> int:
+        if not post_ids:
+            return 0
+        with self.connection.cursor() as cursor:
+            cursor.execute(_REPAIR_SQL, (post_ids,))
+        self.connection.commit()
+        return len(post_ids)
+
+    def close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,177 @@
+from reconciler import LikeCountReconciler, db_address_from_env
+
+
+class FakeLikeDatabase:
+    """post_id -> (post_like_stats.like_count, post_like 행 수, settle 여부)를 들고 worker의 두 SQL을 흉내 낸다"""
+
+    def __init__(self, posts: dict[int, tuple[int, int, bool]]):
+        self.posts = posts
+        self.repair_calls: list[list[int]] = []
+        self.commits = 0
+        self.closed = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCursor:
+    def __init__(self, database: FakeLikeDatabase):
+        self.database = database
+        self._rows: list[tuple] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, sql: str, params: tuple):
+        if sql.lstrip().startswith("SELECT"):
+            _, _, after_post_id, limit = params
+            post_ids = sorted(post_id for post_id in self.database.posts if post_id > after_post_id)[:limit]
+            self._rows = [(post_id, *self.database.posts[post_id]) for post_id in post_ids]
+            return
+
+        (post_ids,) = params
+        self.database.repair_calls.append(list(post_ids))
+        for post_id in post_ids:
+            _, actual_count, is_settled = self.database.posts[post_id]
+            self.database.posts[post_id] = (actual_count, actual_count, is_settled)
+
+    def fetchall(self):
+        return self._rows
+
+
+class TestLikeCountReconciler:
+    def test_repairs_only_settled_drift(self):
+        # given
+        database = FakeLikeDatabase(
+            {
+                1: (3, 3, True),  # 일치
+                2: (5, 4, True),  # flush 후 좋아요 행이 롤백된 경우
+                3: (0, 2, True),  # 버퍼와 함께 사라진 증가분
+                4: (1, 2, False),  # 최근 갱신되어 flush 진행 중일 수 있음
+            }
+        )
+        reconciler = LikeCountReconciler(database, chunk_size=10)
+
+        # when
+        result = reconciler.reconcile()
+
+        # then
+        assert database.repair_calls == [[2, 3]]
+        assert database.posts[2][0] == 4
+        assert database.posts[3][0] == 2
+        assert database.posts[4][0] == 1
+        assert result.scanned == 4
+        assert result.drifted == 2
+        assert result.repaired == 2
+        assert result.skipped_unsettled == 1
+        assert result.completed is True
+
+    def test_runs_in_chunks_and_is_idempotent(self):
+        # given
+        database = FakeLikeDatabase({post_id: (0, 1, True) for post_id in range(1, 8)})
+        reconciler = LikeCountReconciler(database, chunk_size=3)
+
+        # when
+        first = reconciler.reconcile()
+        second = reconciler.reconcile()
+
+        # then
+        assert database.repair_calls == [[1, 2, 3], [4, 5, 6], [7]]
+        assert database.commits == 3
+        assert first.repaired == 7
+        assert first.last_post_id == 7
+        assert second.repaired == 0
+        assert second.completed is True
+
+    def test_stops_before_time_runs_out(self):
+        # given
+        database = FakeLikeDatabase({post_id: (0, 1, True) for post_id in range(1, 8)})
+        reconciler = LikeCountReconciler(database, chunk_size=3)
+
+        # when
+        result = reconciler.reconcile(get_remaining_time_ms=lambda: 1_000)
+
+        # then
+        assert result.scanned == 3
+        assert result.last_post_id == 3
+        assert result.completed is False
+
+
+class TestDbAddressFromEnv:
+    def test_accepts_rds_endpoint_with_port(self, monkeypatch):
+        # given
+        monkeypatch.setenv("DB_HOST", "db.example.com:3306")
+        monkeypatch.setenv("DB_PORT", "3307")
+
+        # when & then
+        assert db_address_from_env() == ("db.example.com", 3306)
+
+    def test_defaults_port(self, monkeypatch):
+        # given
+        monkeypatch.setenv("DB_HOST", "db.example.com")
+        monkeypatch.delenv("DB_PORT", raising=False)
+
+        # when & then
+        assert db_address_from_env() == ("db.example.com", 3306)
+
+
+class FakeCheckpointStore:
+    def __init__(self, last_post_id=None):
+        self.last_post_id = last_post_id
+        self.saved: list[int] = []
+        self.cleared = False
+
+    def load(self):
+        return self.last_post_id
+
+    def save(self, last_post_id: int):
+        self.last_post_id = last_post_id
+        self.saved.append(last_post_id)
+
+    def clear(self):
+        self.last_post_id = None
+        self.cleared = True
+
+
+class TestReconcileCheckpoint:
+    def test_saves_cursor_when_stopped_and_resumes_from_it(self):
+        # given
+        database = FakeLikeDatabase({post_id: (0, 1, True) for post_id in range(1, 8)})
+        checkpoint_store = FakeCheckpointStore()
+        reconciler = LikeCountReconciler(database, chunk_size=3, checkpoint_store=checkpoint_store)
+
+        # when
+        first = reconciler.reconcile(get_remaining_time_ms=lambda: 1_000)
+        second = reconciler.reconcile()
+
+        # then
+        assert first.completed is False
+        assert checkpoint_store.saved == [3, 6]
+        assert second.resumed is True
+        assert database.repair_calls == [[1, 2, 3], [4, 5, 6], [7]]
+        assert second.completed is True
+        assert checkpoint_store.cleared is True
+        assert checkpoint_store.last_post_id is None
+
+    def test_starts_from_beginning_without_checkpoint(self):
+        # given
+        database = FakeLikeDatabase({1: (0, 1, True)})
+        checkpoint_store = FakeCheckpointStore()
+        reconciler = LikeCountReconciler(database, chunk_size=3, checkpoint_store=checkpoint_store)
+
+        # when
+        result = reconciler.reconcile()
+
+        # then
+        assert result.resumed is False
+        assert result.repaired == 1
+        assert checkpoint_store.cleared is True
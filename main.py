@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -5,11 +8,7 @@ from mangum import Mangum
 from pydantic import ValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from app.api.auth.v1.auth_router import auth_router
-from app.api.challenge.v1.challenge_router import challenge_router
-from app.api.media.v1.media_router import media_router
-from app.api.post.v1.post_router import post_router
-from app.api.user.v1.user_router import user_router
+from app.common.enums import StartupMode
 from app.common.exception_handlers import (
     custom_exception_handler,
     general_exception_handler,
@@ -19,11 +18,47 @@ from app.common.exception_handlers import (
     validation_exception_handler,
     value_error_exception_handler,
 )
+from app.common.http_client import shared_http_client
+from app.common.lazy_router import LazyRouter, LazyRouterLoader, LazyRouterMiddleware
 from app.module.auth.error import AuthException
 from app.module.challenge.errors import ChallengeError
+from app.module.outbox.enums import OutboxConsumerMode
+from app.module.post.enums import LikeCountMode
 from app.module.user.error import UserException
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 컨테이너처럼 오래 떠 있는 프로세스에서만 동작 (Lambda는 요청 커밋 후 예약되는 flush에 의존)
+    flush_task = None
+    if LikeCountMode.from_env() == LikeCountMode.WRITE_BEHIND:
+        from app.module.post.like_buffer import like_count_buffer
+
+        flush_task = asyncio.create_task(like_count_buffer.run_periodic_flush())
+
+    # Lambda에서는 lifespan이 꺼져 있으므로 outbox는 스케줄 함수가 비운다
+    outbox_task = None
+    if OutboxConsumerMode.from_env() == OutboxConsumerMode.INLINE:
+        from app.module.outbox.worker import outbox_worker
+
+        outbox_task = asyncio.create_task(outbox_worker.run_forever())
+
+    yield
+
+    if outbox_task is not None:
+        outbox_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await outbox_task
+
+    if flush_task is not None:
+        flush_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await flush_task
+        await like_count_buffer.flush()
+    await shared_http_client.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -43,11 +78,20 @@ app.add_exception_handler(ValidationError, pydantic_validation_exception_handler
 app.add_exception_handler(ValueError, value_error_exception_handler)  # type: ignore[arg-type]
 app.add_exception_handler(Exception, general_exception_handler)
 
-app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
-app.include_router(user_router, prefix="/api/user", tags=["user"])
-app.include_router(media_router, prefix="/api/media", tags=["media"])
-app.include_router(post_router, prefix="/api/post", tags=["post"])
-app.include_router(challenge_router, prefix="/api/challenge", tags=["challenge"])
+routers = [
+    LazyRouter("/api/auth", "app.api.auth.v1.auth_router", "auth_router", ("auth",)),
+    LazyRouter("/api/user", "app.api.user.v1.user_router", "user_router", ("user",)),
+    LazyRouter("/api/media", "app.api.media.v1.media_router", "media_router", ("media",)),
+    LazyRouter("/api/post", "app.api.post.v1.post_router", "post_router", ("post",)),
+    LazyRouter("/api/challenge", "app.api.challenge.v1.challenge_router", "challenge_router", ("challenge",)),
+]
+router_loader = LazyRouterLoader(app, routers)
+
+if StartupMode.from_env() == StartupMode.LAZY:
+    docs_paths = tuple(path for path in (app.openapi_url, app.docs_url, app.redoc_url) if path)
+    app.add_middleware(LazyRouterMiddleware, loader=router_loader, docs_paths=docs_paths)
+else:
+    router_loader.load_all()
 
 
 @app.get("/health")
@@ -55,4 +99,5 @@ def health():
     return {"status": "ok"}
 
 
-handler = Mangum(app)
+# Mangum은 invocation마다 lifespan을 실행하므로, 켜 두면 매 요청 뒤 공유 HTTP 커넥션이 닫힌다
+handler = Mangum(app, lifespan="off")